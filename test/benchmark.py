@@ -9,6 +9,17 @@ try:
 
     from pydantic import BaseModel, validate_call
 
+    try:
+        from typing import TypeAliasType
+    except ImportError:
+        from typing_extensions import TypeAliasType
+
+    # A recursive type alias (`type JSON = ...` in python >= 3.12)
+    JSON = TypeAliasType(
+        "JSON",
+        "Union[dict[str, JSON], list[JSON], str, int, float, bool, None]",
+    )
+
     # Open the log file, clear it and redirect stdout to it
     log = open("benchmark.md", "w")
     sys.stdout.flush()  # Ensure the log file is cleared before writing
@@ -23,6 +34,14 @@ try:
     five_item_list = [1, 2.0, 3, 4.0, 5]
     big_item_list = [float(i) if i % 2 else i for i in range(1000)]
 
+    json_payload = {
+        "users": [
+            {"id": i, "name": f"user{i}", "tags": ["a", "b"], "score": i / 2}
+            for i in range(100)
+        ],
+        "meta": {"count": 100, "next": None, "valid": True},
+    }
+
     # --- Benchmark and Validation test cases
     test_cases = {
         "int": (42, "not an int"),
@@ -52,6 +71,10 @@ try:
             [big_key_dict] * 100,
             [{"k1": 1, "k2": "two", "k3": 3}],
         ),
+        "JSON (recursive alias)": (
+            json_payload,
+            {"users": [{"id": 1, "name": b"bytes"}]},
+        ),
     }
 
     # --- Typing definitions
@@ -65,6 +88,7 @@ try:
         "list[Union[int,float]] (1000 items)": List[Union[int, float]],
         "list[dict[str,int]] (5 items)": List[Dict[str, int]],
         "list[dict[str,int]] (100 items)": List[Dict[str, int]],
+        "JSON (recursive alias)": JSON,
     }
 
     # --- Timing helper
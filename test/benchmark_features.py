@@ -0,0 +1,714 @@
+try:
+    import time, sys
+    from dataclasses import dataclass, field
+    from statistics import mean
+
+    import type_enforced
+
+    # Open the log file, clear it and redirect stdout to it
+    log = open("benchmark_features.md", "w")
+    sys.stdout.flush()  # Ensure the log file is cleared before writing
+    sys.stdout = log
+
+    REPEATS = 100
+    CALLS = 1000
+
+    # --- Timing helper
+    def timeit(func, *args, calls=CALLS):
+        durations = []
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            for _ in range(calls):
+                func(*args)
+            durations.append((time.perf_counter() - start) / calls)
+        return mean(durations) * 1e6  # microseconds
+
+    def print_table(title, description, rows):
+        print(f"\n## {title}\n")
+        print(f"{description}\n")
+        print("| Case                                     | Time per call  |")
+        print("|:-----------------------------------------|:---------------|")
+        for name, avg_us in rows:
+            print(f"| {name:<40} | {avg_us:.2f} µs |")
+
+    # --- Dataclass construction
+    @dataclass
+    class PlainRecord:
+        id: int
+        name: str
+        score: float
+        tags: list[str] = field(default_factory=list)
+
+    @type_enforced.Enforcer
+    @dataclass
+    class FusedRecord:
+        id: int
+        name: str
+        score: float
+        tags: list[str] = field(default_factory=list)
+
+    @dataclass
+    class WrappedRecord:
+        id: int
+        name: str
+        score: float
+        tags: list[str] = field(default_factory=list)
+
+    # Wrapping the generated __init__ directly uses the generic FunctionMethodEnforcer
+    WrappedRecord.__init__ = type_enforced.Enforcer(WrappedRecord.__init__)
+
+    @type_enforced.Enforcer
+    @dataclass(frozen=True, slots=True)
+    class FusedFrozenSlotsRecord:
+        id: int
+        name: str
+        score: float
+        tags: list[str] = field(default_factory=list)
+
+    # --- Attribute assignment
+    class PlainSlots:
+        __slots__ = ("value",)
+
+    class TypedSlots:
+        __slots__ = ("_value",)
+        value = type_enforced.Typed[int]
+
+    class TypedDict:
+        value = type_enforced.Typed[int]
+
+    @type_enforced.Enforcer
+    class EnforcedProperty:
+        __slots__ = ("_value",)
+
+        @property
+        def value(self) -> int:
+            return self._value
+
+        @value.setter
+        def value(self, value: int) -> None:
+            self._value = value
+
+    def assign(obj):
+        obj.value = 1
+
+    # --- Sampled dict and set validation
+    def sampled_factory(annotation, sampler):
+        @type_enforced.Enforcer(iterable_sample_pct=1, sampler=sampler)
+        def fn(a: annotation):
+            return None
+
+        return fn
+
+    sampled_rows = []
+    for size in (1_000, 100_000):
+        sampled_data = [
+            ("dict[int, int]", dict[int, int], {i: i for i in range(size)}),
+            ("set[int]", set[int], set(range(size))),
+        ]
+        for name, annotation, data in sampled_data:
+            for sampler in ("random", "stride", "edge"):
+                sampled_rows.append(
+                    (
+                        f"{name} ({size:,} items, {sampler})",
+                        timeit(
+                            sampled_factory(annotation, sampler),
+                            data,
+                            calls=10,
+                        ),
+                    )
+                )
+
+    # --- Constant-k rotating sampling
+    @type_enforced.Enforcer(iterable_sample_pct=1)
+    def pct_list(a: list[int]):
+        return None
+
+    @type_enforced.Enforcer(iterable_sample_k=16)
+    def rotating_list(a: list[int]):
+        return None
+
+    @type_enforced.Enforcer(iterable_sample_k=16)
+    def rotating_dict(a: dict[int, int]):
+        return None
+
+    rotating_rows = []
+    for size in (1_000, 100_000):
+        list_data = list(range(size))
+        dict_data = {i: i for i in range(size)}
+        rotating_rows += [
+            (
+                f"list[int] ({size:,} items, 1%)",
+                timeit(pct_list, list_data, calls=10),
+            ),
+            (
+                f"list[int] ({size:,} items, k=16)",
+                timeit(rotating_list, list_data, calls=10),
+            ),
+            (
+                f"dict[int, int] ({size:,} items, k=16)",
+                timeit(rotating_dict, dict_data, calls=10),
+            ),
+        ]
+
+        # The timed calls of smaller dicts already sweep every cursor position
+        if size < REPEATS * 10 * 16:
+            continue
+
+        # Move the cursor of a new enforcer so the timed calls sample the middle of the dict
+        @type_enforced.Enforcer(iterable_sample_k=16)
+        def rotating_dict_middle(a: dict[int, int]):
+            return None
+
+        for _ in range((size // 2 - REPEATS * 10 * 16 // 2) // 16):
+            rotating_dict_middle(dict_data)
+        rotating_rows.append(
+            (
+                f"dict[int, int] ({size:,}, k=16, middle)",
+                timeit(rotating_dict_middle, dict_data, calls=10),
+            )
+        )
+
+    # --- Validation time budget
+    @type_enforced.Enforcer
+    def unbudgeted_fn(a: list[dict[str, int]]):
+        return None
+
+    @type_enforced.Enforcer(max_validation_us=200)
+    def budgeted_fn(a: list[dict[str, int]]):
+        return None
+
+    @type_enforced.Enforcer
+    def unbudgeted_nested_fn(a: list[list[int]]):
+        return None
+
+    @type_enforced.Enforcer(max_validation_us=200)
+    def budgeted_nested_fn(a: list[list[int]]):
+        return None
+
+    budget_rows = []
+    for size in (1_000, 100_000):
+        budget_data = [{"a": i, "b": i} for i in range(size)]
+        budget_rows += [
+            (
+                f"list[dict[str, int]] ({size:,} items)",
+                timeit(unbudgeted_fn, budget_data, calls=10),
+            ),
+            (
+                f"list[dict[str, int]] ({size:,}, 200µs)",
+                timeit(budgeted_fn, budget_data, calls=10),
+            ),
+        ]
+    nested_budget_data = [list(range(250)) for _ in range(2_000)]
+    budget_rows += [
+        (
+            "list[list[int]] (2,000 x 250 items)",
+            timeit(unbudgeted_nested_fn, nested_budget_data, calls=10),
+        ),
+        (
+            "list[list[int]] (2,000 x 250, 200µs)",
+            timeit(budgeted_nested_fn, nested_budget_data, calls=10),
+        ),
+    ]
+
+    # --- Adaptive overhead controller
+    def adaptive_factory(**kwargs):
+        @type_enforced.Enforcer(**kwargs)
+        def fn(a: list[dict[str, int]]) -> int:
+            return sum(item["a"] for item in a[:1000])
+
+        return fn
+
+    adaptive_data = [{"a": i, "b": i} for i in range(10_000)]
+    adaptive_fns = [
+        ("iterable_sample_pct=100", adaptive_factory()),
+        ("target_overhead=0.05", adaptive_factory(target_overhead=0.05)),
+        (
+            "target_overhead=0.05 (bounds 0.1-100)",
+            adaptive_factory(
+                target_overhead=0.05, sample_pct_bounds=(0.1, 100)
+            ),
+        ),
+    ]
+    adaptive_rows = [
+        (
+            "no enforcement",
+            timeit(adaptive_fns[0][1].__fn__, adaptive_data, calls=10),
+        )
+    ]
+    for name, fn in adaptive_fns:
+        # Let the controller settle before timing
+        for _ in range(256):
+            fn(adaptive_data)
+        adaptive_rows.append((name, timeit(fn, adaptive_data, calls=10)))
+
+    # --- Call sampling
+    def call_sampling_factory(**kwargs):
+        @type_enforced.Enforcer(**kwargs)
+        def fn(a: list[int], b: dict[str, int]) -> int:
+            return len(a)
+
+        return fn
+
+    call_sampling_args = (list(range(100)), {str(i): i for i in range(100)})
+    call_sampling_rows = [
+        (
+            "no enforcement",
+            timeit(call_sampling_factory().__fn__, *call_sampling_args),
+        )
+    ]
+    for name, kwargs in [
+        ("call_sample_rate=1", {}),
+        ("call_sample_rate=0.01", {"call_sample_rate": 0.01}),
+        (
+            "call_sample_rate=0.01, backoff_after=10",
+            {"call_sample_rate": 0.01, "backoff_after": 10},
+        ),
+    ]:
+        call_sampling_rows.append(
+            (
+                name,
+                timeit(call_sampling_factory(**kwargs), *call_sampling_args),
+            )
+        )
+
+    # --- Shadow mode
+    @type_enforced.Enforcer
+    def inline_fn(a: list[dict[str, int]]):
+        return None
+
+    @type_enforced.Enforcer(shadow=True)
+    def shadow_fn(a: list[dict[str, int]]):
+        return None
+
+    @type_enforced.Enforcer(shadow=True, shadow_snapshot=True)
+    def shadow_snapshot_fn(a: list[dict[str, int]]):
+        return None
+
+    shadow_data = [{"a": i, "b": i} for i in range(10_000)]
+    shadow_rows = [
+        ("inline validation", timeit(inline_fn, shadow_data, calls=10)),
+        ("shadow=True", timeit(shadow_fn, shadow_data, calls=10)),
+        (
+            "shadow=True, shadow_snapshot=True",
+            timeit(shadow_snapshot_fn, shadow_data, calls=10),
+        ),
+    ]
+
+    # --- Suppressed inner loops
+    @type_enforced.Enforcer
+    def scale(x: float, factor: float) -> float:
+        return x * factor
+
+    def plain_loop(values):
+        return [scale.__fn__(value, 2.0) for value in values]
+
+    def enforced_loop(values):
+        return [scale(value, 2.0) for value in values]
+
+    def suppressed_loop(values):
+        with type_enforced.suppressed():
+            return [scale(value, 2.0) for value in values]
+
+    loop_data = [float(i) for i in range(100)]
+    suppressed_rows = [
+        ("no enforcement", timeit(plain_loop, loop_data, calls=100)),
+        ("enforced", timeit(enforced_loop, loop_data, calls=100)),
+        (
+            "enforced in type_enforced.suppressed()",
+            timeit(suppressed_loop, loop_data, calls=100),
+        ),
+    ]
+
+    # --- Subclass and ABC validation
+    from numbers import Number
+
+    @type_enforced.Enforcer
+    def exact_items(a: list[float]) -> None:
+        return None
+
+    @type_enforced.Enforcer
+    def subclass_items(a: list[int]) -> None:
+        return None
+
+    @type_enforced.Enforcer
+    def abc_items(a: list[Number]) -> None:
+        return None
+
+    @type_enforced.Enforcer
+    def abc_values(a: dict[str, Number | list[int]]) -> None:
+        return None
+
+    float_data = [float(i) for i in range(1000)]
+    abc_rows = [
+        (
+            "list[float] (float items)",
+            timeit(exact_items, float_data, calls=100),
+        ),
+        (
+            "list[int] (bool items)",
+            timeit(subclass_items, [True, False] * 500, calls=100),
+        ),
+        (
+            "list[Number] (float items)",
+            timeit(abc_items, float_data, calls=100),
+        ),
+        (
+            "dict[str, Union[Number, list[int]]]",
+            timeit(
+                abc_values, {str(i): float(i) for i in range(1000)}, calls=100
+            ),
+        ),
+    ]
+
+    # --- Union dispatch
+    import typing
+    from functools import reduce
+    from operator import or_
+
+    record_types = [
+        typing.TypedDict(f"Record{i}", {"id": int, f"field_{i}": str})
+        for i in range(16)
+    ]
+
+    @type_enforced.Enforcer
+    def union_records(a: list[reduce(or_, record_types)]) -> None:
+        return None
+
+    @type_enforced.Enforcer
+    def union_rows(
+        a: list[tuple[int, str] | tuple[str, int] | tuple[int]],
+    ) -> None:
+        return None
+
+    union_rows_data = [(i, "a") if i % 2 else ("a", i) for i in range(1000)]
+    union_records_data = [
+        {"id": i, f"field_{i % 16}": "a"} for i in range(1000)
+    ]
+    union_dispatch_rows = [
+        (
+            "list[tuple union (3 shapes)]",
+            timeit(union_rows, union_rows_data, calls=10),
+        ),
+        (
+            "list[TypedDict union (16 types)]",
+            timeit(union_records, union_records_data, calls=10),
+        ),
+    ]
+
+    # --- Class object checks
+    class Plugin:
+        pass
+
+    class CsvPlugin(Plugin):
+        pass
+
+    @type_enforced.Enforcer
+    def register_plugin(plugin: type[Plugin], name: str) -> None:
+        return None
+
+    class_rows = [
+        ("no enforcement", timeit(register_plugin.__fn__, CsvPlugin, "csv")),
+        ("type[Plugin] (exact class)", timeit(register_plugin, Plugin, "csv")),
+        ("type[Plugin] (subclass)", timeit(register_plugin, CsvPlugin, "csv")),
+    ]
+
+    # --- Protocols and TypeVars
+    from typing import AnyStr, Protocol, runtime_checkable
+
+    @runtime_checkable
+    class Closeable(Protocol):
+        def close(self) -> None: ...
+
+        def flush(self) -> None: ...
+
+    class Resource:
+        def close(self) -> None:
+            pass
+
+        def flush(self) -> None:
+            pass
+
+    @type_enforced.Enforcer
+    def protocol_items(a: list[Closeable]) -> None:
+        return None
+
+    @type_enforced.Enforcer(bind_typevars=True)
+    def concat(a: AnyStr, b: AnyStr) -> AnyStr:
+        return a + b
+
+    resources = [Resource() for _ in range(100)]
+
+    protocol_rows = [
+        (
+            "isinstance loop (Closeable)",
+            timeit(
+                lambda a: all(isinstance(i, Closeable) for i in a),
+                resources,
+                calls=100,
+            ),
+        ),
+        (
+            "list[Closeable] (100 items)",
+            timeit(protocol_items, resources, calls=100),
+        ),
+        ("AnyStr no enforcement", timeit(concat.__fn__, "a", "b")),
+        ("AnyStr (bind_typevars)", timeit(concat, "a", "b")),
+    ]
+
+    # --- Recursive type aliases
+    from typing import Union
+
+    try:
+        from typing import TypeAliasType
+    except ImportError:
+        from typing_extensions import TypeAliasType
+
+    JSON = TypeAliasType(
+        "JSON",
+        "Union[dict[str, JSON], list[JSON], str, int, float, bool, None]",
+    )
+
+    @type_enforced.Enforcer
+    def json_fn(a: JSON) -> None:
+        return None
+
+    json_payload = {
+        "users": [
+            {"id": i, "name": f"user{i}", "tags": ["a", "b"], "score": i / 2}
+            for i in range(100)
+        ],
+        "meta": {"count": 100, "next": None, "valid": True},
+    }
+
+    alias_rows = [
+        ("no enforcement", timeit(json_fn.__fn__, json_payload, calls=10)),
+        ("JSON (100 records)", timeit(json_fn, json_payload, calls=10)),
+    ]
+
+    # --- Annotated constraints
+    from typing import Annotated
+    from type_enforced.utils import Constraint
+
+    @type_enforced.Enforcer
+    def union_constrained(a: list[float | Constraint(ge=0)]) -> None:
+        return None
+
+    @type_enforced.Enforcer
+    def annotated_constrained(
+        a: list[Annotated[float, Constraint(ge=0)]],
+    ) -> None:
+        return None
+
+    prices = [float(i) for i in range(1000)]
+
+    annotated_rows = [
+        (
+            "no enforcement",
+            timeit(annotated_constrained.__fn__, prices, calls=10),
+        ),
+        (
+            "float or Constraint (union)",
+            timeit(union_constrained, prices, calls=10),
+        ),
+        (
+            "Annotated[float, Constraint]",
+            timeit(annotated_constrained, prices, calls=10),
+        ),
+    ]
+
+    # --- Per parameter policies
+    @type_enforced.Enforcer
+    def uniform_fn(config: dict[str, int], rows: list[dict[str, int]]) -> None:
+        return None
+
+    @type_enforced.Enforcer(param_policies={"rows": type_enforced.Sample(1)})
+    def policy_fn(config: dict[str, int], rows: list[dict[str, int]]) -> None:
+        return None
+
+    policy_config = {f"key{i}": i for i in range(10)}
+    policy_rows = [{"a": i, "b": i} for i in range(1000)]
+
+    policy_rows_table = [
+        (
+            "no enforcement",
+            timeit(uniform_fn.__fn__, policy_config, policy_rows, calls=10),
+        ),
+        (
+            "full validation",
+            timeit(uniform_fn, policy_config, policy_rows, calls=10),
+        ),
+        (
+            "rows: Sample(1)",
+            timeit(policy_fn, policy_config, policy_rows, calls=10),
+        ),
+    ]
+
+    # --- Depth limited validation
+    def depth_factory(max_depth):
+        @type_enforced.Enforcer(max_depth=max_depth)
+        def f(a: dict[str, list[dict[str, list[int]]]]) -> None:
+            return None
+
+        return f
+
+    nested_payload = {
+        f"key{i}": [{f"sub{j}": list(range(10)) for j in range(10)}] * 5
+        for i in range(10)
+    }
+
+    depth_rows = [
+        (
+            "no enforcement",
+            timeit(depth_factory(None).__fn__, nested_payload, calls=10),
+        ),
+    ] + [
+        (
+            f"max_depth={max_depth}",
+            timeit(depth_factory(max_depth), nested_payload, calls=10),
+        )
+        for max_depth in (None, 3, 2, 1, 0)
+    ]
+
+    print(f"# Feature Benchmark Results (python {sys.version.split(' ')[0]})\n")
+    print(
+        "This file contains the results of the benchmark tests for specific type_enforced features.\n"
+    )
+    print("Generated by /test/benchmark_features.py\n")
+    print(
+        f"- Each case is called {CALLS} times and the average time per call is measured over {REPEATS} runs."
+    )
+
+    print_table(
+        "Dataclass Construction",
+        "Construction cost of a dataclass with four fields (`id: int`, `name: str`, `score: float`, `tags: list[str]` with a `default_factory`).",
+        [
+            (
+                "dataclass (no enforcement)",
+                timeit(PlainRecord, 1, "a", 1.0),
+            ),
+            (
+                "Enforcer on __init__ (generic wrapper)",
+                timeit(WrappedRecord, 1, "a", 1.0, []),
+            ),
+            (
+                "Enforcer on dataclass (fused __init__)",
+                timeit(FusedRecord, 1, "a", 1.0),
+            ),
+            (
+                "Enforcer on frozen slots dataclass",
+                timeit(FusedFrozenSlotsRecord, 1, "a", 1.0),
+            ),
+        ],
+    )
+
+    print_table(
+        "Attribute Assignment",
+        "Cost of a single `obj.value = 1` assignment where `value` is declared as an `int`.",
+        [
+            ("plain slot (no enforcement)", timeit(assign, PlainSlots())),
+            ("Typed[int] (slot storage)", timeit(assign, TypedSlots())),
+            ("Typed[int] (__dict__ storage)", timeit(assign, TypedDict())),
+            ("Enforcer on property setter", timeit(assign, EnforcedProperty())),
+        ],
+    )
+
+    print_table(
+        "Sampled Dict and Set Validation",
+        "Validation cost of a dict or set with `iterable_sample_pct=1` for each sampling strategy (averaged over 10 calls per run).",
+        sampled_rows,
+    )
+
+    print_table(
+        "Constant-k Rotating Sampling",
+        "Validation cost with `iterable_sample_k=16` compared to `iterable_sample_pct=1` (averaged over 10 calls per run). The `middle` rows sample with the cursor around the middle of the dict (the slowest position).",
+        rotating_rows,
+    )
+
+    print_table(
+        "Validation Time Budget",
+        "Validation cost with and without `max_validation_us=200` (averaged over 10 calls per run).",
+        budget_rows,
+    )
+
+    print_table(
+        "Adaptive Overhead Controller",
+        "Call cost of a function that sums 1,000 of the 10,000 `dict[str, int]` items it is passed (averaged over 10 calls per run).",
+        adaptive_rows,
+    )
+
+    print_table(
+        "Call Sampling",
+        "Call cost of a function with `list[int]` and `dict[str, int]` inputs (100 items each).",
+        call_sampling_rows,
+    )
+
+    print_table(
+        "Shadow Mode",
+        "Caller side cost of a call with a `list[dict[str, int]]` input of 10,000 items (averaged over 10 calls per run). Shadowed validations that do not fit in the worker queue are dropped.",
+        shadow_rows,
+    )
+
+    print_table(
+        "Suppressed Inner Loops",
+        "Cost of a loop that calls an enforced `(x: float, factor: float) -> float` helper 100 times (averaged over 100 calls per run).",
+        suppressed_rows,
+    )
+
+    print_table(
+        "Subclass and ABC Validation",
+        "Validation cost of 1,000 items whose types are subclasses of (or registered with) the annotated type (averaged over 100 calls per run).",
+        abc_rows,
+    )
+
+    print_table(
+        "Union Dispatch",
+        "Validation cost of 1,000 records whose annotation is a union of tuple shapes or TypedDicts (averaged over 10 calls per run).",
+        union_dispatch_rows,
+    )
+
+    print_table(
+        "Class Object Checks",
+        "Call cost of a function that takes a plugin class and a name.",
+        class_rows,
+    )
+
+    print_table(
+        "Protocols and TypeVars",
+        "Structural checks of runtime checkable protocol items and bound TypeVar calls.",
+        protocol_rows,
+    )
+
+    print_table(
+        "Recursive Type Aliases",
+        "Validation of a nested JSON payload (100 records of 4 fields) against a recursive `JSON` alias.",
+        alias_rows,
+    )
+
+    print_table(
+        "Annotated Constraints",
+        "Validation of a list of 1000 floats with a `ge=0` constraint on each item.",
+        annotated_rows,
+    )
+
+    print_table(
+        "Per Parameter Policies",
+        "A function with a small `config: dict[str, int]` (always fully validated) and 1000 `rows: list[dict[str, int]]`.",
+        policy_rows_table,
+    )
+
+    print_table(
+        "Depth Limited Validation",
+        "Validation of a `dict[str, list[dict[str, list[int]]]]` payload with 10 keys, 5 dicts per list, 10 keys per dict and 10 ints per inner list.",
+        depth_rows,
+    )
+
+    sys.stdout = sys.__stdout__  # Reset stdout to original
+    log.close()  # Close the log file
+    print("benchmark_features.py passed")
+except Exception as e:
+    sys.stdout = sys.__stdout__
+    try:
+        log.close()
+    except:
+        pass
+    print(f"benchmark_features.py failed: {e}")
@@ -37,11 +37,11 @@ try:
 except:
     pass
 
+# Subclasses of the expected class pass
 try:
     y = Baz(Bar)
-    success = False
 except:
-    pass
+    success = False
 
 try:
     y = Baz(Bum)
@@ -0,0 +1,132 @@
+import type_enforced
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+class Pair(NamedTuple):
+    name: str
+    value: float
+
+
+@dataclass
+class Tree:
+    value: int
+    children: list["Tree"] = field(default_factory=list)
+
+
+@type_enforced.Enforcer(deep_records=True)
+def deep_points(a: list[Point]) -> None:
+    return None
+
+
+@type_enforced.Enforcer
+def shallow_points(a: list[Point]) -> None:
+    return None
+
+
+@type_enforced.Enforcer(deep_records=True)
+def deep_pairs(a: dict[str, Pair]) -> None:
+    return None
+
+
+@type_enforced.Enforcer(deep_records=True)
+def deep_tree(a: Tree) -> None:
+    return None
+
+
+# --- Test 1: Valid records pass in deep mode ---
+success_1 = True
+try:
+    deep_points(a=[Point(1, 2), Point(3, 4)])
+    deep_pairs(a={"a": Pair("a", 1.0)})
+    deep_tree(a=Tree(1, [Tree(2), Tree(3, [Tree(4)])]))
+except:
+    success_1 = False
+
+# --- Test 2: Invalid nested fields are caught in deep mode ---
+success_2 = False
+try:
+    deep_points(a=[Point(1, 2), Point(3, "4")])
+except TypeError as e:
+    if "a[1].y" in str(e):
+        success_2 = True
+
+# --- Test 3: Invalid nested fields are not checked by default ---
+success_3 = True
+try:
+    shallow_points(a=[Point(1, 2), Point(3, "4")])
+except TypeError:
+    success_3 = False
+
+# --- Test 4: NamedTuple fields are validated ---
+success_4 = False
+try:
+    deep_pairs(a={"a": Pair("a", "1.0")})
+except TypeError as e:
+    if "a['a'].value" in str(e):
+        success_4 = True
+
+# --- Test 5: Self referencing records are validated ---
+success_5 = False
+try:
+    deep_tree(a=Tree(1, [Tree(2), Tree(3, [Tree("4")])]))
+except TypeError:
+    success_5 = True
+
+# --- Test 6: The parsed fields are cached on the class ---
+success_6 = "__type_enforced_fields__" in Point.__dict__
+
+
+# --- Test 7: Records with unresolved forward references are parsed again once resolved ---
+@dataclass
+class Pending:
+    value: "Later"
+
+
+@type_enforced.Enforcer(deep_records=True)
+def deep_pending(a: Pending) -> None:
+    return None
+
+
+success_7 = True
+try:
+    try:
+        deep_pending(a=Pending(1))
+        success_7 = False
+    except NameError:
+        pass
+    assert "__type_enforced_fields__" not in Pending.__dict__
+
+    class Later:
+        pass
+
+    globals()["Later"] = Later
+    deep_pending(a=Pending(Later()))
+    try:
+        deep_pending(a=Pending(1))
+        success_7 = False
+    except TypeError as e:
+        assert "a.value" in str(e)
+except:
+    success_7 = False
+
+if all(
+    [
+        success_1,
+        success_2,
+        success_3,
+        success_4,
+        success_5,
+        success_6,
+        success_7,
+    ]
+):
+    print("test_class_16.py passed")
+else:
+    print("test_class_16.py failed")
@@ -0,0 +1,121 @@
+import type_enforced
+from dataclasses import dataclass, field
+
+
+@type_enforced.Enforcer
+@dataclass
+class Foo:
+    a: int
+    b: list[str] = field(default_factory=list)
+    c: "Bar | None" = None
+
+
+@type_enforced.Enforcer
+@dataclass(frozen=True, slots=True)
+class Frozen:
+    a: int
+    b: tuple[int, ...] = ()
+
+
+@type_enforced.Enforcer
+@dataclass
+class PostInit:
+    a: int
+    b: int = field(init=False)
+
+    def __post_init__(self):
+        self.b = self.a * 2
+
+
+@type_enforced.Enforcer
+@dataclass
+class Totals:
+    x: int
+    y: list[int]
+    total: int = field(init=False)
+
+    def __post_init__(self):
+        self.total = sum(self.y)
+        self.y = tuple(self.y)
+
+
+class Bar:
+    pass
+
+
+# --- Test 1: Valid dataclasses construct (including default_factory and forward refs) ---
+success_1 = True
+try:
+    Foo(1)
+    Foo(1, ["a"], Bar())
+    Frozen(1)
+    Frozen(a=1, b=(1, 2))
+    assert PostInit(1).b == 2
+except:
+    success_1 = False
+
+# --- Test 2: Invalid simple fields raise ---
+success_2 = False
+try:
+    Foo("1")
+except TypeError as e:
+    if "Foo.__init__" in str(e) and "`a`" in str(e):
+        success_2 = True
+
+# --- Test 3: Invalid container items raise ---
+success_3 = False
+try:
+    Foo(1, ["a", 2])
+except TypeError as e:
+    if "b[1]" in str(e):
+        success_3 = True
+
+# --- Test 4: Frozen slots dataclasses are validated ---
+success_4 = False
+try:
+    Frozen(1, (1, "2"))
+except TypeError:
+    success_4 = True
+
+# --- Test 5: Forward references are validated ---
+success_5 = False
+try:
+    Foo(1, [], "not a bar")
+except TypeError:
+    success_5 = True
+
+# --- Test 6: The generated __init__ is replaced by a fused __init__ ---
+success_6 = isinstance(
+    Foo.__dict__["__type_enforced_dataclass__"],
+    type_enforced.enforcer.DataclassEnforcer,
+) and not isinstance(
+    Foo.__dict__["__init__"], type_enforced.FunctionMethodEnforcer
+)
+
+# --- Test 7: Arguments are validated before __post_init__ runs ---
+success_7 = True
+try:
+    # `__post_init__` may change the field values after validation
+    assert Totals(1, [1, 2]).total == 3
+    try:
+        Totals(1, "abc")
+        success_7 = False
+    except TypeError as e:
+        assert "Totals.__init__" in str(e) and "`y`" in str(e)
+except:
+    success_7 = False
+
+if all(
+    [
+        success_1,
+        success_2,
+        success_3,
+        success_4,
+        success_5,
+        success_6,
+        success_7,
+    ]
+):
+    print("test_class_17.py passed")
+else:
+    print("test_class_17.py failed")
@@ -0,0 +1,100 @@
+import type_enforced
+from type_enforced.utils import GenericConstraint
+from dataclasses import dataclass, field, replace as dataclass_replace
+
+validations = []
+
+# A constraint that records every time the `rows` field is validated
+Counted = GenericConstraint(
+    {"counted": lambda x: validations.append(x) or True}
+)
+
+
+@type_enforced.Enforcer
+@dataclass(frozen=True)
+class Job:
+    rows: list[int] | Counted
+    status: str
+    retries: int = 0
+
+
+@type_enforced.Enforcer(validate_assignment=True)
+@dataclass
+class Mutable:
+    a: int
+    b: list[str] = field(default_factory=list)
+
+
+# --- Test 1: replace only validates changed fields ---
+success_1 = True
+try:
+    job = Job(rows=[1, 2, 3], status="pending")
+    assert len(validations) == 1
+    done = type_enforced.replace(job, status="done", retries=1)
+    assert done.status == "done" and done.retries == 1
+    assert done.rows is job.rows
+    assert len(validations) == 1
+except:
+    success_1 = False
+
+# --- Test 2: replace validates changed fields ---
+success_2 = False
+try:
+    type_enforced.replace(job, status=1)
+except TypeError as e:
+    if "status" in str(e):
+        success_2 = True
+
+# --- Test 3: dataclasses.replace still fully validates ---
+success_3 = False
+try:
+    dataclass_replace(job, retries="1")
+except TypeError:
+    success_3 = True
+
+# --- Test 4: Assignments are validated when validate_assignment is set ---
+success_4 = True
+try:
+    mutable = Mutable(1)
+    mutable.a = 2
+    mutable.b = ["a"]
+    mutable.other = "not a field"
+except:
+    success_4 = False
+
+success_5 = False
+try:
+    mutable.a = "3"
+except TypeError as e:
+    if "(Mutable.__setattr__)" in str(e) and "`a`" in str(e):
+        success_5 = True
+
+# --- Test 6: Construction is validated through assignments ---
+success_6 = False
+try:
+    Mutable(1, ["a", 2])
+except TypeError:
+    success_6 = True
+
+# --- Test 7: replace works with validate_assignment ---
+success_7 = True
+try:
+    copied = type_enforced.replace(Mutable(1, ["a"]), a=5)
+    assert copied.a == 5 and copied.b == ["a"]
+except:
+    success_7 = False
+
+if all(
+    [
+        success_1,
+        success_2,
+        success_3,
+        success_4,
+        success_5,
+        success_6,
+        success_7,
+    ]
+):
+    print("test_class_18.py passed")
+else:
+    print("test_class_18.py failed")
@@ -0,0 +1,132 @@
+import type_enforced
+from type_enforced import Typed
+
+
+class SlotPoint:
+    __slots__ = ("_x", "_y")
+    x = Typed[int]
+    y = Typed[int | float]
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class DictPoint:
+    tags = Typed(list[str])
+
+
+@type_enforced.Enforcer
+class Temperature:
+    def __init__(self, value: float) -> None:
+        self._value = value
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    @value.setter
+    def value(self, value: float) -> None:
+        self._value = value
+
+
+# --- Test 1: Valid assignments pass and values are stored ---
+success_1 = True
+try:
+    point = SlotPoint(1, 2.5)
+    point.x += 1
+    assert point.x == 2 and point.y == 2.5
+    assert not hasattr(point, "__dict__")
+    dict_point = DictPoint()
+    dict_point.tags = ["a"]
+    assert dict_point.tags == ["a"]
+except:
+    success_1 = False
+
+# --- Test 2: Invalid assignments raise ---
+success_2 = False
+try:
+    point.x = "3"
+except TypeError as e:
+    if "SlotPoint.x" in str(e):
+        success_2 = True
+
+success_3 = False
+try:
+    dict_point.tags = ["a", 1]
+except TypeError as e:
+    if "tags[1]" in str(e):
+        success_3 = True
+
+# --- Test 4: Unset attributes raise AttributeError ---
+success_4 = False
+try:
+    DictPoint().tags
+except AttributeError:
+    success_4 = True
+
+# --- Test 5: Property setters are enforced on wrapped classes ---
+success_5 = True
+try:
+    temperature = Temperature(1.0)
+    temperature.value = 2.0
+    assert temperature.value == 2.0
+except:
+    success_5 = False
+
+success_6 = False
+try:
+    temperature.value = "hot"
+except TypeError:
+    success_6 = True
+
+# --- Test 7: Property getters validate their return type ---
+success_7 = False
+try:
+    temperature._value = "hot"
+    temperature.value
+except TypeError:
+    success_7 = True
+
+# --- Test 8: Slotted classes without a slot for the value raise on creation ---
+success_8 = False
+try:
+
+    class MissingSlot:
+        __slots__ = ("_other",)
+        x = Typed[int]
+
+except (TypeError, RuntimeError) as e:
+    # Note: Errors in `__set_name__` are wrapped in a RuntimeError before python 3.12
+    error = e if isinstance(e, TypeError) else e.__cause__
+    if isinstance(error, TypeError) and "`_x`" in str(error):
+        success_8 = True
+
+success_9 = True
+try:
+    # Slots of a base class are used
+    class SubPoint(SlotPoint):
+        __slots__ = ()
+        x = Typed[float]
+
+    sub_point = SubPoint(1.0, 2)
+    assert sub_point.x == 1.0 and not hasattr(sub_point, "__dict__")
+except:
+    success_9 = False
+
+if all(
+    [
+        success_1,
+        success_2,
+        success_3,
+        success_4,
+        success_5,
+        success_6,
+        success_7,
+        success_8,
+        success_9,
+    ]
+):
+    print("test_class_19.py passed")
+else:
+    print("test_class_19.py failed")
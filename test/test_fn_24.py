@@ -0,0 +1,123 @@
+import sys
+import type_enforced
+from type_enforced.utils import Constraint
+from typing import Literal
+
+# --- Test 1: check passes valid values ---
+success_1 = True
+try:
+    type_enforced.check(1, int)
+    type_enforced.check([1, 2, 3], list[int])
+    type_enforced.check({"a": 1.0}, dict[str, int | float])
+    type_enforced.check(None, int | None)
+    type_enforced.check((1, "a"), tuple[int, str])
+except:
+    success_1 = False
+
+# --- Test 2: check raises on invalid values ---
+success_2 = False
+try:
+    type_enforced.check([1, "2", 3], list[int])
+except TypeError as e:
+    if "value[1]" in str(e):
+        success_2 = True
+
+# --- Test 3: check uses the passed key in error messages ---
+success_3 = False
+try:
+    type_enforced.check({"a": "b"}, dict[str, int], key="payload")
+except TypeError as e:
+    if "payload['a']" in str(e):
+        success_3 = True
+
+# --- Test 4: is_valid returns booleans without raising ---
+success_4 = all(
+    [
+        type_enforced.is_valid([1, 2, 3], list[int]) is True,
+        type_enforced.is_valid([1, "2", 3], list[int]) is False,
+        type_enforced.is_valid({"a": [1]}, dict[str, list[int]]) is True,
+        type_enforced.is_valid({"a": ["b"]}, dict[str, list[int]]) is False,
+        type_enforced.is_valid((1, 2), tuple[int, str]) is False,
+        type_enforced.is_valid((1,), tuple[int, str]) is False,
+        type_enforced.is_valid("a", Literal["a", "b"]) is True,
+        type_enforced.is_valid("c", Literal["a", "b"]) is False,
+    ]
+)
+
+# --- Test 5: Constraints are validated ---
+success_5 = all(
+    [
+        type_enforced.is_valid(1, int | Constraint(ge=0)) is True,
+        type_enforced.is_valid(-1, int | Constraint(ge=0)) is False,
+    ]
+)
+
+# --- Test 6: Unsupported type hints still raise ---
+success_6 = False
+try:
+    type_enforced.is_valid(1, "not a type")
+except TypeError:
+    success_6 = True
+
+# --- Test 7: Caught failures do not replace sys.excepthook ---
+success_7 = True
+try:
+    excepthook = sys.excepthook
+    for _ in range(100):
+        try:
+            type_enforced.check("a", int)
+        except TypeError:
+            pass
+    assert sys.excepthook is excepthook
+except:
+    success_7 = False
+
+# --- Test 8: Caught failures of enforced functions do not chain hooks ---
+success_8 = True
+try:
+
+    @type_enforced.Enforcer
+    def my_fn(a: int) -> None:
+        pass
+
+    excepthook = sys.excepthook
+    for _ in range(100):
+        try:
+            my_fn("a")
+        except TypeError:
+            pass
+    assert sys.excepthook.__type_enforced_original__ is excepthook
+    sys.excepthook = excepthook
+except:
+    success_8 = False
+
+# --- Test 9: The cache of parsed annotations is bounded ---
+success_9 = True
+try:
+    from type_enforced import enforcer
+
+    for i in range(1000):
+        type_enforced.check(i, Literal[i] | list[int])
+        assert type_enforced.is_valid([i], Literal[i] | list[int])
+        assert not type_enforced.is_valid(i + 1, Literal[i] | list[int])
+    cache_size = enforcer._checkable_type_cache_size
+    assert len(enforcer._checkable_type_cache) <= cache_size
+except:
+    success_9 = False
+
+if all(
+    [
+        success_1,
+        success_2,
+        success_3,
+        success_4,
+        success_5,
+        success_6,
+        success_7,
+        success_8,
+        success_9,
+    ]
+):
+    print("test_fn_24.py passed")
+else:
+    print("test_fn_24.py failed")
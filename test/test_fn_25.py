@@ -0,0 +1,70 @@
+import type_enforced
+
+
+@type_enforced.Enforcer
+def tuple_rows(rows: list[tuple[int, str, float]]) -> None:
+    return None
+
+
+@type_enforced.Enforcer
+def dict_rows(rows: list[dict[str, int | str]]) -> None:
+    return None
+
+
+@type_enforced.Enforcer
+def nested_rows(rows: set[tuple[int, ...]]) -> None:
+    return None
+
+
+# --- Test 1: Valid record batches pass ---
+success_1 = True
+try:
+    tuple_rows(rows=[(i, "a", 1.0) for i in range(100)])
+    tuple_rows(rows=[])
+    dict_rows(rows=[{"a": 1, "b": "c"} for _ in range(100)])
+    nested_rows(rows={(1, 2), (3,)})
+except:
+    success_1 = False
+
+# --- Test 2: A bad column value is caught and reported by row ---
+success_2 = False
+try:
+    tuple_rows(rows=[(i, "a", 1.0) for i in range(10)] + [(1, 2, 1.0)])
+except TypeError as e:
+    if "rows[10][1]" in str(e):
+        success_2 = True
+
+# --- Test 3: A row with the wrong length is caught ---
+success_3 = False
+try:
+    tuple_rows(rows=[(1, "a", 1.0), (1, "a")])
+except TypeError as e:
+    if "length mismatch" in str(e):
+        success_3 = True
+
+# --- Test 4: A bad dict value is caught ---
+success_4 = False
+try:
+    dict_rows(rows=[{"a": 1}, {"a": 1.0}])
+except TypeError as e:
+    if "rows[1]['a']" in str(e):
+        success_4 = True
+
+# --- Test 5: Subclasses still pass through the row by row fallback ---
+success_5 = True
+try:
+    tuple_rows(rows=[(True, "a", 1.0)])
+except:
+    success_5 = False
+
+# --- Test 6: A bad nested item in a set of tuples is caught ---
+success_6 = False
+try:
+    nested_rows(rows={(1, 2), (3, "4")})
+except TypeError:
+    success_6 = True
+
+if all([success_1, success_2, success_3, success_4, success_5, success_6]):
+    print("test_fn_25.py passed")
+else:
+    print("test_fn_25.py failed")
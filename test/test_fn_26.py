@@ -0,0 +1,136 @@
+import type_enforced
+from typing import TypedDict, NotRequired, Required
+
+
+class Point(TypedDict):
+    x: int
+    y: int
+    label: NotRequired[str]
+
+
+class Partial(TypedDict, total=False):
+    name: Required[str]
+    age: int
+
+
+class Node(TypedDict):
+    value: int
+    children: list["Node"]
+
+
+@type_enforced.Enforcer
+def point_fn(a: Point) -> None:
+    return None
+
+
+@type_enforced.Enforcer
+def points_fn(a: list[Point]) -> None:
+    return None
+
+
+@type_enforced.Enforcer
+def either_fn(a: Point | Partial | None) -> None:
+    return None
+
+
+@type_enforced.Enforcer
+def node_fn(a: Node) -> None:
+    return None
+
+
+# --- Test 1: Valid TypedDicts pass (including optional keys) ---
+success_1 = True
+try:
+    point_fn(a={"x": 1, "y": 2})
+    point_fn(a={"x": 1, "y": 2, "label": "origin"})
+    points_fn(a=[{"x": 1, "y": 2}, {"x": 3, "y": 4, "label": "b"}])
+    either_fn(a={"name": "a"})
+    either_fn(a=None)
+    node_fn(a={"value": 1, "children": [{"value": 2, "children": []}]})
+except:
+    success_1 = False
+
+# --- Test 2: Missing required keys are caught ---
+success_2 = False
+try:
+    point_fn(a={"x": 1})
+except TypeError as e:
+    if "Missing required key" in str(e):
+        success_2 = True
+
+# --- Test 3: Unexpected keys are caught ---
+success_3 = False
+try:
+    point_fn(a={"x": 1, "y": 2, "z": 3})
+except TypeError as e:
+    if "Unexpected key" in str(e):
+        success_3 = True
+
+# --- Test 4: Field value types are validated (including nested in lists) ---
+success_4 = False
+try:
+    points_fn(a=[{"x": 1, "y": 2}, {"x": 1, "y": "2"}])
+except TypeError as e:
+    if "a[1]['y']" in str(e):
+        success_4 = True
+
+# --- Test 5: Unions of TypedDicts match any of the alternatives ---
+success_5 = False
+try:
+    either_fn(a={"age": 1})
+except TypeError as e:
+    success_5 = True
+
+# --- Test 6: Self referencing TypedDicts are validated ---
+success_6 = False
+try:
+    node_fn(a={"value": 1, "children": [{"value": "2", "children": []}]})
+except TypeError:
+    success_6 = True
+
+# --- Test 7: Non dict values are rejected ---
+success_7 = False
+try:
+    point_fn(a=[1, 2])
+except TypeError:
+    success_7 = True
+
+# --- Test 8: Unions with a generic dict match either alternative ---
+success_8 = all(
+    [
+        type_enforced.is_valid({"a": 1}, dict[str, int] | Point),
+        type_enforced.is_valid({"a": 1}, Point | dict[str, int]),
+        type_enforced.is_valid(
+            {"x": 1, "y": 2, "label": "a"}, dict[str, int] | Point
+        ),
+        type_enforced.is_valid(
+            {"x": 1, "y": 2, "label": "a"}, Point | dict[str, int]
+        ),
+        type_enforced.is_valid({"a": "b"}, dict | Point),
+        type_enforced.is_valid({"a": "b"}, Point | dict),
+        type_enforced.is_valid(
+            [{"a": 1}, {"x": 1, "y": 2}], list[dict[str, int] | Point]
+        ),
+        not type_enforced.is_valid({"a": "b"}, dict[str, int] | Point),
+        not type_enforced.is_valid({"a": "b"}, Point | dict[str, int]),
+        not type_enforced.is_valid(
+            {"x": 1, "y": "2"}, dict[str, str] | Point | Partial
+        ),
+    ]
+)
+
+if all(
+    [
+        success_1,
+        success_2,
+        success_3,
+        success_4,
+        success_5,
+        success_6,
+        success_7,
+        success_8,
+    ]
+):
+    print("test_fn_26.py passed")
+else:
+    print("test_fn_26.py failed")
@@ -0,0 +1,129 @@
+import type_enforced
+from type_enforced.sampling import (
+    Sampler,
+    RandomSampler,
+    StrideSampler,
+    EdgeSampler,
+)
+
+
+@type_enforced.Enforcer(iterable_sample_pct=10, sampler=RandomSampler(seed=0))
+def seeded_list(a: list[int]) -> None:
+    return None
+
+
+@type_enforced.Enforcer(iterable_sample_pct=10, sampler="stride")
+def stride_dict(a: dict[str, int]) -> None:
+    return None
+
+
+@type_enforced.Enforcer(iterable_sample_pct=1, sampler="edge")
+def edge_set(a: set[int]) -> None:
+    return None
+
+
+# --- Test 1: Seeded random samplers pick the same items ---
+success_1 = True
+try:
+    first = RandomSampler(seed=42).__get_indices__(1000, 5)
+    second = RandomSampler(seed=42).__get_indices__(1000, 5)
+    assert list(first) == list(second)
+    assert first[0] == 0 and first[-1] == 999 and len(first) == 50
+    keys = RandomSampler(seed=1).__get_keys__({i: i for i in range(100)}, 10)
+    assert keys == RandomSampler(seed=1).__get_keys__(
+        {i: i for i in range(100)}, 10
+    )
+    assert keys[0] == 0 and len(set(keys)) == 10
+except:
+    success_1 = False
+
+# --- Test 2: Stride samplers pick evenly spaced items ---
+success_2 = True
+try:
+    assert StrideSampler().__get_indices__(101, 5) == [0, 25, 50, 75, 100]
+    assert StrideSampler().__get_keys__(set(range(5)), 100) == set(range(5))
+    assert StrideSampler().__get_keys__({str(i): i for i in range(10)}, 20) == [
+        "0",
+        "5",
+    ]
+except:
+    success_2 = False
+
+# --- Test 3: Edge samplers only pick items from the start and the end ---
+success_3 = True
+try:
+    assert EdgeSampler().__get_indices__(100, 4) == [0, 1, 98, 99]
+    assert EdgeSampler().__get_keys__({i: i for i in range(1000)}, 0.4) == [
+        0,
+        1,
+        999,
+        998,
+    ]
+    assert len(EdgeSampler().__get_keys__(set(range(1000)), 1)) == 10
+except:
+    success_3 = False
+
+# --- Test 4: Sampled enforcers validate and catch first item errors ---
+success_4 = True
+try:
+    seeded_list(list(range(1000)))
+    stride_dict({str(i): i for i in range(1000)})
+    edge_set(set(range(1000)))
+except:
+    success_4 = False
+
+success_5 = True
+for fn, value in [
+    (seeded_list, ["bad"] + list(range(999))),
+    (stride_dict, {"0": "bad", **{str(i): i for i in range(1, 1000)}}),
+    (edge_set, {"bad"}),
+]:
+    try:
+        fn(value)
+        success_5 = False
+    except TypeError:
+        pass
+
+# --- Test 6: Unknown sampler names raise ---
+success_6 = False
+try:
+
+    @type_enforced.Enforcer(iterable_sample_pct=10, sampler="unknown")
+    def unknown_sampler(a: list[int]) -> None:
+        return None
+
+except ValueError:
+    success_6 = True
+
+
+# --- Test 7: Custom samplers fall back to random picks for methods they do not override ---
+class HeadSampler(Sampler):
+    __slots__ = ()
+
+    def __sample_indices__(self, length, n):
+        return range(n)
+
+
+success_7 = True
+try:
+    sampler = HeadSampler()
+    assert list(sampler.__get_indices__(1000, 1)) == list(range(10))
+    keys = sampler.__get_keys__({i: i for i in range(1000)}, 1)
+    assert keys[0] == 0 and len(set(keys)) == 10
+except:
+    success_7 = False
+
+if all(
+    [
+        success_1,
+        success_2,
+        success_3,
+        success_4,
+        success_5,
+        success_6,
+        success_7,
+    ]
+):
+    print("test_fn_27.py passed")
+else:
+    print("test_fn_27.py failed")
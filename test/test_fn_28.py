@@ -0,0 +1,66 @@
+import type_enforced
+
+
+@type_enforced.Enforcer(iterable_sample_k=10)
+def rotating_list(a: list[int]) -> None:
+    return None
+
+
+@type_enforced.Enforcer(iterable_sample_k=3)
+def rotating_dict(a: dict[str, int], b: set[int]) -> None:
+    return None
+
+
+# --- Test 1: Only k items are checked per call ---
+success_1 = True
+try:
+    rotating_list(
+        list(range(100)) + ["bad"]
+    )  # Position 100 is not in the first sample
+    stats = type_enforced.get_stats(rotating_list)
+    assert stats["samples"] == 1 and stats["items_checked"] == 10
+except:
+    success_1 = False
+
+# --- Test 2: The cursor sweeps every position over repeated calls ---
+success_2 = False
+try:
+    for _ in range(11):
+        rotating_list(list(range(50)) + ["bad"] + list(range(50)))
+except TypeError:
+    success_2 = True
+
+# --- Test 3: Coverage is reported once a full sweep is done ---
+success_3 = True
+try:
+    for _ in range(4):
+        rotating_dict({str(i): i for i in range(10)}, set(range(5)))
+    stats = type_enforced.get_stats(rotating_dict)
+    assert stats["samples"] == 8 and stats["items_checked"] == 24
+    assert stats["coverage"] == 1.0 and stats["full_sweeps"] == 3
+except:
+    success_3 = False
+
+# --- Test 4: Rotating dict samples catch bad values ---
+success_4 = False
+try:
+    for _ in range(4):
+        rotating_dict({**{str(i): i for i in range(9)}, "9": "bad"}, set())
+except TypeError:
+    success_4 = True
+
+# --- Test 5: Invalid sample sizes raise ---
+success_5 = False
+try:
+
+    @type_enforced.Enforcer(iterable_sample_k=0)
+    def invalid_k(a: list[int]) -> None:
+        return None
+
+except ValueError:
+    success_5 = True
+
+if all([success_1, success_2, success_3, success_4, success_5]):
+    print("test_fn_28.py passed")
+else:
+    print("test_fn_28.py failed")
@@ -0,0 +1,81 @@
+import time
+import type_enforced
+
+
+@type_enforced.Enforcer(max_validation_us=50)
+def budgeted(a: list[int], b: dict[str, int] | None = None) -> list[int]:
+    return a
+
+
+big_list = list(range(1_000_000)) + ["bad"]
+big_dict = {str(i): i for i in range(1_000_000)}
+big_dict["bad"] = "bad"
+
+# --- Test 1: Validation stops once the budget is spent ---
+success_1 = True
+try:
+    budgeted(big_list)
+    budgeted([1, 2, 3], b=big_dict)
+    stats = type_enforced.get_stats(budgeted)
+    # Input and return validations are budgeted separately
+    assert stats["validations"] == 4
+    assert stats["truncated"] == 3
+except:
+    success_1 = False
+
+# --- Test 2: Small iterables are still fully validated ---
+success_2 = False
+try:
+    budgeted([1, 2, "bad"])
+except TypeError:
+    success_2 = True
+
+# --- Test 3: Top level type checks always run ---
+success_3 = False
+try:
+    budgeted(big_list, b=["not", "a", "dict"])
+except TypeError:
+    success_3 = True
+
+# --- Test 4: Errors found before the budget is spent are still raised ---
+success_4 = False
+try:
+    budgeted(["bad"] + big_list)
+except TypeError:
+    success_4 = True
+
+
+# --- Test 5: The budget is charged for the items of nested iterables ---
+@type_enforced.Enforcer(max_validation_us=1000)
+def nested_budgeted(a: list[list[int]]) -> None:
+    return None
+
+
+@type_enforced.Enforcer(max_validation_us=1000)
+def nested_dict_budgeted(a: dict[str, list[tuple[int, str]]]) -> None:
+    return None
+
+
+success_5 = True
+try:
+    nested_list = [list(range(250)) for _ in range(2000)]
+    nested_dict = {str(i): [(j, "a") for j in range(250)] for i in range(250)}
+    for fn, value in [
+        (nested_budgeted, nested_list),
+        (nested_dict_budgeted, nested_dict),
+    ]:
+        elapsed = []
+        for _ in range(5):
+            start = time.perf_counter()
+            fn(value)
+            elapsed.append(time.perf_counter() - start)
+        # A full validation takes well over 5ms
+        assert min(elapsed) < 0.003
+        assert type_enforced.get_stats(fn)["truncated"] == 5
+except:
+    success_5 = False
+
+if all([success_1, success_2, success_3, success_4, success_5]):
+    print("test_fn_29.py passed")
+else:
+    print("test_fn_29.py failed")
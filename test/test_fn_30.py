@@ -0,0 +1,96 @@
+import type_enforced
+import type_enforced.enforcer
+
+# The controller is timed with a fake clock that ticks once per reading, so the measured overhead
+# does not depend on the load of the machine
+clock = [0]
+
+
+def perf_counter_ns():
+    clock[0] += 1
+    return clock[0]
+
+
+type_enforced.enforcer.perf_counter_ns = perf_counter_ns
+
+
+@type_enforced.Enforcer(target_overhead=0.05, sample_pct_bounds=(2, 50))
+def cheap(a: list[int]) -> None:
+    return None
+
+
+@type_enforced.Enforcer(target_overhead=0.05, iterable_sample_pct=10)
+def slow(a: list[int]) -> None:
+    # Takes 1ms on the fake clock
+    clock[0] += 1_000_000
+
+
+data = list(range(10_000))
+
+# --- Test 1: Cheap functions are driven to the lowest sample percentage ---
+success_1 = True
+try:
+    assert type_enforced.get_stats(cheap)["sample_pct"] == 50
+    for _ in range(16 * 10):
+        cheap(data)
+    stats = type_enforced.get_stats(cheap)
+    assert stats["measured_calls"] == 10
+    assert stats["sample_pct"] == 2
+    assert stats["overhead"] > 0.05
+except:
+    success_1 = False
+
+# --- Test 2: Slow functions are driven to full validation ---
+success_2 = True
+try:
+    for _ in range(16 * 4):
+        slow([1, 2, 3] * 10)
+    stats = type_enforced.get_stats(slow)
+    assert stats["measured_calls"] == 4
+    assert stats["sample_pct"] == 100
+    assert stats["overhead"] < 0.05
+except:
+    success_2 = False
+
+# --- Test 3: Top level and sampled errors are still raised ---
+success_3 = False
+try:
+    cheap(["bad"] + data)
+except TypeError:
+    success_3 = True
+
+# --- Test 4: Invalid settings raise ---
+success_4 = False
+try:
+
+    @type_enforced.Enforcer(target_overhead=0.05, sample_pct_bounds=(50, 10))
+    def invalid_bounds(a: list[int]) -> None:
+        return None
+
+except ValueError:
+    success_4 = True
+
+
+# --- Test 5: Validated calls are measured with call sampling ---
+@type_enforced.Enforcer(
+    target_overhead=0.05, call_sample_rate=0.5, sample_pct_bounds=(2, 50)
+)
+def sampled(a: list[int]) -> None:
+    return None
+
+
+success_5 = True
+try:
+    # Every second call is validated and every 16th validated call is measured
+    for _ in range(2 * 16 * 3):
+        sampled(data)
+    stats = type_enforced.get_stats(sampled)
+    assert stats["measured_calls"] == 3
+    assert stats["sample_pct"] < 50
+except:
+    success_5 = False
+
+if all([success_1, success_2, success_3, success_4, success_5]):
+    print("test_fn_30.py passed")
+else:
+    print("test_fn_30.py failed")
@@ -0,0 +1,103 @@
+import type_enforced
+
+
+@type_enforced.Enforcer(call_sample_rate=0.25)
+def sampled(a: int) -> None:
+    return None
+
+
+@type_enforced.Enforcer(call_sample_rate=0.125, backoff_after=2)
+def backoff(a: int) -> None:
+    return None
+
+
+# --- Test 1: The first call is validated ---
+success_1 = False
+try:
+    sampled("bad")
+except TypeError:
+    success_1 = True
+
+# --- Test 2: Only one in every 4 calls is validated ---
+success_2 = True
+try:
+    failures = 0
+    for _ in range(12):
+        try:
+            sampled("bad")
+        except TypeError:
+            failures += 1
+    assert failures == 3
+    stats = type_enforced.get_stats(sampled)
+    assert stats["checked_calls"] == 4 and stats["skipped_calls"] == 9
+    assert stats["call_sample_rate"] == 0.25
+except:
+    success_2 = False
+
+# --- Test 3: The call interval backs off after streaks of passing calls ---
+success_3 = True
+try:
+    assert type_enforced.get_stats(backoff)["call_sample_rate"] == 1
+    # 2 calls at 1/1, 2 checked calls at 1/2, 2 checked calls at 1/4
+    for _ in range(2 + 4 + 8):
+        backoff(1)
+    stats = type_enforced.get_stats(backoff)
+    assert stats["checked_calls"] == 6
+    assert stats["call_sample_rate"] == 0.125
+    # The interval is capped at the call sample rate
+    for _ in range(64):
+        backoff(1)
+    assert type_enforced.get_stats(backoff)["call_sample_rate"] == 0.125
+except:
+    success_3 = False
+
+# --- Test 4: A violation snaps back to validating every call ---
+success_4 = True
+try:
+    failures = 0
+    for _ in range(8):
+        try:
+            backoff("bad")
+        except TypeError:
+            failures += 1
+    assert failures == 1
+    assert type_enforced.get_stats(backoff)["call_sample_rate"] == 1
+    try:
+        backoff("bad")
+        success_4 = False
+    except TypeError:
+        pass
+except:
+    success_4 = False
+
+# --- Test 5: Invalid rates raise ---
+success_5 = False
+try:
+
+    @type_enforced.Enforcer(call_sample_rate=0)
+    def invalid_rate(a: int) -> None:
+        return None
+
+except ValueError:
+    success_5 = True
+
+
+# --- Test 6: Skipped calls are counted before the next checked call ---
+@type_enforced.Enforcer(call_sample_rate=0.01)
+def rare(a: int) -> None:
+    return None
+
+
+success_6 = True
+try:
+    for _ in range(150):
+        rare(1)
+    stats = type_enforced.get_stats(rare)
+    assert stats["checked_calls"] == 2 and stats["skipped_calls"] == 148
+except:
+    success_6 = False
+
+if all([success_1, success_2, success_3, success_4, success_5, success_6]):
+    print("test_fn_31.py passed")
+else:
+    print("test_fn_31.py failed")
@@ -0,0 +1,156 @@
+import asyncio, contextvars, threading
+import type_enforced
+from dataclasses import dataclass
+
+
+@type_enforced.Enforcer
+def validated(a: int) -> None:
+    return None
+
+
+@type_enforced.Enforcer(call_sample_rate=0.01)
+def rarely_validated(a: int) -> None:
+    return None
+
+
+@type_enforced.Enforcer
+@dataclass
+class Point:
+    x: int
+
+
+@type_enforced.Enforcer(validate_assignment=True)
+@dataclass
+class Counter:
+    value: int
+
+
+def raises(fn, *args):
+    try:
+        fn(*args)
+        return False
+    except TypeError:
+        return True
+
+
+# --- Test 1: Skipped scopes skip every enforced call ---
+success_1 = True
+try:
+    with type_enforced.sampling_scope(rate=0) as is_validated:
+        assert is_validated is False
+        validated("bad")
+    assert raises(validated, "bad")
+except:
+    success_1 = False
+
+# --- Test 2: Validated scopes validate every call (including call sampled ones) ---
+success_2 = True
+try:
+    rarely_validated(1)  # The first call is always validated
+    assert not raises(rarely_validated, "bad")
+    with type_enforced.sampling_scope(rate=1) as is_validated:
+        assert is_validated is True
+        assert all(raises(rarely_validated, "bad") for _ in range(5))
+except:
+    success_2 = False
+
+# --- Test 3: Nested scopes keep the outer decision ---
+success_3 = True
+try:
+    with type_enforced.sampling_scope(rate=0):
+        with type_enforced.sampling_scope(rate=1) as is_validated:
+            assert is_validated is False
+            validated("bad")
+except:
+    success_3 = False
+
+
+# --- Test 4: Scopes are local to threads and asyncio tasks ---
+def thread_raises(results):
+    results.append(raises(validated, "bad"))
+
+
+async def task(rate):
+    with type_enforced.sampling_scope(rate=rate):
+        await asyncio.sleep(0)
+        return raises(validated, "bad")
+
+
+async def tasks():
+    return await asyncio.gather(task(0), task(1), task(0))
+
+
+success_4 = True
+try:
+    results = []
+    with type_enforced.sampling_scope(rate=0):
+        thread = threading.Thread(target=thread_raises, args=(results,))
+        thread.start()
+        thread.join()
+        context_thread = threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(thread_raises, results),
+        )
+        context_thread.start()
+        context_thread.join()
+    assert results == [True, False]
+    assert asyncio.run(tasks()) == [False, True, False]
+except:
+    success_4 = False
+
+# --- Test 5: Scopes can decorate request handlers ---
+success_5 = True
+try:
+
+    @type_enforced.sampling_scope(rate=0)
+    def handler():
+        validated("bad")
+
+    handler()
+except:
+    success_5 = False
+
+# --- Test 6: Suppressed blocks skip every enforced call until they exit ---
+success_6 = True
+try:
+    with type_enforced.suppressed():
+        validated("bad")
+        with type_enforced.sampling_scope(rate=1) as is_validated:
+            assert is_validated is False
+            validated("bad")
+    assert raises(validated, "bad")
+    with type_enforced.sampling_scope(rate=1):
+        with type_enforced.suppressed():
+            validated("bad")
+        assert raises(validated, "bad")
+except:
+    success_6 = False
+
+# --- Test 7: Suppressed blocks skip dataclass field validation ---
+success_7 = True
+try:
+    with type_enforced.suppressed():
+        assert Point("a").x == "a"
+        assert type_enforced.replace(Point(1), x="b").x == "b"
+        counter = Counter("a")
+        counter.value = "b"
+    assert raises(Point, "a")
+    assert raises(Counter, "a")
+    assert raises(setattr, Counter(1), "value", "b")
+except:
+    success_7 = False
+
+if all(
+    [
+        success_1,
+        success_2,
+        success_3,
+        success_4,
+        success_5,
+        success_6,
+        success_7,
+    ]
+):
+    print("test_fn_32.py passed")
+else:
+    print("test_fn_32.py failed")
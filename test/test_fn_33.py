@@ -0,0 +1,124 @@
+import io
+from contextlib import redirect_stdout
+import type_enforced
+from type_enforced.shadow import ShadowWorker
+
+worker = ShadowWorker(maxsize=1)
+
+
+@type_enforced.Enforcer(shadow=worker, shadow_min_size=100)
+def shadowed(a: list[int]) -> None:
+    return None
+
+
+@type_enforced.Enforcer(
+    shadow=worker, shadow_min_size=100, shadow_snapshot=True
+)
+def snapshot(a: list[int]) -> None:
+    return None
+
+
+# --- Test 1: Large inputs are validated in the background ---
+success_1 = True
+try:
+    output = io.StringIO()
+    with redirect_stdout(output):
+        shadowed(list(range(50)) + ["bad"] + list(range(50)))  # Does not raise
+        worker.wait()
+    assert "TypeEnforced Warning (shadowed)" in output.getvalue()
+    assert "a[50]" in output.getvalue()
+    stats = type_enforced.get_stats(shadowed)
+    assert stats["shadow_queued"] == 1 and stats["shadow_violations"] == 1
+except:
+    success_1 = False
+
+# --- Test 2: Top level and first item errors are still raised inline ---
+success_2 = False
+try:
+    shadowed(["bad"] + list(range(100)))
+except TypeError:
+    success_2 = True
+
+success_3 = False
+try:
+    shadowed((1, 2, 3))
+except TypeError:
+    success_3 = True
+
+# --- Test 4: Small inputs are validated inline ---
+success_4 = False
+try:
+    shadowed([1, 2, "bad"])
+except TypeError:
+    success_4 = True
+
+# --- Test 5: Validations are dropped when the queue is full ---
+success_5 = True
+try:
+    worker.wait()
+    output = io.StringIO()
+    with redirect_stdout(output):
+        big = list(range(200_000)) + ["bad"]
+        for _ in range(20):
+            shadowed(big)
+        worker.wait()
+    stats = type_enforced.get_stats(shadowed)
+    # The first item error in test 2 was raised before queueing
+    assert stats["shadow_queued"] + stats["shadow_dropped"] == 21
+    assert stats["shadow_dropped"] > 0
+    assert stats["shadow_violations"] == stats["shadow_queued"]
+except:
+    success_5 = False
+
+# --- Test 6: Snapshots are not affected by later changes ---
+success_6 = True
+try:
+    output = io.StringIO()
+    with redirect_stdout(output):
+        data = list(range(1000))
+        snapshot(data)
+        data.append("bad")
+        worker.wait()
+    assert type_enforced.get_stats(snapshot)["shadow_violations"] == 0
+except:
+    success_6 = False
+
+
+# --- Test 7: The background validation checks every item of sampled inputs ---
+@type_enforced.Enforcer(shadow=worker, shadow_min_size=100, iterable_sample_k=2)
+def sampled(a: list[int]) -> None:
+    return None
+
+
+success_7 = True
+try:
+    worker.wait()
+    output = io.StringIO()
+    with redirect_stdout(output):
+        data = list(range(500)) + ["bad"]
+        for _ in range(3):
+            sampled(data)
+            worker.wait()
+    assert "a[500]" in output.getvalue()
+    # The worker does not share the rotating sampler (or caches) of the calling threads
+    shadow_checker = sampled.__shadow_checker__
+    assert shadow_checker.__sampler__ is not sampled.__sampler__
+    assert shadow_checker.__verdicts__ is not sampled.__verdicts__
+    assert type_enforced.get_stats(sampled)["shadow_violations"] == 3
+except:
+    success_7 = False
+
+if all(
+    [
+        success_1,
+        success_2,
+        success_3,
+        success_4,
+        success_5,
+        success_6,
+        success_7,
+    ]
+):
+    print("test_fn_33.py passed")
+else:
+    print("test_fn_33.py failed")
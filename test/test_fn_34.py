@@ -0,0 +1,200 @@
+import os, subprocess, sys
+import type_enforced
+from dataclasses import dataclass
+
+
+@type_enforced.Enforcer
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+@type_enforced.Enforcer
+class Calculator:
+    def double(self, a: int) -> int:
+        return a * 2
+
+    @staticmethod
+    def triple(a: int) -> int:
+        return a * 3
+
+
+@type_enforced.Enforcer
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+@type_enforced.Enforcer(validate_assignment=True)
+@dataclass
+class Counter:
+    value: int
+
+
+def make_local():
+    @type_enforced.Enforcer
+    def local(a: int) -> int:
+        return a
+
+    return local
+
+
+def raises(fn, *args):
+    try:
+        fn(*args)
+        return False
+    except TypeError:
+        return True
+
+
+# --- Test 1: Disabled enforcers are rebound to the original function ---
+success_1 = True
+try:
+    enforced_add = add
+    assert type_enforced.get_enforcers("__main__.add") == {"__main__.add": True}
+    assert type_enforced.disable("__main__.add") == 1
+    assert add is enforced_add.__fn__
+    assert add("a", "b") == "ab"
+    # References to the enforcer bypass checks as well
+    assert enforced_add("a", "b") == "ab"
+    assert type_enforced.get_enforcers("__main__.add") == {
+        "__main__.add": False
+    }
+    assert type_enforced.enable("__main__.add") == 1
+    assert add is enforced_add
+    assert raises(add, "a", "b")
+except:
+    success_1 = False
+
+# --- Test 2: Methods and staticmethods are toggled by pattern ---
+success_2 = True
+try:
+    assert type_enforced.disable("__main__.Calculator.*") == 2
+    assert isinstance(Calculator.__dict__["triple"], staticmethod)
+    assert not isinstance(
+        Calculator.__dict__["double"], type_enforced.FunctionMethodEnforcer
+    )
+    assert Calculator().double("a") == "aa"
+    assert Calculator.triple("a") == "aaa"
+    assert raises(add, "a", "b")
+    assert type_enforced.enable("__main__.Calculator.*") == 2
+    assert raises(Calculator().double, "a")
+    assert raises(Calculator.triple, "a")
+except:
+    success_2 = False
+
+# --- Test 3: Local functions can not be rebound but are still disabled ---
+success_3 = True
+try:
+    local = make_local()
+    assert type_enforced.disable("*.<locals>.local") == 1
+    assert local("a") == "a"
+    type_enforced.enable("*.<locals>.local")
+    assert raises(local, "a")
+except:
+    success_3 = False
+
+# --- Test 4: Enforcers start disabled under `python -O` ---
+success_4 = True
+try:
+    code = """
+import type_enforced
+
+@type_enforced.Enforcer
+def fn(a: int) -> int:
+    return a
+
+# Note: `assert` statements are removed under `python -O`
+checks = [
+    not isinstance(fn, type_enforced.FunctionMethodEnforcer),
+    fn("a") == "a",
+    type_enforced.get_enforcers("__main__.fn") == {"__main__.fn": False},
+]
+if not all(checks):
+    raise AssertionError(checks)
+type_enforced.enable("__main__.fn")
+try:
+    fn("a")
+    raise AssertionError("fn was not enabled")
+except TypeError:
+    pass
+print("ok")
+"""
+    output = subprocess.run(
+        [sys.executable, "-O", "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    assert output.stdout.strip() == "ok", output.stderr
+except:
+    success_4 = False
+
+# --- Test 5: Dataclasses are registered and restored to their original methods ---
+success_5 = True
+try:
+    assert type_enforced.get_enforcers("__main__.Point") == {
+        "__main__.Point": True
+    }
+    original_init = Point.__type_enforced_dataclass__.__original_init__
+    assert raises(Point, "a", 1)
+    assert type_enforced.disable("__main__.Point") == 1
+    assert type_enforced.disable("__main__.Counter") == 1
+    assert Point.__init__ is original_init
+    assert "__setattr__" not in Counter.__dict__
+    assert Point("a", 1).x == "a"
+    assert type_enforced.replace(Point(1, 2), x="b").x == "b"
+    counter = Counter(1)
+    counter.value = "a"
+    assert type_enforced.enable("__main__.Point") == 1
+    assert type_enforced.enable("__main__.Counter") == 1
+    assert raises(Point, "a", 1)
+    assert raises(Counter, "a")
+    assert raises(setattr, counter, "value", "b")
+except:
+    success_5 = False
+
+# --- Test 6: Dataclasses are returned unchanged under `python -O` ---
+success_6 = True
+try:
+    code = """
+import type_enforced
+from dataclasses import dataclass
+
+@dataclass
+class Point:
+    x: int
+
+methods = dict(Point.__dict__)
+# Note: `assert` statements are removed under `python -O`
+checks = [
+    type_enforced.Enforcer(Point) is Point,
+    Point.__dict__["__init__"] is methods["__init__"],
+    Point.__dict__.get("__replace__") is methods.get("__replace__"),
+    Point("a").x == "a",
+    type_enforced.get_enforcers("__main__.Point") == {"__main__.Point": False},
+]
+if not all(checks):
+    raise AssertionError(checks)
+type_enforced.enable("__main__.Point")
+try:
+    Point("a")
+    raise AssertionError("Point was not enabled")
+except TypeError:
+    pass
+print("ok")
+"""
+    output = subprocess.run(
+        [sys.executable, "-O", "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    assert output.stdout.strip() == "ok", output.stderr
+except:
+    success_6 = False
+
+if all([success_1, success_2, success_3, success_4, success_5, success_6]):
+    print("test_fn_34.py passed")
+else:
+    print("test_fn_34.py failed")
@@ -0,0 +1,116 @@
+from collections.abc import Sized
+from typing import Protocol, runtime_checkable
+import type_enforced
+
+
+@type_enforced.Enforcer
+def simple(a: int, b: str | None = None, c: float = 1.0) -> int:
+    return a
+
+
+@type_enforced.Enforcer
+def mixed(a: int, b: list[int]) -> int:
+    return a
+
+
+@runtime_checkable
+class HasName(Protocol):
+    name: str
+
+
+@type_enforced.Enforcer
+def named(a: HasName) -> None:
+    return None
+
+
+class Named:
+    pass
+
+
+def raises(fn, *args, **kwargs):
+    try:
+        fn(*args, **kwargs)
+        return False
+    except TypeError:
+        return True
+
+
+# --- Test 1: Repeated signatures are cache hits ---
+success_1 = True
+try:
+    for _ in range(3):
+        simple(1)
+        simple(1, "a", c=2.0)
+    stats = type_enforced.get_stats(simple)
+    assert stats["signature_misses"] == 2
+    assert stats["signature_hits"] == 4
+    # A new keyword name is a new signature
+    simple(1, b="a")
+    assert type_enforced.get_stats(simple)["signature_misses"] == 3
+except:
+    success_1 = False
+
+# --- Test 2: Invalid arguments are never cached ---
+success_2 = True
+try:
+    assert raises(simple, "a")
+    assert raises(simple, "a")
+    assert raises(simple, 1, 2)
+    assert raises(simple, 1, c="a")
+    assert type_enforced.get_stats(simple)["signature_hits"] == 4
+except:
+    success_2 = False
+
+# --- Test 3: Warnings with strict=False are repeated for every call ---
+success_3 = True
+try:
+
+    @type_enforced.Enforcer(strict=False)
+    def lenient(a: int) -> None:
+        return None
+
+    lenient("a")
+    lenient("a")
+    assert type_enforced.get_stats(lenient)["signature_misses"] == 2
+except:
+    success_3 = False
+
+# --- Test 4: Complex parameters and instance dependent checks are not cached ---
+success_4 = True
+try:
+    mixed(1, [1])
+    assert "signature_hits" not in type_enforced.get_stats(mixed)
+    obj = Named()
+    obj.name = "a"
+    named(obj)
+    assert raises(named, Named())
+    assert "signature_hits" not in type_enforced.get_stats(named)
+
+    @type_enforced.Enforcer
+    def sized(a: Sized) -> None:
+        return None
+
+    sized([1])
+    sized([2])
+    assert type_enforced.get_stats(sized)["signature_hits"] == 1
+except:
+    success_4 = False
+
+# --- Test 5: The cache is bounded ---
+success_5 = True
+try:
+
+    @type_enforced.Enforcer
+    def anything(a: object) -> None:
+        return None
+
+    for i in range(100):
+        anything(type(f"Class{i}", (), {})())
+    assert len(anything.__signatures__) == 64
+except:
+    success_5 = False
+
+if all([success_1, success_2, success_3, success_4, success_5]):
+    print("test_fn_35.py passed")
+else:
+    print("test_fn_35.py failed")
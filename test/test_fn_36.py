@@ -0,0 +1,114 @@
+from collections.abc import Mapping
+from fractions import Fraction
+from numbers import Number
+from typing import Protocol, runtime_checkable
+import type_enforced
+
+
+# The `list[int]` unions keep these parameters off the single `isinstance` fast path
+@type_enforced.Enforcer
+def mapping_fn(a: Mapping | list[int]) -> None:
+    return None
+
+
+@type_enforced.Enforcer
+def number_fn(a: Number | list[int]) -> None:
+    return None
+
+
+@type_enforced.Enforcer
+def numbers_fn(a: list[Number]) -> None:
+    return None
+
+
+@runtime_checkable
+class HasName(Protocol):
+    name: str
+
+
+@type_enforced.Enforcer
+def named_fn(a: HasName | list[int]) -> None:
+    return None
+
+
+class Liar:
+    def __init__(self, cls):
+        self.cls = cls
+
+    @property
+    def __class__(self):
+        return self.cls
+
+
+class Named:
+    pass
+
+
+def raises(fn, *args):
+    try:
+        fn(*args)
+        return False
+    except TypeError:
+        return True
+
+
+def cached_verdicts(fn):
+    return [
+        entry[1] for entry in fn.__verdicts__.values() if entry is not False
+    ]
+
+
+# --- Test 1: ABC verdicts are cached per concrete type ---
+success_1 = True
+try:
+    mapping_fn({})
+    mapping_fn({"a": 1})
+    assert raises(mapping_fn, "a")
+    assert cached_verdicts(mapping_fn) == [{dict: True, str: False}]
+except:
+    success_1 = False
+
+# --- Test 2: Registering a subclass of an ABC invalidates cached verdicts ---
+success_2 = True
+try:
+
+    class Money:
+        pass
+
+    assert raises(number_fn, Money())
+    Number.register(Money)
+    number_fn(Money())
+except:
+    success_2 = False
+
+# --- Test 3: Objects with a different `__class__` and instance dependent protocol checks are never cached ---
+success_3 = True
+try:
+    mapping_fn(Liar(dict))
+    assert raises(mapping_fn, Liar(int))
+    assert Liar not in cached_verdicts(mapping_fn)[0]
+    obj = Named()
+    obj.name = "a"
+    named_fn(obj)
+    assert raises(named_fn, Named())
+    # `name` is an instance attribute, so each instance of `Named` is checked
+    assert cached_verdicts(named_fn)[0][Named] not in (True, False)
+except:
+    success_3 = False
+
+# --- Test 4: Iterables of subclasses only check each distinct item type ---
+success_4 = True
+try:
+    numbers_fn([1, 2.5, Fraction(1, 2), True] * 100)
+    assert raises(numbers_fn, [1, 2.5, "3"])
+    try:
+        numbers_fn([1, 2.5, "3"])
+    except TypeError as error:
+        assert "`a[2]`" in str(error)
+except:
+    success_4 = False
+
+if all([success_1, success_2, success_3, success_4]):
+    print("test_fn_36.py passed")
+else:
+    print("test_fn_36.py failed")
@@ -0,0 +1,111 @@
+from typing import TypedDict
+import type_enforced
+
+
+@type_enforced.Enforcer
+def shapes(a: tuple[int, str] | tuple[str, int] | tuple[float] | None) -> None:
+    return None
+
+
+@type_enforced.Enforcer
+def variadic(a: tuple[int, ...] | tuple[str, str]) -> None:
+    return None
+
+
+@type_enforced.Enforcer
+def rows(a: list[tuple[int, str] | tuple[str, int]]) -> None:
+    return None
+
+
+@type_enforced.Enforcer
+def any_tuple(a: tuple[int, str] | tuple) -> None:
+    return None
+
+
+class Point(TypedDict):
+    x: int
+    y: int
+
+
+class Point3D(TypedDict):
+    x: int
+    y: int
+    z: int
+
+
+class Label(TypedDict):
+    x: int
+    y: int
+    text: str
+
+
+class Named(TypedDict):
+    name: str
+
+
+@type_enforced.Enforcer
+def shape(a: Point | Point3D | Label | Named) -> None:
+    return None
+
+
+def error(fn, *args):
+    try:
+        fn(*args)
+    except TypeError as exception:
+        return str(exception)
+    return None
+
+
+# --- Test 1: Unions of tuples dispatch on the tuple length ---
+success_1 = True
+try:
+    shapes((1, "a"))
+    shapes(("a", 1))
+    shapes((1.5,))
+    shapes(None)
+    assert "does not match any of the expected tuple shapes" in error(
+        shapes, (1, 1)
+    )
+    assert "Expected one of the lengths [1, 2], got 3" in error(
+        shapes, (1, 2, 3)
+    )
+    # A single matching shape reports the failing position
+    assert "`a[0]`" in error(shapes, ("a",))
+except:
+    success_1 = False
+
+# --- Test 2: Variable length, nested and bare tuples in unions ---
+success_2 = True
+try:
+    variadic(())
+    variadic((1, 2, 3))
+    variadic(("a", "b"))
+    assert error(variadic, ("a", 1)) is not None
+    rows([(1, "a"), ("b", 2)])
+    assert "`a[1]`" in error(rows, [(1, "a"), ("b", "c")])
+    any_tuple(("a", 1, None))
+    assert type_enforced.is_valid((1, "a"), tuple[int, str] | tuple[str, int])
+    assert not type_enforced.is_valid((1, 1), tuple[int, str] | tuple[str, int])
+except:
+    success_2 = False
+
+# --- Test 3: Unions of TypedDicts dispatch on the passed keys ---
+success_3 = True
+try:
+    shape({"x": 1, "y": 2})
+    shape({"x": 1, "y": 2, "z": 3})
+    shape({"x": 1, "y": 2, "text": "a"})
+    shape({"name": "a"})
+    # Only one TypedDict has these keys, so the failing value is reported
+    assert "`a['z']`" in error(shape, {"x": 1, "y": 2, "z": "3"})
+    assert "does not match any of the expected TypedDicts" in error(
+        shape, {"x": 1}
+    )
+    assert error(shape, {"x": 1, "y": 2, "z": 3, "text": "a"}) is not None
+except:
+    success_3 = False
+
+if all([success_1, success_2, success_3]):
+    print("test_fn_37.py passed")
+else:
+    print("test_fn_37.py failed")
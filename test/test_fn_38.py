@@ -0,0 +1,131 @@
+from abc import ABC
+from typing import Any, Type
+import type_enforced
+
+
+class Plugin:
+    pass
+
+
+class CsvPlugin(Plugin):
+    pass
+
+
+class Other:
+    pass
+
+
+class Base(ABC):
+    pass
+
+
+@type_enforced.Enforcer
+def register(plugin: type[Plugin], priority: int = 0) -> None:
+    return None
+
+
+@type_enforced.Enforcer
+def register_any(plugin: Type[Plugin] | Type[Other] | None) -> None:
+    return None
+
+
+@type_enforced.Enforcer
+def register_all(plugins: list[type[Plugin]]) -> None:
+    return None
+
+
+@type_enforced.Enforcer
+def any_class(a: type, b: Any, c: Type[Any]) -> None:
+    return None
+
+
+@type_enforced.Enforcer
+def abstract(a: Type[Base] | int) -> None:
+    return None
+
+
+def error(fn, *args):
+    try:
+        fn(*args)
+    except TypeError as exception:
+        return str(exception)
+    return None
+
+
+# --- Test 1: Subclasses of the expected classes pass ---
+success_1 = True
+try:
+    register(Plugin)
+    register(CsvPlugin)
+    register_any(CsvPlugin)
+    register_any(Other)
+    register_any(None)
+    register_all([Plugin, CsvPlugin])
+    assert "typing.Type[__main__.Plugin]" in error(register, Other)
+    assert error(register, Plugin()) is not None
+    assert "`plugins[1]`" in error(register_all, [Plugin, Other])
+except:
+    success_1 = False
+
+# --- Test 2: Bare `type`, `Any` and `Type[Any]` accept any class ---
+success_2 = True
+try:
+    any_class(int, str, Other)
+    assert error(any_class, 1, 1, 1) is not None
+except:
+    success_2 = False
+
+# --- Test 3: Verdicts are cached per class and cleared by ABC registration ---
+success_3 = True
+try:
+    verdicts = [
+        dict(entry[1].values())
+        for entry in register.__class_verdicts__.values()
+    ]
+    assert verdicts == [{Plugin: True, CsvPlugin: True, Other: False}]
+    assert error(abstract, Other) is not None
+    Base.register(Other)
+    abstract(Other)
+    abstract(1)
+except:
+    success_3 = False
+
+# --- Test 4: Class objects are supported with deep records ---
+success_4 = True
+try:
+
+    @type_enforced.Enforcer(deep_records=True)
+    def deep(plugin: type[Plugin]) -> None:
+        return None
+
+    deep(CsvPlugin)
+    assert error(deep, Other) is not None
+except:
+    success_4 = False
+
+
+# --- Test 5: Classes with an unhashable metaclass are supported ---
+class UnhashableMeta(type):
+    __hash__ = None
+
+
+class UnhashablePlugin(Plugin, metaclass=UnhashableMeta):
+    pass
+
+
+class UnhashableOther(metaclass=UnhashableMeta):
+    pass
+
+
+success_5 = True
+try:
+    for _ in range(2):
+        register(UnhashablePlugin)
+        assert error(register, UnhashableOther) is not None
+except:
+    success_5 = False
+
+if all([success_1, success_2, success_3, success_4, success_5]):
+    print("test_fn_38.py passed")
+else:
+    print("test_fn_38.py failed")
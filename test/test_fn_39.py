@@ -0,0 +1,128 @@
+from collections.abc import Sequence
+from typing import AnyStr, Protocol, TypeVar, runtime_checkable
+import type_enforced
+
+
+@runtime_checkable
+class Closeable(Protocol):
+    def close(self) -> None: ...
+
+
+class Resource:
+    def close(self) -> None:
+        pass
+
+
+class Plain:
+    pass
+
+
+class NotRuntime(Protocol):
+    def run(self) -> None: ...
+
+
+T = TypeVar("T", bound=Sequence)
+N = TypeVar("N", int, float)
+U = TypeVar("U")
+
+
+@type_enforced.Enforcer
+def shutdown(resource: Closeable | None) -> None:
+    return None
+
+
+@type_enforced.Enforcer
+def first(items: T) -> T:
+    return items
+
+
+@type_enforced.Enforcer
+def anything(a: U) -> U:
+    return a
+
+
+@type_enforced.Enforcer
+def scale(a: N) -> N:
+    return a
+
+
+@type_enforced.Enforcer(bind_typevars=True)
+def concat(a: AnyStr, b: AnyStr) -> AnyStr:
+    return a + b
+
+
+@type_enforced.Enforcer(bind_typevars=True)
+def widen(a: N, b: N) -> N:
+    return a * 1.5
+
+
+def error(fn, *args):
+    try:
+        fn(*args)
+    except TypeError as exception:
+        return str(exception)
+    return None
+
+
+# --- Test 1: Runtime checkable protocols are checked structurally ---
+success_1 = True
+try:
+    shutdown(Resource())
+    shutdown(None)
+    assert "Closeable" in error(shutdown, Plain())
+    # Types with the protocol members on the class are cached, others are
+    # checked per instance since the members could be instance attributes
+    verdicts = [
+        entry[1]
+        for entry in shutdown.__verdicts__.values()
+        if entry is not False
+    ]
+    assert len(verdicts) == 1
+    assert verdicts[0][Resource] is True
+    assert verdicts[0][Plain] not in (True, False)
+except:
+    success_1 = False
+
+# --- Test 2: Protocols that are not runtime checkable raise ---
+success_2 = True
+try:
+
+    @type_enforced.Enforcer
+    def run(a: NotRuntime) -> None:
+        return None
+
+    assert "runtime_checkable" in error(run, Resource())
+except:
+    success_2 = False
+
+# --- Test 3: TypeVars are checked against their bound or constraints ---
+success_3 = True
+try:
+    assert first([1]) == [1]
+    assert first("abc") == "abc"
+    assert error(first, 1) is not None
+    assert scale(1) == 1
+    assert scale(1.5) == 1.5
+    assert error(scale, "1") is not None
+    assert anything("a") == "a"
+    assert anything(None) is None
+except:
+    success_3 = False
+
+# --- Test 4: `bind_typevars` binds each TypeVar across a call ---
+success_4 = True
+try:
+    assert concat("a", "b") == "ab"
+    assert concat(b"a", b"b") == b"ab"
+    assert "TypeVar mismatch" in error(concat, "a", b"b")
+    assert "TypeVar mismatch" not in error(concat, 1, 2)
+    # The return value must match the binding of its TypeVar as well
+    assert "`return`" in error(widen, 1, 2)
+    assert widen(1.0, 2.0) == 1.5
+except:
+    success_4 = False
+
+if all([success_1, success_2, success_3, success_4]):
+    print("test_fn_39.py passed")
+else:
+    print("test_fn_39.py failed")
@@ -0,0 +1,122 @@
+import sys
+from typing import TypeVar, Union
+import type_enforced
+
+try:
+    from typing import TypeAliasType
+except ImportError:
+    try:
+        from typing_extensions import TypeAliasType
+    except ImportError:
+        TypeAliasType = None
+
+T = TypeVar("T")
+
+
+def error(fn, *args):
+    try:
+        fn(*args)
+    except TypeError as exception:
+        return str(exception)
+    return None
+
+
+payload = {
+    "name": "a",
+    "tags": ["x", "y"],
+    "nested": {"values": [1, 2.5, True, None, {"deep": [[1], [2, "3"]]}]},
+}
+
+if TypeAliasType is not None:
+    JSON = TypeAliasType(
+        "JSON",
+        "Union[dict[str, JSON], list[JSON], str, int, float, bool, None]",
+    )
+    Tree = TypeAliasType("Tree", Union[list["Tree[T]"], T], type_params=(T,))
+    A = TypeAliasType("A", "Union[B, int]")
+    B = TypeAliasType("B", "Union[A, str]")
+
+    @type_enforced.Enforcer
+    def dump(data: JSON) -> JSON:
+        return data
+
+    @type_enforced.Enforcer
+    def leaves(tree: Tree[int], payloads: list[JSON] | None = None) -> None:
+        return None
+
+
+# --- Test 1: Recursive aliases validate arbitrarily nested values ---
+success_1 = True
+try:
+    assert dump(payload) is payload
+    assert dump([]) == []
+    assert dump(None) is None
+    assert "data['a'][1].key[1]" in error(dump, {"a": [1, {1: 2}]})
+    assert "data[0]['b']" in error(dump, [{"b": object()}])
+except:
+    success_1 = False
+
+# --- Test 2: Generic aliases and aliases nested in other types ---
+success_2 = True
+try:
+    leaves([[1, [2]], 3])
+    leaves(1, [payload, None])
+    assert "tree[0][1][0]" in error(leaves, [[1, ["x"]]])
+    assert "payloads[0]" in error(leaves, 1, [{"a": b"b"}])
+    assert type_enforced.is_valid([payload], list[JSON])
+    assert not type_enforced.is_valid([{1: "a"}], list[JSON])
+except:
+    success_2 = False
+
+# --- Test 3: The alias is parsed once into a graph with back references ---
+success_3 = True
+try:
+    parsed = dump.__alias_types__[JSON]
+    assert parsed[list] is parsed
+    assert parsed[dict][1] is parsed
+    # Unions with other types do not modify the shared parsed alias
+    type_enforced.check([1], list[int] | JSON)
+    assert not type_enforced.is_valid({"a": object()}, dict[str, int] | JSON)
+    assert set(parsed) == {dict, list, str, int, float, bool, type(None)}
+except:
+    success_3 = False
+
+# --- Test 4: Aliases that are unions with themselves raise ---
+success_4 = True
+try:
+
+    @type_enforced.Enforcer
+    def mutual(a: A) -> None:
+        return None
+
+    try:
+        mutual(1)
+        success_4 = False
+    except TypeError as exception:
+        assert "nested in a container" in str(exception)
+except:
+    success_4 = False
+
+# --- Test 5: `type` statements (python >= 3.12) ---
+success_5 = True
+try:
+    if sys.version_info >= (3, 12):
+        namespace = {"type_enforced": type_enforced}
+        exec(
+            "type Nested = list[Nested] | int\n"
+            "@type_enforced.Enforcer\n"
+            "def nested(a: Nested) -> None:\n"
+            "    return None\n",
+            namespace,
+        )
+        namespace["nested"]([1, [2, [3]]])
+        assert "a[1][1][0]" in error(namespace["nested"], [1, [2, ["3"]]])
+except:
+    success_5 = False
+
+if TypeAliasType is None:
+    print("test_fn_40.py skipped")
+elif all([success_1, success_2, success_3, success_4, success_5]):
+    print("test_fn_40.py passed")
+else:
+    print("test_fn_40.py failed")
@@ -0,0 +1,137 @@
+from dataclasses import dataclass
+from typing import Annotated, NotRequired, Required, TypedDict
+import type_enforced
+from type_enforced.utils import Constraint, GenericConstraint
+
+NonNegative = Annotated[float, Constraint(ge=0)]
+Small = Annotated[int, Constraint(ge=0), Constraint(le=5)]
+Color = Annotated[
+    str, GenericConstraint({"in_rgb": lambda x: x in ["red", "green", "blue"]})
+]
+
+
+class Order(TypedDict, total=False):
+    quantity: Required[Annotated[int, Constraint(gt=0)]]
+    note: NotRequired[str]
+
+
+@type_enforced.Enforcer
+def scale(a: Small, b: list[NonNegative], c: Small | str = 0) -> NonNegative:
+    return float(a * sum(b))
+
+
+@type_enforced.Enforcer
+def offset(a: float) -> NonNegative:
+    return a - 1.0
+
+
+@type_enforced.Enforcer
+def paint(color: Color, shades: dict[str, Annotated[int, "unit"]]) -> None:
+    return None
+
+
+@type_enforced.Enforcer
+def order(item: Order) -> None:
+    return None
+
+
+@type_enforced.Enforcer
+@dataclass
+class Point:
+    x: Annotated[int, Constraint(ge=0)]
+    y: int = 0
+
+
+def error(fn, *args, **kwargs):
+    try:
+        fn(*args, **kwargs)
+    except TypeError as exception:
+        return str(exception)
+    return None
+
+
+# --- Test 1: Annotated constraints are validated with the annotated type ---
+success_1 = True
+try:
+    assert scale(2, [1.0, 2.0]) == 6.0
+    assert "`a`" in error(scale, -1, [])
+    assert "`a`" in error(scale, 6, [])
+    assert "Type mismatch" in error(scale, 1.0, [])
+    # Constraints inside containers are validated per item
+    assert "`b[1]`" in error(scale, 1, [1.0, -2.0])
+    assert offset(1.0) == 0.0
+    assert "`return`" in error(offset, 0.5)
+    assert "in_rgb" in error(paint, "yellow", {})
+    # Metadata other than constraints is ignored
+    paint("red", {"light": 1})
+    assert "shades['light']" in error(paint, "red", {"light": "1"})
+except:
+    success_1 = False
+
+# --- Test 2: Constraints only apply to their own type in unions ---
+success_2 = True
+try:
+    scale(1, [], "not a number")
+    assert "`c`" in error(scale, 1, [], -1)
+    assert type_enforced.is_valid("x", Annotated[int, Constraint(ge=0)] | str)
+    assert not type_enforced.is_valid(
+        -1, Annotated[int, Constraint(ge=0)] | str
+    )
+except:
+    success_2 = False
+
+# --- Test 3: TypedDict fields with Required and NotRequired ---
+success_3 = True
+try:
+    order({"quantity": 1})
+    order({"quantity": 1, "note": "fragile"})
+    assert "Missing required key" in error(order, {"note": "fragile"})
+    assert "item['quantity']" in error(order, {"quantity": 0})
+    assert "item['note']" in error(order, {"quantity": 1, "note": 1})
+except:
+    success_3 = False
+
+# --- Test 4: Dataclass fields ---
+success_4 = True
+try:
+    Point(1, 2)
+    assert "`x`" in error(Point, -1)
+except:
+    success_4 = False
+
+# --- Test 5: Constraints of different union members are alternatives ---
+Range = Annotated[int, Constraint(le=10)] | Annotated[int, Constraint(ge=100)]
+success_5 = all(
+    [
+        type_enforced.is_valid(5, Range),
+        type_enforced.is_valid(200, Range),
+        not type_enforced.is_valid(50, Range),
+        type_enforced.is_valid([5, 200], list[Range]),
+        not type_enforced.is_valid([5, 50], list[Range]),
+        # Members without constraints accept any value of their type
+        type_enforced.is_valid(-1, Annotated[int, Constraint(ge=0)] | int),
+        # Constraints on a union apply to each of its members
+        not type_enforced.is_valid(
+            11,
+            Annotated[
+                Annotated[int, Constraint(le=10)] | str, Constraint(ge=0)
+            ],
+        ),
+        not type_enforced.is_valid(
+            -1,
+            Annotated[
+                Annotated[int, Constraint(le=10)] | str, Constraint(ge=0)
+            ],
+        ),
+    ]
+)
+success_6 = False
+try:
+    type_enforced.check(50, Range)
+except TypeError as exception:
+    success_6 = "any of the annotated constraints" in str(exception)
+
+if all([success_1, success_2, success_3, success_4, success_5, success_6]):
+    print("test_fn_41.py passed")
+else:
+    print("test_fn_41.py failed")
@@ -0,0 +1,169 @@
+from contextlib import redirect_stdout
+from io import StringIO
+from typing import Annotated
+import type_enforced
+from type_enforced import Policy, Sample, Skip
+from type_enforced.sampling import StrideSampler
+
+
+@type_enforced.Enforcer
+def load(
+    config: dict[str, int], rows: Annotated[list[int], Sample(0)]
+) -> Annotated[list[int], Skip]:
+    return ["not", "checked"]
+
+
+@type_enforced.Enforcer(
+    iterable_sample_pct=0,
+    param_policies={"config": Sample(100), "return": Sample(k=2)},
+)
+def load_all(config: dict[str, int], rows: list[int]) -> list[int]:
+    return list(range(10))
+
+
+@type_enforced.Enforcer(
+    param_policies={"rows": Sample(0), "b": Skip, "unknown": Skip}
+)
+class Loader:
+    def load(self, rows: Annotated[list[int], Sample(100)]) -> None:
+        return None
+
+    def other(self, a: int, b: int) -> None:
+        return None
+
+
+@type_enforced.Enforcer(strict=False, backoff_after=2, call_sample_rate=0.5)
+def lenient(rows: Annotated[list[int], Sample(50, sampler=StrideSampler())]):
+    return None
+
+
+def error(fn, *args):
+    try:
+        fn(*args)
+    except TypeError as exception:
+        return str(exception)
+    return None
+
+
+# --- Test 1: Annotated policies apply to their parameter only ---
+success_1 = True
+try:
+    # Only the first row is checked and the return value is skipped
+    assert load({"a": 1}, [1, "x", "y"]) == ["not", "checked"]
+    assert "rows[0]" in error(load, {"a": 1}, ["x", 1])
+    # Other parameters are validated in full
+    assert "config['b']" in error(load, {"a": 1, "b": "2"}, [1])
+except:
+    success_1 = False
+
+# --- Test 2: `param_policies` (including the return value) ---
+success_2 = True
+try:
+    load_all({"a": 1}, [1, "x", 2])
+    assert "config['b']" in error(load_all, {"a": 1, "b": "x"}, [])
+    for _ in range(5):
+        load_all({}, [])
+    # The return value keeps its own rotating cursor
+    return_stats = type_enforced.get_stats(load_all)["params"]["return"]
+    assert return_stats["samples"] == 6
+    assert return_stats["coverage"] == 1.0
+except:
+    success_2 = False
+
+# --- Test 3: `param_policies` take precedence and apply to every method ---
+success_3 = True
+try:
+    Loader().load([1, "x", 2])
+    Loader().other(1, "b")
+    assert "`a`" in error(Loader().other, "a", 1)
+except:
+    success_3 = False
+
+# --- Test 4: Policy checkers report violations to their enforcer ---
+success_4 = True
+try:
+    output = StringIO()
+    with redirect_stdout(output):
+        lenient([1, 2, 3, 4])
+        lenient(["x", 2, 3, 4])
+    assert "rows[0]" in output.getvalue()
+    # The violation resets the backoff streak
+    assert lenient.__streak__ == 0
+    assert lenient.__call_interval__ == 1
+except:
+    success_4 = False
+
+# --- Test 5: Invalid policies raise ---
+success_5 = True
+try:
+    for kwargs in [{"iterable_sample_pct": 101}, {"iterable_sample_k": 0}]:
+        try:
+            Policy(**kwargs)
+            success_5 = False
+        except ValueError:
+            pass
+    try:
+
+        @type_enforced.Enforcer(param_policies={"a": 0})
+        def invalid(a: int) -> None:
+            return None
+
+        success_5 = False
+    except ValueError:
+        pass
+except:
+    success_5 = False
+
+
+# --- Test 6: Policies with a sample percentage do not rotate like the enforcer ---
+@type_enforced.Enforcer(
+    iterable_sample_k=2,
+    param_policies={"a": Sample(50), "b": Sample(sampler="stride")},
+)
+def rotated(a: list[int], b: list[int] | None = None) -> None:
+    return None
+
+
+success_6 = True
+try:
+    # The rotating cursor of the enforcer would only check the first 2 items
+    rows = [1, 2] + ["x"] * 98
+    assert "`a[" in error(rotated, rows)
+    assert "b[99]" in error(rotated, [], [1] * 99 + ["x"])
+except:
+    success_6 = False
+
+
+# --- Test 7: Raised policy violations reset the backoff (strict) ---
+@type_enforced.Enforcer(backoff_after=2, call_sample_rate=0.5)
+def strict(rows: Annotated[list[int], Sample(100)]):
+    return None
+
+
+success_7 = True
+try:
+    for _ in range(4):
+        strict([1])
+    assert strict.__call_interval__ == 2
+    raised = False
+    for _ in range(2):
+        raised = raised or error(strict, ["x"]) is not None
+    assert raised
+    assert strict.__call_interval__ == 1
+except:
+    success_7 = False
+
+if all(
+    [
+        success_1,
+        success_2,
+        success_3,
+        success_4,
+        success_5,
+        success_6,
+        success_7,
+    ]
+):
+    print("test_fn_42.py passed")
+else:
+    print("test_fn_42.py failed")
@@ -0,0 +1,88 @@
+from typing import TypedDict
+import type_enforced
+from type_enforced import Policy
+from type_enforced.utils import get_type_dict_depth, truncate_type_dict
+
+
+class Item(TypedDict):
+    tags: list[str]
+
+
+Payload = dict[str, list[dict[str, list[int]]]]
+
+
+@type_enforced.Enforcer(max_depth=1)
+def shallow(
+    a: Payload, b: int, c: tuple[int, list[int]] | tuple[str]
+) -> list[list[int]]:
+    return [["not checked"]]
+
+
+@type_enforced.Enforcer(
+    max_depth=0, param_policies={"items": Policy(max_depth=1)}
+)
+def mixed(payload: Payload, items: list[Item]) -> None:
+    return None
+
+
+def error(fn, *args):
+    try:
+        fn(*args)
+    except TypeError as exception:
+        return str(exception)
+    return None
+
+
+# --- Test 1: Items are only validated down to the max depth ---
+success_1 = True
+try:
+    shallow({"a": [{"b": ["x"]}]}, 1, (1, ["x"]))
+    shallow({"a": [1]}, 1, ("x",))
+    assert "a['a']" in error(shallow, {"a": {"b": 1}}, 1, ("x",))
+    assert "a.key[1]" in error(shallow, {1: []}, 1, ("x",))
+    assert "c[1]" in error(shallow, {}, 1, (1, "x"))
+    assert "`b`" in error(shallow, {}, "1", ("x",))
+except:
+    success_1 = False
+
+# --- Test 2: Per parameter depths and TypedDicts ---
+success_2 = True
+try:
+    mixed({"a": "not checked"}, [{"unknown": 1}])
+    assert "`payload`" in error(mixed, [], [])
+    assert "items[0]" in error(mixed, {}, ["not a dict"])
+except:
+    success_2 = False
+
+# --- Test 3: The skipped depth is reported in stats ---
+success_3 = True
+try:
+    assert type_enforced.get_stats(shallow)["skipped_depth"] == {
+        "a": 3,
+        "c": 1,
+        "return": 1,
+    }
+    assert type_enforced.get_stats(mixed)["skipped_depth"] == {
+        "payload": 4,
+        "items": 2,
+    }
+except:
+    success_3 = False
+
+# --- Test 4: Truncation copies the parsed type ---
+success_4 = True
+try:
+    parsed = type_enforced.enforcer._checker.__get_checkable_type__(Payload)
+    assert get_type_dict_depth(parsed) == 4
+    truncated = truncate_type_dict(parsed, 2)
+    assert get_type_dict_depth(truncated) == 2
+    assert truncated[dict][1][list] == {dict: None}
+    assert get_type_dict_depth(parsed) == 4
+    assert truncate_type_dict(parsed, 0) == {dict: None}
+except:
+    success_4 = False
+
+if all([success_1, success_2, success_3, success_4]):
+    print("test_fn_43.py passed")
+else:
+    print("test_fn_43.py failed")
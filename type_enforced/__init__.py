@@ -35,6 +35,7 @@ def my_fn(a: int , b: int | str =2, c: int =3) -> None:
 - Note: `strict=True` by default if not specified. You can set `strict=False` to disable exceptions being raised when type checking fails. Instead, a warning will be printed to the console.
 - Note: `clean_traceback=True` by default if not specified. This modifies the excepthook temporarily when a type exception is raised such that only the relevant stack (stack items not from type_enforced) is shown.
 - Note: `iterable_sample_pct=100` by default if not specified. You can set this to a value between 0 and 100 to only check a sample of items in typed iterables (list, dict, set, variable-length tuple). Lower values improve performance for large iterables at the cost of reduced type checking coverage.
+- Note: `deep_records=False` by default if not specified. You can set this to `True` to also validate the field types of dataclass and NamedTuple instances, including when they are nested inside containers (e.g. `list[Point]`).
 
 ## Getting Started
 
@@ -47,6 +48,45 @@ def my_fn(a: int , b: int | str =2, c: int =3) -> None:
 - `clean_traceback` (True): A boolean to enable or disable cleaning of tracebacks. If `True`, modifies the excepthook temporarily such that only the relevant stack (not in the type_enforced package) is shown.
 - `iterable_sample_pct` (100): An integer percentage (0-100) to control how many items in iterables are checked during type enforcement. If 100, all items are checked. If less than 100, a random sample is checked. If 0, only the first item is checked.
     - Note: Lower values improve performance for large iterables but reduce type checking coverage.
+- `sampler` ("random"): The strategy used to pick the sampled items when `iterable_sample_pct` is less than 100.
+    - `"random"`: Uniformly random items. Dict keys and set items are copied into a list before sampling.
+    - `"stride"`: Evenly spaced items with no random number generator, so the same items are always checked for the same input.
+    - `"edge"`: Items at the start and end only. Only the sampled keys of a dict or set are visited, so the cost does not depend on the size of the dict or set.
+    - Note: You can also pass a sampler instance from `type_enforced.sampling` (e.g. `RandomSampler(seed=0)` for reproducible samples while debugging).
+- `iterable_sample_k` (None): If set, a constant number of items is checked per typed iterable regardless of its size (overriding `iterable_sample_pct` and `sampler`).
+    - A cursor is kept per annotation and advanced by `k` items on every check, so repeated calls sweep every position of the iterable.
+    - Note: Lists and tuples are sampled by index, so their cost does not depend on their size. Dicts and sets have no random access, so their keys are walked up to the cursor (dicts from the nearer end), which costs up to half (dicts) or all (sets) of their items per check.
+    - Note: The achieved coverage can be monitored with `type_enforced.get_stats(my_fn)` (returns `samples`, `items_checked`, `full_sweeps` and `coverage`).
+- `max_validation_us` (None): A time budget (in microseconds) for validating the inputs (and separately the return value) of each function or method call.
+    - The items of iterables (at any nesting depth) are validated in chunks that are charged to the budget, and the clock is checked once every 256 charged items. Once the budget is spent, the remaining items are skipped.
+    - Note: Top level type checks (e.g. that `a` is a `list`) always run. Only the validation of the items inside iterables is cut short.
+    - Note: `type_enforced.get_stats(my_fn)` returns the number of budgeted `validations` and how many of them were `truncated` so you can tune the budget.
+- `target_overhead` (None): If set, the validation overhead is kept near this fraction of the function's own runtime (e.g. `0.05` for 5%) by adjusting `iterable_sample_pct` automatically.
+    - One in every 16 calls is timed and the sample percentage is scaled (by at most a factor of 2) towards the target, within `sample_pct_bounds` (default `(1, 100)`).
+    - Note: `iterable_sample_pct` is the starting sample percentage. `type_enforced.get_stats(my_fn)` returns the current `sample_pct` and the last measured `overhead` for monitoring.
+    - Note: Top level type checks always run, so the overhead of very cheap functions can stay above the target even at the lowest sample percentage.
+    - Note: With `call_sample_rate` or `backoff_after`, one in every 16 validated calls is timed (skipped calls are not counted).
+- `call_sample_rate` (1): The fraction of calls that are validated (e.g. `0.01` validates one in every 100 calls). Skipped calls only decrement a counter and call the wrapped function directly.
+    - Note: The first call is always validated.
+- `backoff_after` (None): If set, every call is validated at first. The interval between validated calls doubles after each streak of `backoff_after` passing validated calls, down to `call_sample_rate`. Any violation snaps back to validating every call.
+    - Note: `type_enforced.get_stats(my_fn)` returns the number of `checked_calls` and `skipped_calls` and the current `call_sample_rate`.
+- `shadow` (False): Enables shadow mode. Inputs that are iterables with at least `shadow_min_size` (1000) items are only checked inline with the first item of each (nested) iterable. Their full validation is queued to a background thread which reports violations as warnings (like `strict=False`).
+    - Note: The background validation checks every item, even if `iterable_sample_pct` or `iterable_sample_k` sample the items of other inputs.
+    - Note: The worker queue is bounded (1024 jobs by default). If it is full, the validation is dropped instead of blocking the call. You can pass your own `type_enforced.shadow.ShadowWorker(maxsize=...)` instead of `True`.
+    - Note: Set `shadow_snapshot=True` to queue a shallow copy of each shadowed input so that changes made to it after the call do not affect the queued validation.
+    - Note: `type_enforced.get_stats(my_fn)` returns the number of `shadow_queued` and `shadow_dropped` validations and the `shadow_violations` found by the worker.
+- `deep_records` (False): A boolean to enable validation of the fields of dataclass and NamedTuple instances. If `False`, only the class of these instances is checked. If `True`, each field is validated against its annotation, including for instances nested in containers.
+    - Note: The parsed fields are cached on each record class (as `__type_enforced_fields__`) so they are only parsed once.
+    - Note: Batches of records of the exact same class (e.g. `list[Point]`) are validated field by field in a single pass.
+- `bind_typevars` (False): A boolean to bind each constrained TypeVar (e.g. `AnyStr`) to the constraint matched by the first argument that uses it. Later arguments and the return value that use the same TypeVar must then match the same constraint (e.g. `concat("a", b"b")` fails for `def concat(a: AnyStr, b: AnyStr) -> AnyStr`).
+    - Note: Bound and unconstrained TypeVars are not bound across a call since subclasses of the first argument's type would be valid as well.
+- `max_depth` (None): If set, the items of containers are only validated down to this many levels of nesting. Containers below this depth are only checked with `isinstance`, which gives a predictable cost for deeply nested payloads.
+    - e.g. `max_depth=1` for `dict[str, list[dict[str, int]]]` validates that the keys are `str` and the values are `list`, but not the items of each list. `max_depth=0` only checks the top level type of each parameter.
+    - Note: TypedDict values and the fields of records (`deep_records=True`) count as one level of nesting.
+    - Note: The parsed types are truncated once when the function is first called, so there is no extra cost per call.
+    - Note: `type_enforced.get_stats(my_fn)` returns the number of levels that are not validated for each parameter as `skipped_depth` (`inf` for recursive types).
+    - Note: Use `type_enforced.Policy(max_depth=...)` to override the depth of a single parameter (see [Per parameter policies](#per-parameter-policies)).
+- `param_policies` (None): A dict of parameter names (including `"return"`) to a `type_enforced.Policy` that overrides the validation options for that parameter only (see [Per parameter policies](#per-parameter-policies)).
 
 `type_enforcer` currently supports many single and multi level python types. This includes class instances and classes themselves. For example, you can force an input to be an `int`, a number `int | float`, an instance of the self defined `MyClass`, or a even a vector with `list[int]`. Items like `typing.List`, `typing.Dict`, `typing.Union` and `typing.Optional` are supported.
 
@@ -56,6 +96,10 @@ Nesting is allowed as long as the nested items are iterables (e.g. `typing.List`
 
 Variables without an annotation for type are not enforced.
 
+Functions and methods whose parameters are all annotated with plain classes (e.g. `int`, `str | None` or `MyClass`) remember up to 64 argument type signatures that passed validation. Later calls with the same argument types (and keyword names) are accepted with a single lookup instead of one check per parameter. `type_enforced.get_stats(my_fn)` returns the `signature_hits` and `signature_misses` of this cache.
+
+Instances of subclasses and of ABCs (e.g. `collections.abc.Mapping` or `numbers.Number`) pass validation like with `isinstance`. Iterables of subclass instances (e.g. `bool` items for `list[int]`) only check each distinct item type once, and the verdicts of ABC checks are cached per concrete type (the cache is cleared whenever a class is registered with an ABC).
+
 ## Why use Type Enforced?
 
 - `type_enforced` is a pure python type enforcer that does not require any special compiler or preprocessor to work.
@@ -88,11 +132,15 @@ Variables without an annotation for type are not enforced.
         - Each item refers to the positional type of each item in the tuple
         - Support for ellipsis (`...`) is supported if you only specify two types and the second is the ellipsis type
             - e.g. `tuple[int, ...]` or `tuple[int|str, ...]`
-        - Note: Unions between two tuples are not supported
-            - e.g. `tuple[int, str] | tuple[str, int]` will not work
+        - Unions of tuples are supported and dispatch on the length of the passed tuple
+            - e.g. `tuple[int, str] | tuple[str, int] | tuple[float, ...]`
+            - Only the tuple shapes with a matching length (and variable length shapes) are tried
     - Deeply nested types are supported too:
         - `dict[dict[int]]`
         - `list[set[str]]`
+    - Batches of flat records are validated column-wise for performance
+        - e.g. `list[tuple[int, str, float]]` (database rows) or `list[dict[str, int | str]]` (JSON records)
+        - Each column (or all keys and values) is validated in a single pass instead of validating each row separately
 - Many of the `typing` (package) functions and methods including:
     - Standard typing functions:
         - `List`
@@ -124,6 +172,28 @@ Variables without an annotation for type are not enforced.
     - `Callable`
         - Essentially creates a union of:
             - `staticmethod`, `classmethod`, `types.FunctionType`, `types.BuiltinFunctionType`, `types.MethodType`, `types.BuiltinMethodType`, `types.GeneratorType`
+    - `TypedDict`
+        - Validates that a passed dict has all required keys, no unexpected keys and that each value matches its field type.
+        - Supports `total=False`, `Required` and `NotRequired` (including with `Annotated` field types).
+        - Note: Required and allowed keys are precomputed so the keys of each passed dict are validated with a single set operation.
+        - Note: Unions of multiple `TypedDict`s pass if the passed dict matches any of them.
+            - Only the `TypedDict`s whose required and allowed keys match the keys of the passed dict are validated (the matches are cached per key set), so wide unions of record types stay fast.
+        - Note: Unions with a generic dict (e.g. `dict[str, int] | Point`) pass if the passed dict matches the `TypedDict` or the generic dict.
+    - `Protocol`
+        - Protocols decorated with `typing.runtime_checkable` are checked structurally (like `isinstance`).
+        - Note: Types that define every protocol member on the class are cached per concrete type, so repeated checks only cost a dict lookup. Other types are checked per instance since the members could be instance attributes.
+        - Note: Protocols that are not `runtime_checkable` raise an exception since they can not be checked at runtime.
+    - `TypeVar`
+        - Constrained TypeVars (e.g. `TypeVar("N", int, float)` or `AnyStr`) are checked as a union of their constraints.
+        - Bound TypeVars (e.g. `TypeVar("T", bound=collections.abc.Sequence)`) are checked against their bound.
+        - Unconstrained TypeVars accept any value.
+        - Note: Set `bind_typevars=True` to also require every use of a constrained TypeVar in a call (including the return value) to match the same type (see Getting Started).
+    - Type aliases (`type` statements and `typing_extensions.TypeAliasType`)
+        - Recursive aliases are supported, e.g. `type JSON = dict[str, JSON] | list[JSON] | str | int | float | bool | None` validates arbitrarily nested JSON values.
+        - Generic aliases (e.g. `type Tree[T] = list[Tree[T]] | T` used as `Tree[int]`) are supported.
+        - Note: Each alias is parsed once into a graph whose recursive references point back to the parsed alias, so the annotation is never expanded infinitely.
+        - Note: Items of plain types (e.g. the `str` and `int` leaves of `JSON`) are accepted with a single type lookup. Only nested items are validated recursively.
+        - Note: Recursive references must be nested in a container (e.g. `type A = list[A] | int`). Aliases that are unions with themselves (e.g. `type A = B | int` and `type B = A | str`) raise an exception.
     - Note: Other functions might have support, but there are not currently tests to validate them
         - Feel free to create an issue (or better yet a PR) if you want to add tests/support
 - `Constraint` validation.
@@ -136,8 +206,43 @@ Variables without an annotation for type are not enforced.
     - Note: The constraint is checked after type checking occurs and operates independently of the type checking.
         - This operates differently than other checks (like `Literal`) and is evaluated post type checking.
         - For example, if you have an annotation of `str | Constraint(ge=0)`, this will always raise an exception since if you pass a string, it will raise on the constraint check and if you pass an integer, it will raise on the type check.
+    - Note: Constraints can also be attached with `typing.Annotated` (e.g. `Annotated[int, Constraint(ge=0)]`), which static type checkers accept.
+        - Annotated constraints only apply to values of the annotated type, so `Annotated[int, Constraint(ge=0)] | str` accepts any string.
+        - Each union member keeps its own constraints, so a value passes if it satisfies the constraints of any member that matches its type (e.g. `Annotated[int, Constraint(le=10)] | Annotated[int, Constraint(ge=100)]` accepts `5` and `200` but not `50`).
+        - They can be used at any position, e.g. `list[Annotated[float, Constraint(ge=0)]]` validates the constraint for each item.
+            - Note: The constraints that apply to each value are looked up by its type (the lookup is cached), so this is slightly slower than a union constraint (e.g. `list[float | Constraint(ge=0)]`). See the feature benchmarks.
+        - Note: Metadata other than constraints is ignored.
     - Note: See the example below or technical [constraint](https://connor-makowski.github.io/type_enforced/type_enforced/utils.html#Constraint) and [generic constraint](https://connor-makowski.github.io/type_enforced/type_enforced/utils.html#GenericConstraint) docs for more information.
 
+## Per parameter policies
+
+The sampling options of an enforcer apply to every parameter by default. A `type_enforced.Policy` overrides them for a single parameter (or the return value), so each parameter can be checked at its own cost level:
+
+- `type_enforced.Sample(iterable_sample_pct=None, sampler=None, k=None)`: Samples the typed iterables of the parameter (see `iterable_sample_pct`, `sampler` and `iterable_sample_k` above).
+- `type_enforced.Skip`: Skips the validation of the parameter entirely.
+- `type_enforced.Policy(iterable_sample_pct=None, sampler=None, iterable_sample_k=None, max_depth=None, skip=False)`: Any combination of the above and a `max_depth` for the parameter.
+
+Policies can be attached to an annotation with `typing.Annotated` or passed to the enforcer with `param_policies` (which take precedence):
+```py
+from typing import Annotated
+import type_enforced
+
+@type_enforced.Enforcer
+def load(config: dict[str, int], rows: Annotated[list[dict[str, int]], type_enforced.Sample(1)]) -> Annotated[list[int], type_enforced.Skip]:
+    ...
+
+# The same policies without annotations
+@type_enforced.Enforcer(param_policies={"rows": type_enforced.Sample(1), "return": type_enforced.Skip})
+def load(config: dict[str, int], rows: list[dict[str, int]]) -> list[int]:
+    ...
+```
+
+- Note: Only policies in the top level `Annotated` of a parameter are used.
+- Note: Names in `param_policies` that are not parameters of a wrapped function or method are ignored, so a single dict can be used when wrapping a class.
+- Note: Parameters whose sample percentage is set by a policy keep it when `target_overhead` adjusts the sample percentage of the enforcer, and are not queued in shadow mode.
+- Note: On enforcers with `iterable_sample_k`, policies that set a sample percentage or a sampler (but no `k`) use the default (`random`) sampler and sample percentage for any option they do not set.
+- Note: Parameters with their own sampler (e.g. `Sample(k=10)`) report their sampling stats under `params` in `type_enforced.get_stats(my_fn)`.
+
 ## Interactive Example
 
 ```py
@@ -229,6 +334,55 @@ class my_class:
     bar: str
 ```
 
+- Note: The generated dataclass `__init__` is replaced by a fused `__init__` that validates each field argument with inlined checks and then calls the original `__init__` (so `__post_init__` only runs with validated arguments).
+    - This avoids the generic method wrapper overhead on every object construction.
+    - Fields with a `default_factory`, `frozen=True`, `slots=True` and `__post_init__` are all supported.
+    - See the [feature benchmarks](https://github.com/connor-makowski/type_enforced/blob/main/benchmark_features.md) for construction costs compared to plain dataclasses.
+
+Use `type_enforced.replace` (or `copy.replace` in python >= 3.13) to create a modified copy of an enforced dataclass instance. Only the changed fields are validated since all other fields were validated when the original instance was created.
+
+- Note: `dataclasses.replace` still works, but validates every field again.
+
+You can also validate field assignments on (non frozen) enforced dataclasses with `validate_assignment=True`.
+
+```py
+import type_enforced
+from dataclasses import dataclass
+
+@type_enforced.Enforcer(validate_assignment=True)
+@dataclass
+class Job:
+    rows: list[int]
+    status: str
+
+job = Job(rows=list(range(1000000)), status="pending")
+done = type_enforced.replace(job, status="done") # Only `status` is validated
+job.status = "running" # Passes
+job.status = 1 # Raises TypeError
+```
+
+Properties on enforced classes are enforced too (the getter return type and the setter value type). For plain attributes that need to be validated on every assignment, you can use the `Typed` descriptor instead of a property.
+- Note: If the class (or a base class) declares a `_<name>` slot in `__slots__`, the value is stored in that slot. Otherwise it is stored in the instance `__dict__`.
+    - Note: Classes with `__slots__` but without the `_<name>` slot (or `__dict__`) raise a `TypeError` when they are created.
+- Note: `Typed` checks simple types with a single `isinstance` call, so it is cheaper than a property setter.
+
+```py
+from type_enforced import Typed
+
+class Point:
+    __slots__ = ("_x", "_y")
+    x = Typed[int]
+    y = Typed[int | float]
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+point = Point(1, 2.5)
+point.x += 1 # Passes
+point.x = "3" # Raises TypeError
+```
+
 You can skip enforcement if you add the argument `enabled=False` in the `Enforcer` call.
 - This is useful for a production vs debugging environment.
 - This is also useful for undecorating a single method in a larger wrapped class.
@@ -282,6 +436,23 @@ rgb_test('red') # Passes
 rgb_test('yellow') # Fails
 ```
 
+Constraints can also be attached with `typing.Annotated`, which is understood by static type checkers. Annotated constraints only apply to values of the annotated type (even in unions) and can be used inside containers:
+```py
+from typing import Annotated
+import type_enforced
+from type_enforced.utils import Constraint
+
+NonNegative = Annotated[float, Constraint(ge=0)]
+
+@type_enforced.Enforcer()
+def total(prices: list[NonNegative], discount: NonNegative | None = None) -> float:
+    return sum(prices) - (discount or 0)
+
+total([1.0, 2.5]) # Passes
+total([1.0, -2.5]) # Fails
+total([1.0], discount=-1.0) # Fails
+```
+
 
 
 ## Validate class instances and classes
@@ -307,7 +478,7 @@ y=my_class(Foo) # Fails!
 
 Notice how an initialized class instance `Foo()` must be passed for the enforcer to not raise an exception.
 
-To enforce an uninitialized class object use `typing.Type[classHere]` on the class to enforce inputs to be an uninitialized class:
+To enforce an uninitialized class object use `typing.Type[classHere]` (or `type[classHere]`) on the class to enforce inputs to be an uninitialized class:
 ```py
 import type_enforced
 import typing
@@ -327,7 +498,7 @@ x=my_class(Foo()) # Fails
 
 By default, type_enforced will check for subclasses of a class when validating types. This means that if you pass a subclass of the expected class, it will pass the type check.
 
-Note: Uninitialized class objects that are passed are not checked for subclasses.
+This also applies to uninitialized class objects: a subclass of `Foo` passes a `typing.Type[Foo]` check (like `issubclass`). The verdict for each passed class is cached, so passing classes on every call (e.g. to a plugin registry) stays cheap.
 
 ```py
 import type_enforced
@@ -348,6 +519,98 @@ def my_fn(custom_class: Foo):
 my_fn(Foo()) # Passes as expected
 my_fn(Bar()) # Passes as expected
 my_fn(Baz()) # Raises TypeError as expected
+
+@type_enforced.Enforcer
+def my_other_fn(custom_class: type[Foo]):
+    pass
+
+my_other_fn(Bar) # Passes as expected
+my_other_fn(Baz) # Raises TypeError as expected
+```
+
+## Validate values without a function
+
+You can validate a value against any supported annotation without decorating a function using `type_enforced.check` and `type_enforced.is_valid`.
+
+- `check(value, annotation)` raises a `TypeError` (with the same message as the `Enforcer`) if the value does not match the annotation.
+- `is_valid(value, annotation)` returns `True` or `False` and never raises for a type mismatch.
+    - This stops at the first failure without building an error message, making it well suited for filtering large volumes of data (e.g. messages off a queue).
+- Note: Parsed annotations are cached globally (up to 256 annotations, then the cache is reset), so repeated checks against the same annotation only pay for the validation itself.
+
+```py
+import type_enforced
+
+type_enforced.check({'a': 1}, dict[str, int]) # Passes
+type_enforced.check({'a': '1'}, dict[str, int]) # Raises TypeError
+
+type_enforced.is_valid([1, 2, 3], list[int]) # True
+type_enforced.is_valid([1, '2', 3], list[int]) # False
+```
+
+## Request scoped sampling
+
+Per function sampling (e.g. `call_sample_rate`) means a single request can be validated in some functions and not in others. To decide once per request (or task) whether every enforced function it calls is validated, use `type_enforced.sampling_scope` at the request boundary.
+
+- The decision is stored in a `contextvars.ContextVar`, so each thread and asyncio task has its own scope.
+    - Tasks created inside a scope inherit it, but threads do not (use `contextvars.copy_context().run` to carry a scope into a thread).
+- Nested scopes keep the decision of the outermost scope.
+- Inside a validated scope, every call is validated (`call_sample_rate` is bypassed). Inside a skipped scope, every enforced function and method calls the wrapped function directly.
+- Note: Checking the scope costs a single `ContextVar.get` per call.
+
+```py
+import type_enforced
+
+@type_enforced.Enforcer
+def my_fn(a: int) -> None:
+    pass
+
+def handle_request(request):
+    with type_enforced.sampling_scope(rate=0.01) as validated:
+        my_fn(a=request)  # Validated in 1% of requests (when `validated` is True)
+
+# sampling_scope can also decorate a request handler
+@type_enforced.sampling_scope(rate=0.01)
+def handle_other_request(request):
+    my_fn(a=request)
+```
+
+To skip redundant checks in a hot inner loop whose arguments were already validated at the loop boundary, use `type_enforced.suppressed`. Every enforced function and method called inside it calls the wrapped function directly and enforced dataclasses skip field validation (for the current thread or asyncio task only).
+
+```py
+import type_enforced
+
+@type_enforced.Enforcer
+def scale(x: float, factor: float) -> float:
+    return x * factor
+
+@type_enforced.Enforcer
+def scale_all(values: list[float], factor: float) -> list[float]:
+    with type_enforced.suppressed():
+        return [scale(value, factor) for value in values]
+```
+
+## Toggle enforcers at runtime
+
+Every function, method and dataclass wrapped by `type_enforced.Enforcer` is registered so that it can be disabled and re-enabled at runtime without redecorating anything (e.g. to turn off checks for a hot module in production).
+
+- `type_enforced.disable(pattern="*")` and `type_enforced.enable(pattern="*")` toggle every enforcer whose `module.qualname` matches a `fnmatch` style pattern and return the number of matching enforcers.
+- `type_enforced.get_enforcers(pattern="*")` returns a dict of `module.qualname` to the enabled state of each matching enforcer.
+- Disabled enforcers call the wrapped function directly. Functions defined as module globals or class attributes are also rebound to the original function, so calls through those names have no overhead at all.
+    - Note: References held elsewhere (e.g. `from my_module import my_fn`) still point to the (disabled) enforcer, which costs a single attribute check per call.
+- Disabled dataclasses get their original `__init__` and `__setattr__` back (registered under the `module.qualname` of the class).
+- When python runs with `-O` (`__debug__` is False), `Enforcer` returns the original function, method or class unchanged. The enforcers are still registered (disabled) and can be enabled with `type_enforced.enable`.
+
+```py
+import type_enforced
+
+@type_enforced.Enforcer
+def my_fn(a: int) -> None:
+    pass
+
+type_enforced.disable("__main__.*") # Returns 1
+my_fn(a="1") # Passes (`my_fn` is the original function again)
+type_enforced.enable("__main__.my_*") # Returns 1
+my_fn(a="1") # Raises TypeError
 ```
 
 ## What changed in 2.0.0?
@@ -363,8 +626,8 @@ The main changes in version 2.0.0 revolve around migrating towards the standard
     - Each item refers to the positional type of each item in the tuple.
     - Support for ellipsis (`...`) is supported if you only specify two types and the second is the ellipsis type.
         - For example, `tuple[int, ...]` or `tuple[int|str, ...]` are valid types.
-    - Note: Unions between two tuples are not supported.
-        - For example, `tuple[int, str] | tuple[str, int]` will not work.
+    - Note: Unions between two tuples were not supported in 2.0.0.
+        - For example, `tuple[int, str] | tuple[str, int]` is now supported (see Supported Type Checking Features).
 - Constraints and Literals can now be stacked with unions.
     - For example, `int | Constraint(ge=0) | Constraint(le=5)` will require any passed values to be integers that are greater than or equal to `0` and less than or equal to `5`.
     - For example, `Literal['a', 'b'] | Literal[1, 2]` will require any passed values that are equal (`==`) to `'a'`, `'b'`, `1` or `2`.
@@ -430,4 +693,16 @@ Make sure Docker is installed and running.
     - `./utils/test.sh`
 - Prettify Code
     - `./utils/prettify.sh`"""
-from .enforcer import Enforcer, FunctionMethodEnforcer
+from .enforcer import (
+    Enforcer,
+    FunctionMethodEnforcer,
+    DataclassEnforcer,
+    check,
+    is_valid,
+    replace,
+    get_stats,
+)
+from .typed import Typed
+from .context import sampling_scope, suppressed
+from .registry import enable, disable, get_enforcers
+from .policy import Policy, Sample, Skip
@@ -0,0 +1,87 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# The validation mode of the current context (thread or asyncio task):
+# - None: Enforcers validate calls as configured
+# - True: Every call is validated (call sampling is bypassed)
+# - False: No call is validated (a skipped `sampling_scope` or `suppressed`)
+_scope = ContextVar("type_enforced_scope", default=None)
+
+
+@contextmanager
+def sampling_scope(rate=1):
+    """
+    A context manager (or decorator) that decides once whether every enforced function and
+    method called inside it is validated or skipped.
+
+    This is meant to be used at a request (or task) boundary so that a sampled request is
+    validated in every enforced function it touches, which makes violations reproducible and
+    avoids paying for partial checks of skipped requests.
+
+    - Note: The decision is stored in a `contextvars.ContextVar`, so each thread and asyncio task
+        has its own scope. Tasks created inside a scope inherit it, but threads do not (use
+        `contextvars.copy_context().run` to carry a scope into a thread).
+    - Note: Nested scopes keep the decision of the outermost scope.
+    - Note: Inside a validated scope, call level sampling (`call_sample_rate`) is bypassed.
+    - Note: Checking the scope costs a single `ContextVar.get` per call.
+
+    Optional:
+
+    - `rate`:
+        - What: The probability (0-1) that the scope is validated.
+        - Type: int | float
+        - Default: 1
+
+    Example Use:
+    ```
+    >>> import type_enforced
+    >>> @type_enforced.Enforcer
+    ... def my_fn(a: int) -> None:
+    ...     pass
+    ...
+    >>> with type_enforced.sampling_scope(rate=0.01) as validated:
+    ...     my_fn(a="1")  # Only raises if this scope was sampled (validated is True)
+    ```
+    """
+    validated = _scope.get()
+    if validated is None:
+        validated = random.random() < rate
+    token = _scope.set(validated)
+    try:
+        yield validated
+    finally:
+        _scope.reset(token)
+
+
+@contextmanager
+def suppressed():
+    """
+    A context manager (or decorator) that skips the validation of every enforced function and
+    method called inside it.
+
+    This is meant for hot inner loops whose arguments were already validated at the loop
+    boundary (e.g. by an enforced function that contains the loop).
+
+    - Note: Like `sampling_scope`, suppression is stored in a `contextvars.ContextVar`, so it only
+        applies to the current thread or asyncio task (and tasks created inside it).
+    - Note: Suppression takes precedence over any enclosing `sampling_scope` until the block exits.
+    - Note: Checking for suppression costs a single `ContextVar.get` per call.
+
+    Example Use:
+    ```
+    >>> import type_enforced
+    >>> @type_enforced.Enforcer
+    ... def my_fn(a: int) -> int:
+    ...     return a
+    ...
+    >>> with type_enforced.suppressed():
+    ...     my_fn(a="1")  # Not validated
+    '1'
+    ```
+    """
+    token = _scope.set(False)
+    try:
+        yield
+    finally:
+        _scope.reset(token)
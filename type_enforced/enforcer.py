@@ -6,60 +6,177 @@ from types import (
     BuiltinMethodType,
     UnionType,
 )
-from typing import Type, Union, Sized, Literal, Callable, get_type_hints, Any
+from typing import (
+    Type,
+    Union,
+    Sized,
+    Literal,
+    Callable,
+    get_type_hints,
+    is_typeddict,
+    Any,
+    TypeVar,
+    Protocol,
+    Annotated,
+    Required,
+    NotRequired,
+    get_origin,
+)
+import typing
 from functools import update_wrapper
 from type_enforced.utils import (
     Partial,
     GenericConstraint,
     iterable_types,
     merge_type_dicts,
+    truncate_type_dict,
+    get_type_dict_depth,
+)
+from type_enforced.sampling import get_sampler, RotatingSampler
+from type_enforced.context import _scope
+from type_enforced.shadow import get_worker
+from type_enforced.registry import _enforcers
+from type_enforced.policy import Policy
+import sys, traceback, copy
+from time import perf_counter_ns
+from itertools import chain, islice, count
+from operator import attrgetter
+from dataclasses import (
+    is_dataclass,
+    fields as dataclass_fields,
+    replace as dataclass_replace,
+    MISSING,
 )
-import sys, traceback, random
 from pathlib import Path
+from abc import ABCMeta, get_cache_token
+from inspect import Parameter, signature as get_signature
 
 _NoneType = type(None)
+_missing = object()
+# The number of items validated between clock checks when a validation budget is set
+_budget_chunk_size = 256
+# Adaptive enforcers measure the validation overhead of one in every `_adaptive_interval` calls
+_adaptive_interval = 16
+# The maximum number of argument type signatures remembered per enforcer
+_signature_cache_size = 64
+# The maximum number of concrete types with a cached `isinstance` verdict per parsed type
+_verdict_cache_size = 64
+# The maximum number of key sets with cached candidates per union of TypedDicts
+_union_table_size = 64
+# The maximum number of annotations with a cached parsed type for `check` and `is_valid`
+_checkable_type_cache_size = 256
 _package_path = Path(__file__).parent.resolve()
 
 
-class FunctionMethodEnforcer:
+_ProtocolMeta = type(Protocol)
+# Marks concrete types whose protocol verdict depends on the instance (see `__is_instance__`)
+_instance_dependent = object()
+
+
+def _get_protocol_attrs(protocol):
+    """
+    Returns the names of the members of a Protocol class.
+    """
+    attrs = getattr(protocol, "__protocol_attrs__", None)
+    if attrs is None:
+        attrs = typing._get_protocol_attrs(protocol)
+    return attrs
+
+
+def _is_type_alias(annotation):
+    """
+    Returns True if `annotation` is a `type` statement alias (`typing.TypeAliasType`) or its
+    `typing_extensions` backport.
+    """
+    return type(annotation).__name__ == "TypeAliasType" and hasattr(
+        annotation, "__value__"
+    )
+
+
+def _get_alias_value(alias, args=()):
+    """
+    Returns the value of a type alias with any string forward references resolved in the module
+    of the alias and its type parameters substituted with `args`.
+    """
+    value = alias.__value__
+    type_params = getattr(alias, "__type_params__", ()) or ()
+    if isinstance(value, str):
+        value = typing.ForwardRef(value)
+    localns = {param.__name__: param for param in type_params}
+    globalns = getattr(sys.modules.get(alias.__module__), "__dict__", {})
+    if sys.version_info >= (3, 13):
+        value = typing._eval_type(value, globalns, localns, type_params=())
+    else:
+        value = typing._eval_type(value, globalns, localns)
+    if args:
+        if len(args) != len(type_params):
+            raise TypeError(
+                f"Type alias `{alias.__name__}` expects {len(type_params)} type arguments, got: {args}"
+            )
+        if len(type_params) == 1 and value in type_params:
+            return args[0]
+        value = value[args]
+    return value
+
+
+def _get_expected_names(expected):
+    """
+    Returns the expected types of a parsed type for error messages, showing the classes of
+    `Type[X]` annotations as `typing.Type[X]`.
+    """
+    names = []
+    for key, value in expected.items():
+        if key is type and value is not None:
+            classes = tuple(cls for cls in value if isinstance(cls, type))
+            names.append(Type[Union[classes]] if classes else key)
+        else:
+            names.append(key)
+    return names
+
+
+class TypeChecker:
     __slots__ = (
-        "__fn__",
         "__strict__",
         "__clean_traceback__",
         "__iterable_sample_pct__",
-        "__outer_self__",
-        "__fn_defaults__",
-        "__fn_varnames__",
-        "__types_parsed__",
-        "__checkable_types__",
-        "__return_type__",
-        "__simple_types__",
-        "__complex_types__",
-        "__simple_return_type__",
-        "__param_indices__",
+        "__sampler__",
+        "__deep_records__",
+        "__silent__",
+        "__max_validation_ns__",
+        "__deadline__",
+        "__budget_countdown__",
+        "__stats__",
+        "__violations__",
         "__flat_subtypes__",
-        "__wrapped__",
-        "__name__",
+        "__leaf_subtypes__",
+        "__record_plans__",
+        "__typeddict_plans__",
+        "__verdicts__",
+        "__verdict_token__",
+        "__class_verdicts__",
+        "__union_tables__",
+        "__alias_types__",
+        "__annotated_constraints__",
+        "__silent_checker__",
         "__qualname__",
-        "__doc__",
-        "__dict__",
     )
 
     def __init__(
         self,
-        __fn__,
-        __strict__=False,
+        __strict__=True,
         __clean_traceback__=True,
         __iterable_sample_pct__=100,
+        __sampler__=None,
+        __deep_records__=False,
+        __silent__=False,
+        __max_validation_us__=None,
+        __qualname__="check",
     ):
         """
-        Initialize a FunctionMethodEnforcer class object as a wrapper for a passed function `__fn__`.
-
-        Requires:
+        Initialize a TypeChecker class object that can parse type annotations and validate objects against them.
 
-            - `__fn__`:
-                - What: The function to enforce
-                - Type: function | method | class
+        This holds all of the type parsing and validation machinery used by `FunctionMethodEnforcer`
+        and by the standalone `check` and `is_valid` functions.
 
         Optional:
 
@@ -68,141 +185,204 @@ class FunctionMethodEnforcer:
                     when type checking fails. If False, exceptions will not be raised but instead a warning
                     will be printed to the console.
                 - Type: bool
-                - Default: False
+                - Default: True
             - `__clean_traceback__`:
                 - What: A boolean to enable or disable cleaning of tracebacks when raising exceptions.
                 - Type: bool
                 - Default: True
             - `__iterable_sample_pct__`:
-                - What: The percentage of items to sample when validating iterables. If 100, all items
-                    are validated. If less than 100, the first and last items are always validated
-                    plus a random sample of the remaining items up to the specified percentage.
+                - What: The percentage of items to sample when validating iterables.
                 - Type: int | float
                 - Default: 100
+            - `__sampler__`:
+                - What: The strategy used to pick the sampled items when `__iterable_sample_pct__` is less than 100.
+                - Type: Sampler | str | None
+                - Default: None (the shared unseeded `RandomSampler`)
+                - Note: See `type_enforced.sampling` for the available strategies.
+            - `__deep_records__`:
+                - What: A boolean to enable validation of the field types of dataclass and NamedTuple
+                    instances (including when nested inside containers).
+                - Type: bool
+                - Default: False
+            - `__silent__`:
+                - What: A boolean to skip all failure reporting. If True, `__check_type__` returns False
+                    on the first failure without building an error message, printing or raising.
+                - Type: bool
+                - Default: False
+            - `__max_validation_us__`:
+                - What: A time budget (in microseconds) for each validation pass. Once the budget is spent,
+                    the items of iterables (at any depth) are no longer validated. See `__start_validation__`.
+                - Type: int | float | None
+                - Default: None (no budget)
+            - `__qualname__`:
+                - What: The name used to identify this checker in error messages.
+                - Type: str
+                - Default: "check"
         """
-        update_wrapper(self, __fn__)
-        self.__fn__ = __fn__
         self.__strict__ = __strict__
         self.__clean_traceback__ = __clean_traceback__
         self.__iterable_sample_pct__ = __iterable_sample_pct__
-        self.__outer_self__ = None
-        self.__types_parsed__ = False
-        self.__flat_subtypes__ = {}
-        # Validate that the passed function or method is a method or function
-        self.__check_method_function__()
-        # Get input defaults for the function or method
-        self.__get_defaults__()
+        self.__sampler__ = get_sampler(__sampler__)
+        self.__deep_records__ = __deep_records__
+        self.__silent__ = __silent__
+        self.__max_validation_ns__ = (
+            None
+            if __max_validation_us__ is None
+            else int(__max_validation_us__ * 1000)
+        )
+        self.__deadline__ = None
+        self.__budget_countdown__ = _budget_chunk_size
+        self.__violations__ = 0
+        self.__stats__ = (
+            {}
+            if __max_validation_us__ is None
+            else {"validations": 0, "truncated": 0}
+        )
+        self.__init_caches__()
+        self.__silent_checker__ = None
+        self.__qualname__ = __qualname__
 
-    def __get_defaults__(self):
+    def __init_caches__(self):
         """
-        Get the default values of the passed function or method and store them in `self.__fn_defaults__`.
-        Also caches the function's variable names for use in `__call__`.
+        Creates empty parsing and validation caches for this checker.
+
+        - Note: Twins share the caches of their checker (see `__get_twin__`). Twins that validate on
+            another thread (e.g. the shadow checker) call this to get their own caches.
         """
-        self.__fn_varnames__ = self.__fn__.__code__.co_varnames
-        self.__fn_defaults__ = {}
-        if self.__fn__.__defaults__ is not None:
-            # Get the names of all provided default values for args
-            default_varnames = list(self.__fn_varnames__)[
-                : self.__fn__.__code__.co_argcount
-            ][-len(self.__fn__.__defaults__) :]
-            # Update the output dictionary with the default values
-            self.__fn_defaults__.update(
-                dict(zip(default_varnames, self.__fn__.__defaults__))
-            )
-        if self.__fn__.__kwdefaults__ is not None:
-            # Update the output dictionary with the keyword default values
-            self.__fn_defaults__.update(self.__fn__.__kwdefaults__)
+        self.__flat_subtypes__ = {}
+        self.__leaf_subtypes__ = {}
+        self.__record_plans__ = {}
+        self.__typeddict_plans__ = {}
+        self.__verdicts__ = {}
+        self.__verdict_token__ = get_cache_token()
+        self.__class_verdicts__ = {}
+        self.__union_tables__ = {}
+        self.__alias_types__ = {}
+        self.__annotated_constraints__ = {}
 
-    def __get_sample_indices__(self, length):
+    def __get_sample_indices__(self, length, node):
         """
-        Get a sorted list of indices to sample for iterable validation.
+        Get a sorted iterable of indices to sample for sequence (list / tuple) validation.
 
         If iterable_sample_pct is 0, only the first item (index 0) is checked.
         Otherwise, always includes the first (0) and last (length-1) indices.
-        If length > 3, samples additional middle indices up to the
+        If length > 3, the sampler picks additional indices up to the
         iterable_sample_pct percentage.
         Only called when self.__iterable_sample_pct__ < 100.
         """
-        if length == 0:
-            return []
-        if self.__iterable_sample_pct__ == 0:
-            return [0]
-        if length <= 3:
-            return range(length)
-        n = max(3, int(length * self.__iterable_sample_pct__ / 100))
-        if n >= length:
-            return range(length)
-        middle_sample = random.sample(range(1, length - 1), n - 2)
-        return sorted([0] + middle_sample + [length - 1])
+        return self.__sampler__.__get_indices__(
+            length, self.__iterable_sample_pct__, node
+        )
 
-    def __get_sample_keys__(self, keys):
+    def __get_sample_keys__(self, obj, node):
         """
-        Get a sampled list of dict keys for iterable validation.
+        Get an iterable of sampled dict keys (or set items) for iterable validation.
 
         If iterable_sample_pct is 0, only the first key is returned.
-        Otherwise, always includes the first key plus a random sample of
-        the remaining keys up to the iterable_sample_pct percentage.
+        Otherwise, always includes the first key plus the keys picked by the
+        sampler up to the iterable_sample_pct percentage.
         Only called when self.__iterable_sample_pct__ < 100.
         """
-        if len(keys) == 0:
-            return []
-        if self.__iterable_sample_pct__ == 0 or len(keys) == 1:
-            return [keys[0]]
-        n = max(1, int(len(keys) * self.__iterable_sample_pct__ / 100))
-        if n >= len(keys):
-            return keys
-        return [keys[0]] + random.sample(keys[1:], n - 1)
+        return self.__sampler__.__get_keys__(
+            obj, self.__iterable_sample_pct__, node
+        )
 
-    def __get_checkable_types__(self):
+    def __get_stats__(self):
         """
-        Creates two class attributes:
+        Returns a dict of runtime statistics for this checker (see `type_enforced.get_stats`).
+        """
+        return {**self.__sampler__.__get_stats__(), **self.__stats__}
 
-        - `self.__checkable_types__`:
-            - What: A dictionary of all annotations as checkable types
-            - Type: dict
+    def __start_validation__(self):
+        """
+        Starts the validation budget for a validation pass (only called if `__max_validation_ns__` is set).
 
-        - `self.__return_type__`:
-            - What: The return type of the function or method
-            - Type: dict | None
+        While a budget is running, the items of every iterable (at any nesting depth) are validated
+        in chunks of up to `_budget_chunk_size` items and each chunk is charged to the budget before
+        it is validated (see `__is_over_budget__`). Once the budget is spent, the remaining items are
+        skipped (top level type checks always run).
         """
-        if not self.__types_parsed__:
-            self.__checkable_types__ = {
-                key: self.__get_checkable_type__(value)
-                for key, value in get_type_hints(self.__fn__).items()
-            }
-            self.__return_type__ = self.__checkable_types__.pop("return", None)
-            # Classify params: simple types can use a single
-            # isinstance call, skipping __check_type__ entirely.
-            self.__simple_types__ = {}
-            self.__complex_types__ = {}
-            for key, expected in self.__checkable_types__.items():
-                if (
-                    "__extra__" not in expected
-                    and all(v is None for v in expected.values())
-                    and all(isinstance(k, type) for k in expected.keys())
-                ):
-                    self.__simple_types__[key] = tuple(expected.keys())
-                else:
-                    self.__complex_types__[key] = expected
-            # Same classification for return type
-            if self.__return_type__ is not None and (
-                "__extra__" not in self.__return_type__
-                and all(v is None for v in self.__return_type__.values())
-                and all(
-                    isinstance(k, type) for k in self.__return_type__.keys()
-                )
-            ):
-                self.__simple_return_type__ = tuple(self.__return_type__.keys())
-            else:
-                self.__simple_return_type__ = None
-            # Pre-compute param index in co_varnames for
-            # direct arg lookup (skips assigned_vars dict).
-            self.__param_indices__ = {
-                name: i
-                for i, name in enumerate(self.__fn_varnames__)
-                if name in self.__checkable_types__
-            }
-            self.__types_parsed__ = True
+        self.__deadline__ = perf_counter_ns() + self.__max_validation_ns__
+        self.__budget_countdown__ = _budget_chunk_size
+        self.__stats__["validations"] += 1
+
+    def __is_over_budget__(self, items):
+        """
+        Charges `items` visited items to the validation budget of the current validation pass and
+        returns True if the budget is spent.
+
+        The clock is only checked once every `_budget_chunk_size` charged items (across all nested
+        iterables), so budgets stay cheap for many small iterables. The first time the budget is
+        spent in a validation pass, it is recorded as a truncated validation.
+        """
+        if not self.__deadline__:
+            # A deadline of 0 is always spent, but is not recorded again
+            return True
+        self.__budget_countdown__ -= items
+        if self.__budget_countdown__ > 0:
+            return False
+        self.__budget_countdown__ = _budget_chunk_size
+        if perf_counter_ns() < self.__deadline__:
+            return False
+        self.__stats__["truncated"] += 1
+        self.__deadline__ = 0
+        return True
+
+    def __check_budgeted__(self, values, subtype, key, labels=None):
+        """
+        Validates `values` against `subtype` in chunks until the validation budget is spent.
+
+        Nested iterables in each chunk are validated with their own budgeted chunks (or charged to the
+        budget by `__check_budgeted_records__`), so the budget is charged for the items visited at
+        every depth.
+
+        `labels` is an optional iterable (in the same order as `values`) of the objects (e.g. dict keys)
+        whose `repr` labels each item in error messages. If not passed, the item indices are used.
+        """
+        plan = self.__get_record_plan__(subtype)
+        values = iter(values)
+        labels = count() if labels is None else iter(labels)
+        while self.__deadline__:
+            chunk = list(islice(values, _budget_chunk_size))
+            if not chunk or self.__is_over_budget__(len(chunk)):
+                break
+            chunk_labels = list(islice(labels, len(chunk)))
+            if not self.__quick_check__(
+                subtype, chunk
+            ) and not self.__check_budgeted_records__(plan, subtype, chunk):
+                for label, item in zip(chunk_labels, chunk):
+                    if not self.__deadline__:
+                        # The budget was spent by the nested iterables of this chunk
+                        break
+                    if not self.__check_type__(
+                        item, subtype, f"{key}[{repr(label)}]"
+                    ):
+                        return False
+        return True
+
+    def __check_budgeted_records__(self, plan, subtype, chunk):
+        """
+        Validates a chunk of records column-wise (see `__record_check__`) while a validation budget
+        is running. `plan` is the record plan of `subtype` (or None).
+
+        Records that are iterables (e.g. the lists of `list[list[int]]`) are charged to the budget
+        for their nested items and are only validated column-wise if the chunk holds at most
+        `4 * _budget_chunk_size` nested items. Larger records are validated one by one so their
+        items are validated in budgeted chunks.
+
+        Returns True if every record is valid or if the budget is spent by the nested items.
+        """
+        if plan is None:
+            return False
+        if plan[1] in ("items", "mapping"):
+            if not set(map(type, chunk)).issubset(plan[0]):
+                return False
+            nested = sum(map(len, chunk))
+            if nested > 4 * _budget_chunk_size:
+                return False
+            if self.__is_over_budget__(nested):
+                return True
+        return self.__record_check__(subtype, chunk)
 
     def __get_checkable_type__(self, annotation):
         """
@@ -213,19 +393,63 @@ class FunctionMethodEnforcer:
         if annotation is None:
             return {_NoneType: None}
 
+        # Handle type aliases (e.g. `type JSON = dict[str, JSON] | list[JSON] | str`)
+        if _is_type_alias(annotation) or _is_type_alias(
+            getattr(annotation, "__origin__", None)
+        ):
+            return self.__get_alias_type__(annotation)
+
+        # Handle `typing.Annotated` (e.g. `Annotated[int, Constraint(ge=0)]`)
+        if get_origin(annotation) is Annotated:
+            return self.__get_annotated_type__(annotation)
+
+        # Handle `Required` and `NotRequired` TypedDict fields
+        # Note: Required keys are validated with the TypedDict plan (see `__get_typeddict_plan__`)
+        if get_origin(annotation) in (Required, NotRequired):
+            return self.__get_checkable_type__(annotation.__args__[0])
+
         # Handle `int | str` syntax (Python 3.10+) and Unions
         if (
             isinstance(annotation, UnionType)
             or getattr(annotation, "__origin__", None) == Union
         ):
             combined_types = {}
+            unconstrained = []
             for sub_type in annotation.__args__:
-                merge_type_dicts(
-                    combined_types,
-                    self.__get_checkable_type__(sub_type),
+                parsed = self.__get_checkable_type__(sub_type)
+                if not parsed:
+                    # Only type aliases that are still being parsed are empty
+                    self.__exception__(
+                        f"Recursive type aliases must be nested in a container (e.g. `list[...]`) when used in a union. Got: {annotation}",
+                        raise_exception=True,
+                    )
+                if "__annotated__" not in parsed.get("__extra__", ()):
+                    scope = self.__get_annotated_scope__(parsed)
+                    if scope is not None:
+                        unconstrained.append((scope, ()))
+                merge_type_dicts(combined_types, parsed)
+            # Members without `Annotated` constraints accept any value of their types
+            if unconstrained and "__annotated__" in combined_types.get(
+                "__extra__", ()
+            ):
+                extra = combined_types["__extra__"] = dict(
+                    combined_types["__extra__"]
                 )
+                extra["__annotated__"] = extra["__annotated__"] + unconstrained
             return combined_types
 
+        # Handle TypeVars
+        # Note: Constrained TypeVars validate against the union of their constraints, bound
+        # TypeVars against their bound and any other TypeVar accepts any value
+        if isinstance(annotation, TypeVar):
+            if annotation.__constraints__:
+                return self.__get_checkable_type__(
+                    Union[annotation.__constraints__]
+                )
+            if annotation.__bound__ is not None:
+                return self.__get_checkable_type__(annotation.__bound__)
+            return {object: None}
+
         # Handle typing.Literal
         if getattr(annotation, "__origin__", None) == Literal:
             return {"__extra__": {"__literal__": list(annotation.__args__)}}
@@ -317,23 +541,217 @@ class FunctionMethodEnforcer:
         if isinstance(annotation, GenericConstraint):
             return {"__extra__": {"__constraints__": [annotation]}}
 
+        # Handle typing.TypedDict (must come before standard types as TypedDicts are classes)
+        if is_typeddict(annotation):
+            return {
+                dict: None,
+                "__extra__": {
+                    "__typeddict__": [self.__get_typeddict_plan__(annotation)]
+                },
+            }
+
         # Handle standard types
         if isinstance(annotation, type):
+            if getattr(annotation, "_is_protocol", False) and not getattr(
+                annotation, "_is_runtime_protocol", False
+            ):
+                self.__exception__(
+                    f"Protocol `{annotation.__qualname__}` must be decorated with `typing.runtime_checkable` to be enforced.",
+                    raise_exception=True,
+                )
+            # Dataclasses and NamedTuples map to their parsed fields in deep records mode
+            if self.__deep_records__:
+                record_fields = self.__get_record_fields__(annotation)
+                if record_fields:
+                    return {annotation: record_fields}
             return {annotation: None}
 
-        # Hanldle typing.Type (for uninitialized classes)
+        # Handle `typing.Type[X]` and `type[X]` (for uninitialized classes)
+        # Note: The classes `X` are stored under `type` so that passed classes are checked with a
+        # single `issubclass` call and unions of `Type`s merge
         if origin is type and len(args) == 1:
-            return {annotation: None}
+            return {type: self.__get_checkable_type__(args[0])}
 
         self.__exception__(
             f"Unsupported type hint: {annotation}", raise_exception=True
         )
 
+    def __get_annotated_type__(self, annotation):
+        """
+        Returns the parsed type of an `Annotated[X, ...]` annotation with every `Constraint` in its
+        metadata attached to the parsed type of `X`. Other metadata is ignored.
+
+        The constraints are stored as `(scope, constraints)` pairs under `"__annotated__"` where
+        `scope` is a tuple of the types of `X` (see `__get_annotated_scope__`). Constraints are only
+        validated for values that are instances of their scope, so they only apply to `X` when
+        merged into a union (e.g. `Annotated[int, Constraint(ge=0)] | str`).
+
+        Each union member keeps its own pair, so a value passes if it satisfies the constraints of
+        any member that matches its type (see `__get_constraints__`).
+
+        - Note: The parsed type of `X` is copied since it can be shared (e.g. a type alias).
+        - Note: If `X` already has `Annotated` constraints (e.g. a type alias or a union with
+            `Annotated` members), the new constraints are added to each of its pairs.
+        """
+        parsed = dict(self.__get_checkable_type__(annotation.__origin__))
+        constraints = tuple(
+            item
+            for item in annotation.__metadata__
+            if isinstance(item, GenericConstraint)
+        )
+        if constraints:
+            extra = dict(parsed.get("__extra__", {}))
+            if "__annotated__" in extra:
+                extra["__annotated__"] = [
+                    (scope, scoped_constraints + constraints)
+                    for scope, scoped_constraints in extra["__annotated__"]
+                ]
+            else:
+                scope = self.__get_annotated_scope__(parsed)
+                extra["__annotated__"] = [(scope, constraints)]
+            parsed["__extra__"] = extra
+        return parsed
+
+    def __get_annotated_scope__(self, parsed):
+        """
+        Returns the tuple of types of a parsed type or None if it has no types (e.g. a `Literal`).
+        """
+        return tuple(key for key in parsed if key != "__extra__") or None
+
+    def __get_alias_type__(self, annotation):
+        """
+        Returns the cached parsed type of a type alias (or a subscripted generic type alias).
+
+        - Note: The parsed type is cached before the value of the alias is parsed, so references
+            of a recursive alias to itself resolve to the same (shared) parsed type. This makes the
+            parsed type a graph with back references instead of an infinite expansion.
+        - Note: Shared parsed types are never modified since `merge_type_dicts` copies nested types.
+        """
+        if annotation not in self.__alias_types__:
+            parsed = self.__alias_types__[annotation] = {}
+            try:
+                if _is_type_alias(annotation):
+                    value = _get_alias_value(annotation)
+                else:
+                    value = _get_alias_value(
+                        annotation.__origin__, annotation.__args__
+                    )
+                merge_type_dicts(parsed, self.__get_checkable_type__(value))
+                if not parsed:
+                    self.__exception__(
+                        f"Type alias `{annotation}` can not be defined as itself.",
+                        raise_exception=True,
+                    )
+            except Exception:
+                # Do not keep partially parsed aliases
+                del self.__alias_types__[annotation]
+                raise
+        return self.__alias_types__[annotation]
+
+    def __get_typeddict_plan__(self, annotation):
+        """
+        Returns a cached validation plan for a TypedDict class as a tuple of
+        `(required_keys, allowed_keys, field_types)`.
+
+        - `required_keys` and `allowed_keys` are frozensets so the keys of a passed dict can be
+            validated with a single set operation each.
+        - `field_types` maps each key to its parsed checkable type.
+        - Note: The plan is cached before its fields are parsed so self referencing TypedDicts
+            resolve to the same plan.
+        """
+        if annotation not in self.__typeddict_plans__:
+            required_keys = frozenset(annotation.__required_keys__)
+            allowed_keys = required_keys | frozenset(
+                annotation.__optional_keys__
+            )
+            field_types = {}
+            self.__typeddict_plans__[annotation] = (
+                required_keys,
+                allowed_keys,
+                field_types,
+            )
+            for field, field_annotation in get_type_hints(
+                annotation, include_extras=True
+            ).items():
+                field_types[field] = self.__get_checkable_type__(
+                    field_annotation
+                )
+        return self.__typeddict_plans__[annotation]
+
+    def __get_record_fields__(self, cls):
+        """
+        Returns the parsed field types of a dataclass or NamedTuple class as a dict of
+        `{field_name: checkable_type}`. Returns None for any other class.
+
+        - Note: The parsed fields are cached on the class itself as `__type_enforced_fields__`
+            so they are only parsed once.
+        - Note: The fields are cached before they are parsed so self referencing records resolve
+            to the same fields.
+        """
+        if "__type_enforced_fields__" in cls.__dict__:
+            return cls.__type_enforced_fields__
+        if is_dataclass(cls):
+            field_names = [field.name for field in dataclass_fields(cls)]
+        elif issubclass(cls, tuple) and hasattr(cls, "_fields"):
+            field_names = list(cls._fields)
+        else:
+            return None
+        record_fields = {}
+        try:
+            cls.__type_enforced_fields__ = record_fields
+        except (TypeError, AttributeError):
+            pass
+        try:
+            type_hints = get_type_hints(cls, include_extras=True)
+            for field_name in field_names:
+                if field_name in type_hints:
+                    record_fields[field_name] = self.__get_checkable_type__(
+                        type_hints[field_name]
+                    )
+        except Exception:
+            # Do not keep partially parsed fields (e.g. of unresolved forward references)
+            if cls.__dict__.get("__type_enforced_fields__") is record_fields:
+                delattr(cls, "__type_enforced_fields__")
+            raise
+        return record_fields
+
+    def __get_silent_checker__(self):
+        """
+        Returns a cached silent copy of this checker that shares its parsing caches.
+
+        This is used to try multiple alternatives (e.g. a union of TypedDicts) without reporting
+        failures for the alternatives that do not match.
+        """
+        if self.__silent__:
+            return self
+        if self.__silent_checker__ is None:
+            self.__silent_checker__ = self.__get_twin__(__silent__=True)
+        return self.__silent_checker__
+
+    def __get_twin__(self, **overrides):
+        """
+        Returns a plain TypeChecker copy of this checker that shares its parsing caches and sampler,
+        with the passed slot values overridden.
+
+        Twins never run a validation budget, so they always validate in full.
+        """
+        twin = TypeChecker.__new__(TypeChecker)
+        for slot in TypeChecker.__slots__:
+            setattr(twin, slot, getattr(self, slot))
+        twin.__silent_checker__ = None
+        twin.__max_validation_ns__ = None
+        twin.__deadline__ = None
+        twin.__budget_countdown__ = _budget_chunk_size
+        for slot, value in overrides.items():
+            setattr(twin, slot, value)
+        return twin
+
     def __exception__(self, message, raise_exception=False):
         """
         Usage:
 
         - Creates a class based exception message
+        - Returns False if a warning is printed instead of raising an exception
 
         Requires:
 
@@ -348,8 +766,9 @@ class FunctionMethodEnforcer:
             - What: Forces an exception to be raised regardless of the `self.__strict__` setting.
             - Default: False
         """
+        self.__violations__ += 1
         if self.__strict__ or raise_exception:
-            msg = f"TypeEnforced Exception ({self.__fn__.__qualname__}): {message}"
+            msg = f"TypeEnforced Exception ({self.__qualname__}): {message}"
             if self.__clean_traceback__:
                 package_path = _package_path
                 frame = sys._getframe()
@@ -361,7 +780,12 @@ class FunctionMethodEnforcer:
                     except ValueError:
                         relevant_tb_count += 1
                     frame = frame.f_back
-                original_excepthook = sys.excepthook
+                # Do not chain hooks of previous (caught) exceptions
+                original_excepthook = getattr(
+                    sys.excepthook,
+                    "__type_enforced_original__",
+                    sys.excepthook,
+                )
 
                 def excepthook(type, value, tb):
                     traceback.print_exception(
@@ -369,50 +793,1303 @@ class FunctionMethodEnforcer:
                     )
                     sys.excepthook = original_excepthook
 
+                excepthook.__type_enforced_original__ = original_excepthook
                 sys.excepthook = excepthook
             raise TypeError(msg)
         else:
-            print(
-                f"TypeEnforced Warning ({self.__fn__.__qualname__}): {message}"
-            )
+            print(f"TypeEnforced Warning ({self.__qualname__}): {message}")
+            return False
 
-    def __get__(self, obj, objtype):
+    def __get_flat_keys__(self, subtype):
         """
-        Overwrite standard __get__ method to return __call__ instead for wrapped class methods.
+        Returns a cached frozenset of the types in `subtype` if it only contains plain types
+        (no nested typing, literals or constraints). Otherwise returns None.
+        """
+        subtype_id = id(subtype)
+        if subtype_id not in self.__flat_subtypes__:
+            # First call for this subtype: compute and cache
+            if all(v is None for v in subtype.values()):
+                self.__flat_subtypes__[subtype_id] = frozenset(subtype.keys())
+            else:
+                self.__flat_subtypes__[subtype_id] = None
+        return self.__flat_subtypes__[subtype_id]
 
-        Also stores the calling (__get__) `obj` to be passed as an initial argument for `__call__` such that methods can pass `self` correctly.
+    def __get_leaf_keys__(self, subtype):
         """
-        self.__outer_self__ = obj
+        Returns a cached frozenset of the plain types in `subtype` (the types without nested typing).
+        Items of these exact types are valid without a `__check_type__` call. Returns an empty
+        frozenset if `subtype` has literals, constraints or TypedDicts, which apply to every item.
 
-        def __get_fn__(*args, **kwargs):
-            return self.__call__(*args, **kwargs)
+        This lets mixed item types (e.g. the `str`, `int` and `None` leaves of a recursive `JSON`
+        alias) skip the recursive call and only recurse into the nested items.
+        """
+        subtype_id = id(subtype)
+        if subtype_id not in self.__leaf_subtypes__:
+            if "__extra__" in subtype:
+                self.__leaf_subtypes__[subtype_id] = frozenset()
+            else:
+                self.__leaf_subtypes__[subtype_id] = frozenset(
+                    k for k, v in subtype.items() if v is None
+                )
+        return self.__leaf_subtypes__[subtype_id]
 
-        __get_fn__.__name__ = self.__fn__.__name__
-        __get_fn__.__qualname__ = self.__fn__.__qualname__
-        __get_fn__.__doc__ = self.__fn__.__doc__
-        return __get_fn__
+    def __get_simple_types__(self, expected):
+        """
+        Returns a tuple of types if `expected` can be validated with a single `isinstance` call
+        (only plain classes with no nested typing, literals or constraints). Otherwise returns None.
+        """
+        if (
+            "__extra__" not in expected
+            and all(v is None for v in expected.values())
+            and all(isinstance(k, type) for k in expected.keys())
+            # Protocols are checked with cached verdicts in `__check_type__` instead
+            and not any(getattr(k, "_is_protocol", False) for k in expected)
+        ):
+            return tuple(expected.keys())
+        return None
 
-    def __check_method_function__(self):
+    def __is_instance__(self, obj, obj_type, expected, node):
         """
-        Validate that `self.__fn__` is a method or function
+        Returns `isinstance(obj, tuple(expected.keys()))` using a cache of verdicts per concrete
+        `type(obj)` for parsed types (`node`) that contain ABCs (e.g. `collections.abc.Mapping` or
+        `numbers.Number`) or runtime checkable protocols, whose instance checks are much slower
+        than plain class checks.
+
+        - Note: The cache is cleared whenever an ABC registers a new subclass (`abc.get_cache_token`).
+        - Note: Protocol verdicts are only cached for concrete types that define every protocol
+            member on the class itself. Otherwise members may be instance attributes, so each
+            instance is checked.
+        - Note: Parsed types with classes that customize `isinstance` in other ways are never cached.
+        - Note: Objects that report a different `__class__` than their type (e.g. mocks) are never cached.
         """
-        if not isinstance(self.__fn__, (MethodType, FunctionType)):
-            raise Exception(
-                f"A non function/method was passed to Enforcer. See the stack trace above for more information."
+        token = get_cache_token()
+        if token != self.__verdict_token__:
+            self.__verdict_token__ = token
+            self.__verdicts__.clear()
+            self.__class_verdicts__.clear()
+        entry = self.__verdicts__.get(id(node))
+        # The entry keeps its node alive, so its id can not be reused by another parsed type
+        if entry is None or entry is False or entry[0] is not node:
+            types = [key for key in node if key != "__extra__"]
+            if all(
+                type(cls) in (type, ABCMeta, _ProtocolMeta) for cls in types
+            ) and any(isinstance(cls, ABCMeta) for cls in types):
+                protocol_attrs = frozenset().union(
+                    *(
+                        _get_protocol_attrs(cls)
+                        for cls in types
+                        if getattr(cls, "_is_protocol", False)
+                    )
+                )
+                entry = self.__verdicts__[id(node)] = (node, {}, protocol_attrs)
+            else:
+                self.__verdicts__[id(node)] = False
+                return isinstance(obj, tuple(expected.keys()))
+        _, verdicts, protocol_attrs = entry
+        if obj.__class__ is not obj_type:
+            return isinstance(obj, tuple(expected.keys()))
+        verdict = verdicts.get(obj_type)
+        if verdict is None:
+            verdict = isinstance(obj, tuple(expected.keys()))
+            if len(verdicts) < _verdict_cache_size:
+                if all(hasattr(obj_type, attr) for attr in protocol_attrs):
+                    verdicts[obj_type] = verdict
+                else:
+                    verdicts[obj_type] = _instance_dependent
+        elif verdict is _instance_dependent:
+            verdict = isinstance(obj, tuple(expected.keys()))
+        return verdict
+
+    def __is_class_present__(self, obj, expected, node):
+        """
+        Returns True if the class `obj` matches the parsed type `expected`, that is if it is:
+
+        - A subclass of any `X` of a `Type[X]` (or `type[X]`) annotation
+        - An instance of any other expected type (e.g. `type`, `object` or `typing.Any`)
+
+        Verdicts are cached per parsed type (`node`) and class, so classes passed on every call
+        (e.g. to a factory or plugin registry) only pay for a dict lookup.
+
+        - Note: The cache is cleared whenever an ABC registers a new subclass (`abc.get_cache_token`).
+        """
+        token = get_cache_token()
+        if token != self.__verdict_token__:
+            self.__verdict_token__ = token
+            self.__verdicts__.clear()
+            self.__class_verdicts__.clear()
+        entry = self.__class_verdicts__.get(id(node))
+        # The entry keeps its node alive, so its id can not be reused by another parsed type
+        if entry is None or entry[0] is not node:
+            entry = self.__class_verdicts__[id(node)] = (node, {})
+        verdicts = entry[1]
+        # Classes are cached by id since classes with a custom metaclass may not be hashable
+        # Note: The cached verdict keeps its class alive, so its id can not be reused
+        cached = verdicts.get(id(obj))
+        if cached is not None and cached[0] is obj:
+            return cached[1]
+        classes = expected.get(type)
+        if classes is not None:
+            verdict = issubclass(
+                obj, tuple(cls for cls in classes if isinstance(cls, type))
+            ) or isinstance(
+                obj, tuple(cls for cls in expected if cls is not type)
             )
+        else:
+            verdict = isinstance(obj, tuple(expected.keys()))
+        if len(verdicts) < _verdict_cache_size:
+            verdicts[id(obj)] = (obj, verdict)
+        return verdict
 
-    def __call__(self, *args, **kwargs):
+    def __get_flat_columns__(self, expected_args):
         """
-        This method is used to validate the passed inputs and return the output of the wrapped function or method.
+        Returns a cached tuple of flat type sets (one per position) for a fixed length tuple
+        if every position only contains plain types. Otherwise returns None.
         """
-        # Special code to pass self as an initial argument
-        # for validation purposes in methods
-        # See: self.__get__
-        if self.__outer_self__ is not None:
-            args = (self.__outer_self__, *args)
-        # Get a dictionary of all annotations as checkable types
-        # Note: This is only done once at first call to avoid redundant calculations
-        self.__get_checkable_types__()
+        args_id = id(expected_args)
+        if args_id not in self.__record_plans__:
+            columns = tuple(self.__get_flat_keys__(ex) for ex in expected_args)
+            if any(keys is None for keys in columns):
+                columns = None
+            self.__record_plans__[args_id] = columns
+        return self.__record_plans__[args_id]
+
+    def __get_record_plan__(self, subtype):
+        """
+        Returns a cached column-wise validation plan if `subtype` describes a record shape with
+        only plain types. Otherwise returns None.
+
+        The plan is a tuple of `(row_types, kind, flat)` where `kind` is one of:
+
+        - `"columns"`: A fixed length tuple. `flat` holds one type set per position.
+        - `"mapping"`: A dict. `flat` holds the key and value type sets.
+        - `"items"`: A list, set or variable length tuple. `flat` holds the item type set.
+        - `"attributes"`: A dataclass or NamedTuple (deep records mode). `flat` holds
+            `(field_name, type_set)` pairs.
+        """
+        subtype_id = id(subtype)
+        if subtype_id not in self.__record_plans__:
+            plan = None
+            if len(subtype) == 1:
+                row_type, row_subtype = next(iter(subtype.items()))
+                if row_subtype is None:
+                    pass
+                elif row_type == tuple:
+                    expected_args, is_ellipsis = row_subtype
+                    if is_ellipsis is None:
+                        pass
+                    elif is_ellipsis:
+                        flat = self.__get_flat_keys__(expected_args)
+                        if flat is not None:
+                            plan = (frozenset((tuple,)), "items", flat)
+                    else:
+                        flat = self.__get_flat_columns__(expected_args)
+                        if flat is not None:
+                            plan = (frozenset((tuple,)), "columns", flat)
+                elif row_type == dict:
+                    key_flat = self.__get_flat_keys__(row_subtype[0])
+                    value_flat = self.__get_flat_keys__(row_subtype[1])
+                    if key_flat is not None and value_flat is not None:
+                        plan = (
+                            frozenset((dict,)),
+                            "mapping",
+                            (key_flat, value_flat),
+                        )
+                elif row_type in (list, set):
+                    flat = self.__get_flat_keys__(row_subtype)
+                    if flat is not None:
+                        plan = (frozenset((row_type,)), "items", flat)
+                elif isinstance(row_subtype, dict) and row_type is not type:
+                    flat = tuple(
+                        (field_name, self.__get_flat_keys__(field_type))
+                        for field_name, field_type in row_subtype.items()
+                    )
+                    if all(field_flat is not None for _, field_flat in flat):
+                        plan = (frozenset((row_type,)), "attributes", flat)
+            self.__record_plans__[subtype_id] = plan
+        return self.__record_plans__[subtype_id]
+
+    def __quick_check__(self, subtype, obj):
+        flat_keys = self.__get_flat_keys__(subtype)
+        if flat_keys is not None:
+            item_types = set(map(type, obj))
+            if item_types.issubset(flat_keys):
+                return True
+            # Items of subclasses (e.g. `bool` for `int` or `dict` for `Mapping`) only need one
+            # subclass check per distinct item type
+            # Note: Classes that customize `isinstance` in other ways (e.g. protocols) fall back
+            # to checking each item
+            if all(type(cls) in (type, ABCMeta) for cls in flat_keys):
+                expected_types = tuple(flat_keys)
+                return all(
+                    issubclass(item_type, expected_types)
+                    for item_type in item_types - flat_keys
+                )
+        return False
+
+    def __record_check__(self, subtype, obj):
+        """
+        Validates a batch of records (e.g. `list[tuple[int, str]]` or `list[dict[str, int]]`)
+        column-wise instead of row by row.
+
+        Returns True only if every row is valid. Returns False if `subtype` is not a flat record
+        shape or if any row may be invalid, in which case rows should be validated individually
+        (which also produces the error message).
+        """
+        plan = self.__get_record_plan__(subtype)
+        if plan is None:
+            return False
+        row_types, kind, flat = plan
+        if not set(map(type, obj)).issubset(row_types):
+            return False
+        if kind == "columns":
+            if not set(map(len, obj)).issubset((len(flat),)):
+                return False
+            for column_keys, column in zip(flat, zip(*obj)):
+                if not set(map(type, column)).issubset(column_keys):
+                    return False
+            return True
+        if kind == "attributes":
+            try:
+                for field_name, field_flat in flat:
+                    if not set(
+                        map(type, map(attrgetter(field_name), obj))
+                    ).issubset(field_flat):
+                        return False
+            except AttributeError:
+                return False
+            return True
+        if kind == "mapping":
+            key_flat, value_flat = flat
+            return set(map(type, chain.from_iterable(obj))).issubset(
+                key_flat
+            ) and set(
+                map(type, chain.from_iterable(map(dict.values, obj)))
+            ).issubset(
+                value_flat
+            )
+        return set(map(type, chain.from_iterable(obj))).issubset(flat)
+
+    def __check_type__(self, obj, expected, key):
+        """
+        Validates that a passed `obj` (parameter) matches the parsed `expected` types for the argument.
+
+        Returns True if the object is valid. Otherwise the failure is reported with `__exception__`
+        (which raises if strict) and False is returned. If `self.__silent__` is True, False is
+        returned on the first failure without building a message.
+        """
+        # Special case for None
+        if obj is None and _NoneType in expected:
+            return True
+        node = expected
+        if "__extra__" in expected:
+            extra = expected["__extra__"]
+            expected = {k: v for k, v in expected.items() if k != "__extra__"}
+        else:
+            extra = None
+
+        if isinstance(obj, type):
+            # An uninitialized class is passed (see `__is_class_present__`)
+            obj_type = type(obj)
+            is_present = self.__is_class_present__(obj, expected, node)
+        else:
+            obj_type = type(obj)
+            if obj_type in expected:
+                is_present = True
+            # Parsed types without ABCs (False) are checked with a direct `isinstance` call
+            elif self.__verdicts__.get(id(node)) is False:
+                is_present = isinstance(obj, tuple(expected.keys()))
+            else:
+                is_present = self.__is_instance__(obj, obj_type, expected, node)
+
+        if not is_present:
+            if isinstance(obj, type):
+                obj_type = Type[obj]
+            # Allow for literals to be used to bypass type checks if present
+            literal = extra.get("__literal__", ()) if extra is not None else ()
+            if literal:
+                if obj not in literal:
+                    if self.__silent__:
+                        return False
+                    return self.__exception__(
+                        f"Type mismatch for typed variable `{key}`. Expected one of the following `{_get_expected_names(expected)}` or a literal value in `{literal}` but got type `{obj_type}` with value `{obj}` instead."
+                    )
+            # Raise an exception if the type is not in the expected types
+            else:
+                if self.__silent__:
+                    return False
+                return self.__exception__(
+                    f"Type mismatch for typed variable `{key}`. Expected one of the following `{_get_expected_names(expected)}` but got `{obj_type}` with value `{obj}` instead."
+                )
+        # Dicts that match a TypedDict of a union with a generic dict (e.g. `dict[str, int] | Point`)
+        # are valid. Otherwise they are validated as the generic dict.
+        elif (
+            obj_type is dict
+            and extra is not None
+            and "__typeddict__" in extra
+            and expected.get(dict) is not None
+            and self.__matches_typeddict__(obj, extra["__typeddict__"])
+        ):
+            pass
+        # If the object_type is in the expected types, we can proceed with validation
+        elif obj_type in iterable_types:
+            subtype = expected.get(obj_type, None)
+            if subtype is None:
+                pass
+            # Recursive validation
+            elif obj_type == list:
+                if self.__iterable_sample_pct__ < 100:
+                    sampled_indices = self.__get_sample_indices__(
+                        len(obj), subtype
+                    )
+                    sampled_items = [obj[idx] for idx in sampled_indices]
+                    if not self.__quick_check__(
+                        subtype, sampled_items
+                    ) and not self.__record_check__(subtype, sampled_items):
+                        for idx in sampled_indices:
+                            if not self.__check_type__(
+                                obj[idx], subtype, f"{key}[{idx}]"
+                            ):
+                                return False
+                elif self.__deadline__ is not None:
+                    if not self.__check_budgeted__(obj, subtype, key):
+                        return False
+                # If the subtype does not contain iterables with typing, we can validate the items directly.
+                # Batches of flat records (e.g. tuples or dicts of plain types) are validated column-wise.
+                elif not self.__quick_check__(
+                    subtype, obj
+                ) and not self.__record_check__(subtype, obj):
+                    leaf_keys = self.__get_leaf_keys__(subtype)
+                    for idx, item in enumerate(obj):
+                        if type(item) in leaf_keys:
+                            continue
+                        if not self.__check_type__(
+                            item, subtype, f"{key}[{idx}]"
+                        ):
+                            return False
+            elif obj_type == dict:
+                key_type, val_type = subtype
+                if self.__iterable_sample_pct__ < 100:
+                    sampled_keys = self.__get_sample_keys__(obj, subtype)
+                    if not self.__quick_check__(key_type, sampled_keys):
+                        for dk in sampled_keys:
+                            if not self.__check_type__(
+                                dk, key_type, f"{key}.key[{repr(dk)}]"
+                            ):
+                                return False
+                    if not self.__quick_check__(
+                        val_type, [obj[dk] for dk in sampled_keys]
+                    ):
+                        for dk in sampled_keys:
+                            if not self.__check_type__(
+                                obj[dk], val_type, f"{key}[{repr(dk)}]"
+                            ):
+                                return False
+                elif self.__deadline__ is not None:
+                    if not self.__check_budgeted__(
+                        obj, key_type, f"{key}.key", obj
+                    ) or not self.__check_budgeted__(
+                        obj.values(), val_type, key, obj
+                    ):
+                        return False
+                else:
+                    if not self.__quick_check__(key_type, obj.keys()):
+                        for dk in obj.keys():
+                            if not self.__check_type__(
+                                dk, key_type, f"{key}.key[{repr(dk)}]"
+                            ):
+                                return False
+                    if not self.__quick_check__(val_type, obj.values()):
+                        leaf_keys = self.__get_leaf_keys__(val_type)
+                        for dk, value in obj.items():
+                            if type(value) in leaf_keys:
+                                continue
+                            if not self.__check_type__(
+                                value, val_type, f"{key}[{repr(dk)}]"
+                            ):
+                                return False
+            elif obj_type == tuple:
+                expected_args, is_ellipsis = subtype
+                if is_ellipsis is None:
+                    # Unions of tuples dispatch on the length of the passed tuple
+                    if not self.__check_tuple_shapes__(obj, expected_args, key):
+                        return False
+                elif is_ellipsis:
+                    if self.__iterable_sample_pct__ < 100:
+                        sampled_indices = self.__get_sample_indices__(
+                            len(obj), expected_args
+                        )
+                        sampled_items = [obj[idx] for idx in sampled_indices]
+                        if not self.__quick_check__(
+                            expected_args, sampled_items
+                        ) and not self.__record_check__(
+                            expected_args, sampled_items
+                        ):
+                            for idx in sampled_indices:
+                                if not self.__check_type__(
+                                    obj[idx], expected_args, f"{key}[{idx}]"
+                                ):
+                                    return False
+                    elif self.__deadline__ is not None:
+                        if not self.__check_budgeted__(obj, expected_args, key):
+                            return False
+                    elif not self.__quick_check__(
+                        expected_args, obj
+                    ) and not self.__record_check__(expected_args, obj):
+                        for idx, item in enumerate(obj):
+                            if not self.__check_type__(
+                                item, expected_args, f"{key}[{idx}]"
+                            ):
+                                return False
+                else:
+                    if len(obj) != len(expected_args):
+                        if self.__silent__:
+                            return False
+                        return self.__exception__(
+                            f"Tuple length mismatch for `{key}`. Expected length {len(expected_args)}, got {len(obj)}"
+                        )
+                    # Tuples of plain types are validated with a single type lookup per position
+                    flat_columns = self.__get_flat_columns__(expected_args)
+                    if flat_columns is None or not all(
+                        type(item) in column_keys
+                        for item, column_keys in zip(obj, flat_columns)
+                    ):
+                        for idx, (item, ex) in enumerate(
+                            zip(obj, expected_args)
+                        ):
+                            if not self.__check_type__(
+                                item, ex, f"{key}[{idx}]"
+                            ):
+                                return False
+            elif obj_type == set:
+                if self.__iterable_sample_pct__ < 100:
+                    sampled_items = self.__get_sample_keys__(obj, subtype)
+                    if not self.__quick_check__(
+                        subtype, sampled_items
+                    ) and not self.__record_check__(subtype, sampled_items):
+                        for item in sampled_items:
+                            if not self.__check_type__(
+                                item, subtype, f"{key}[{repr(item)}]"
+                            ):
+                                return False
+                elif self.__deadline__ is not None:
+                    if not self.__check_budgeted__(obj, subtype, key, obj):
+                        return False
+                elif not self.__quick_check__(
+                    subtype, obj
+                ) and not self.__record_check__(subtype, obj):
+                    for item in obj:
+                        if not self.__check_type__(
+                            item, subtype, f"{key}[{repr(item)}]"
+                        ):
+                            return False
+        # Validate the fields of dataclass and NamedTuple instances in deep records mode
+        # Note: The parsed type of `type` holds the classes of `Type[X]` annotations, not fields
+        elif self.__deep_records__ and obj_type is not type:
+            record_fields = expected.get(obj_type, None)
+            if record_fields is not None:
+                for field_name, field_type in record_fields.items():
+                    value = getattr(obj, field_name, _missing)
+                    if value is _missing:
+                        continue
+                    flat_keys = self.__get_flat_keys__(field_type)
+                    if flat_keys is not None and type(value) in flat_keys:
+                        continue
+                    if not self.__check_type__(
+                        value, field_type, f"{key}.{field_name}"
+                    ):
+                        return False
+
+        if extra is not None:
+            # Validate TypedDict keys and values if any are present
+            # Note: Unions with a generic dict are handled above
+            typeddicts = extra.get("__typeddict__", ())
+            if (
+                typeddicts
+                and isinstance(obj, dict)
+                and expected.get(dict) is None
+            ):
+                if len(typeddicts) == 1:
+                    if not self.__check_typeddict__(obj, typeddicts[0], key):
+                        return False
+                else:
+                    # Unions of TypedDicts dispatch on the keys of the passed dict
+                    candidates = self.__get_typeddict_candidates__(
+                        obj, typeddicts
+                    )
+                    if len(candidates) == 1:
+                        if not self.__check_typeddict__(
+                            obj, candidates[0], key
+                        ):
+                            return False
+                    elif not any(
+                        self.__get_silent_checker__().__check_typeddict__(
+                            obj, plan, key
+                        )
+                        for plan in candidates
+                    ):
+                        if self.__silent__:
+                            return False
+                        return self.__exception__(
+                            f"Type mismatch for typed variable `{key}`. The passed dict with keys `{list(obj.keys())}` does not match any of the expected TypedDicts."
+                        )
+            # Validate constraints if any are present
+            if "__annotated__" in extra:
+                constraints, alternatives = self.__get_constraints__(
+                    node, extra, type(obj)
+                )
+            else:
+                constraints, alternatives = extra.get("__constraints__", ()), ()
+            for constraint in constraints:
+                constraint_validation_output = constraint.__validate__(key, obj)
+                if constraint_validation_output is not True:
+                    if self.__silent__:
+                        return False
+                    return self.__exception__(
+                        f"Constraint validation error for variable `{key}` with value `{obj}`. {constraint_validation_output}"
+                    )
+            if alternatives:
+                # The value must satisfy the constraints of any matching union member
+                errors = []
+                for alternative in alternatives:
+                    for constraint in alternative:
+                        constraint_validation_output = constraint.__validate__(
+                            key, obj
+                        )
+                        if constraint_validation_output is not True:
+                            errors.append(constraint_validation_output)
+                            break
+                    else:
+                        break
+                else:
+                    if self.__silent__:
+                        return False
+                    return self.__exception__(
+                        f"Constraint validation error for variable `{key}` with value `{obj}`. The value does not satisfy any of the annotated constraints: {' or '.join(errors)}"
+                    )
+        return True
+
+    def __get_constraints__(self, node, extra, obj_type):
+        """
+        Returns a cached `(constraints, alternatives)` pair of the constraints of a parsed type
+        (`node`) that apply to values of `obj_type` (see `__get_annotated_type__`).
+
+        - `constraints`: Every union constraint and the `Annotated` constraints of the union member
+            that matches `obj_type` (if only one does). Each of them must be satisfied.
+        - `alternatives`: The `Annotated` constraints of each union member that matches `obj_type`
+            (if several do). The constraints of any one of them must be satisfied.
+        - Note: No `Annotated` constraints apply if a matching union member has none.
+        """
+        entry = self.__annotated_constraints__.get(id(node))
+        # The entry keeps its node alive, so its id can not be reused by another parsed type
+        if entry is None or entry[0] is not node:
+            entry = self.__annotated_constraints__[id(node)] = (node, {})
+        constraints = entry[1].get(obj_type)
+        if constraints is None:
+            alternatives = {
+                scoped_constraints: None
+                for scope, scoped_constraints in extra["__annotated__"]
+                if scope is None or issubclass(obj_type, scope)
+            }
+            if () in alternatives:
+                alternatives = ()
+            constraints = (*extra.get("__constraints__", ()),)
+            if len(alternatives) == 1:
+                constraints += next(iter(alternatives))
+                alternatives = ()
+            constraints = (constraints, tuple(alternatives))
+            if len(entry[1]) < _verdict_cache_size:
+                entry[1][obj_type] = constraints
+        return constraints
+
+    def __check_tuple_shapes__(self, obj, shapes, key):
+        """
+        Validates a tuple `obj` against a tuple shape table (see `utils.merge_tuple_shapes`).
+
+        Only the shapes with the length of `obj` (and variable length shapes) are tried. If a single
+        shape remains, it is validated directly so that its failures are reported as usual.
+
+        Returns True if valid, otherwise reports the failure and returns False.
+        """
+        candidates = shapes.get(len(obj), []) + shapes.get(..., [])
+        if len(candidates) == 1:
+            return self.__check_type__(obj, candidates[0], key)
+        silent_checker = self.__get_silent_checker__()
+        if any(
+            silent_checker.__check_type__(obj, candidate, key)
+            for candidate in candidates
+        ):
+            return True
+        if self.__silent__:
+            return False
+        if not candidates:
+            return self.__exception__(
+                f"Tuple length mismatch for `{key}`. Expected one of the lengths {sorted(shapes)}, got {len(obj)}"
+            )
+        return self.__exception__(
+            f"Type mismatch for typed variable `{key}`. The passed tuple `{obj}` does not match any of the expected tuple shapes with length {len(obj)}."
+        )
+
+    def __get_typeddict_candidates__(self, obj, typeddicts):
+        """
+        Returns the TypedDict plans in `typeddicts` (a union of TypedDicts) whose required and
+        allowed keys match the keys of the dict `obj`.
+
+        The candidates are cached per union and key set (up to `_union_table_size` key sets), so
+        wide unions of TypedDicts only validate the values of the matching TypedDicts.
+        """
+        entry = self.__union_tables__.get(id(typeddicts))
+        # The entry keeps its union alive, so its id can not be reused by another union
+        if entry is None or entry[0] is not typeddicts:
+            entry = self.__union_tables__[id(typeddicts)] = (typeddicts, {})
+        table = entry[1]
+        obj_keys = frozenset(obj)
+        candidates = table.get(obj_keys)
+        if candidates is None:
+            candidates = [
+                plan for plan in typeddicts if plan[0] <= obj_keys <= plan[1]
+            ]
+            if len(table) < _union_table_size:
+                table[obj_keys] = candidates
+        return candidates
+
+    def __matches_typeddict__(self, obj, typeddicts):
+        """
+        Returns True if the dict `obj` matches any of the TypedDict plans in `typeddicts` without
+        reporting any failures.
+        """
+        silent_checker = self.__get_silent_checker__()
+        return any(
+            silent_checker.__check_typeddict__(obj, plan, "")
+            for plan in self.__get_typeddict_candidates__(obj, typeddicts)
+        )
+
+    def __check_typeddict__(self, obj, plan, key):
+        """
+        Validates a dict `obj` against a TypedDict plan (see `__get_typeddict_plan__`).
+
+        Returns True if valid, otherwise reports the failure and returns False.
+        """
+        required_keys, allowed_keys, field_types = plan
+        obj_keys = obj.keys()
+        if not obj_keys >= required_keys:
+            if self.__silent__:
+                return False
+            return self.__exception__(
+                f"Missing required key(s) `{sorted(required_keys - obj_keys)}` for typed variable `{key}`."
+            )
+        if not obj_keys <= allowed_keys:
+            if self.__silent__:
+                return False
+            return self.__exception__(
+                f"Unexpected key(s) `{sorted(obj_keys - allowed_keys, key=repr)}` for typed variable `{key}`. Expected only keys in `{sorted(allowed_keys)}`."
+            )
+        for field, value in obj.items():
+            field_type = field_types[field]
+            flat_keys = self.__get_flat_keys__(field_type)
+            if flat_keys is not None and type(value) in flat_keys:
+                continue
+            if not self.__check_type__(
+                value, field_type, f"{key}[{repr(field)}]"
+            ):
+                return False
+        return True
+
+
+class FunctionMethodEnforcer(TypeChecker):
+    __slots__ = (
+        "__fn__",
+        "__outer_self__",
+        "__fn_defaults__",
+        "__fn_varnames__",
+        "__types_parsed__",
+        "__checkable_types__",
+        "__return_type__",
+        "__simple_types__",
+        "__complex_types__",
+        "__simple_return_type__",
+        "__param_indices__",
+        "__target_overhead__",
+        "__min_sample_pct__",
+        "__max_sample_pct__",
+        "__calls__",
+        "__call_interval__",
+        "__max_call_interval__",
+        "__backoff_after__",
+        "__countdown__",
+        "__streak__",
+        "__shadow__",
+        "__shadow_min_size__",
+        "__shadow_snapshot__",
+        "__bind_typevars__",
+        "__typevar_params__",
+        "__return_typevar__",
+        "__param_policies__",
+        "__max_depth__",
+        "__param_checkers__",
+        "__return_checker__",
+        "__shallow_checker__",
+        "__shadow_checker__",
+        "__signatures__",
+        "__signature_hits__",
+        "__signature_misses__",
+        "__enabled__",
+        "__wrapped__",
+        "__name__",
+        "__doc__",
+        "__dict__",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        __fn__,
+        __strict__=False,
+        __clean_traceback__=True,
+        __iterable_sample_pct__=100,
+        __sampler__=None,
+        __deep_records__=False,
+        __max_validation_us__=None,
+        __target_overhead__=None,
+        __sample_pct_bounds__=(1, 100),
+        __call_sample_rate__=1,
+        __backoff_after__=None,
+        __shadow__=False,
+        __shadow_min_size__=1000,
+        __shadow_snapshot__=False,
+        __bind_typevars__=False,
+        __param_policies__=None,
+        __max_depth__=None,
+    ):
+        """
+        Initialize a FunctionMethodEnforcer class object as a wrapper for a passed function `__fn__`.
+
+        Requires:
+
+            - `__fn__`:
+                - What: The function to enforce
+                - Type: function | method | class
+
+        Optional:
+
+            - `__strict__`:
+                - What: A boolean to enable or disable exceptions. If True, exceptions will be raised
+                    when type checking fails. If False, exceptions will not be raised but instead a warning
+                    will be printed to the console.
+                - Type: bool
+                - Default: False
+            - `__clean_traceback__`:
+                - What: A boolean to enable or disable cleaning of tracebacks when raising exceptions.
+                - Type: bool
+                - Default: True
+            - `__iterable_sample_pct__`:
+                - What: The percentage of items to sample when validating iterables. If 100, all items
+                    are validated. If less than 100, the first and last items are always validated
+                    plus a sample of the remaining items (picked by `__sampler__`) up to the specified percentage.
+                - Type: int | float
+                - Default: 100
+            - `__sampler__`:
+                - What: The strategy used to pick the sampled items when `__iterable_sample_pct__` is less than 100.
+                - Type: Sampler | str | None
+                - Default: None (the shared unseeded `RandomSampler`)
+            - `__deep_records__`:
+                - What: A boolean to enable validation of the field types of dataclass and NamedTuple
+                    instances (including when nested inside containers).
+                - Type: bool
+                - Default: False
+            - `__max_validation_us__`:
+                - What: A time budget (in microseconds) for validating the inputs (and separately the
+                    return value) of each call. Once the budget is spent, the remaining items of large
+                    iterables are not validated. Top level type checks always run.
+                - Type: int | float | None
+                - Default: None (no budget)
+            - `__target_overhead__`:
+                - What: The target validation time as a fraction of the wrapped function's own runtime
+                    (e.g. 0.05 for 5%). If set, the validation and function runtimes of one in every
+                    `_adaptive_interval` calls are measured and `__iterable_sample_pct__` is adjusted
+                    (by at most a factor of 2 per measurement) to approach the target.
+                - Type: int | float | None
+                - Default: None (the sample percentage is never adjusted)
+            - `__sample_pct_bounds__`:
+                - What: The lowest and highest sample percentages the adaptive controller can use.
+                - Type: tuple[int | float, int | float]
+                - Default: (1, 100)
+            - `__call_sample_rate__`:
+                - What: The fraction of calls that are validated (e.g. 0.01 validates one in every 100
+                    calls). Skipped calls only decrement a counter and call `__fn__` directly.
+                - Type: int | float
+                - Default: 1 (every call is validated)
+            - `__backoff_after__`:
+                - What: If set, every call is validated at first and the validated call interval doubles
+                    after each streak of this many passing validated calls, down to `__call_sample_rate__`.
+                    Any violation resets the interval so every call is validated again.
+                - Type: int | None
+                - Default: None (the call sample rate is constant)
+            - `__shadow__`:
+                - What: Enables shadow mode. Inputs that are iterables with at least `__shadow_min_size__`
+                    items are only checked inline with the first item of each iterable. Their full
+                    validation is queued to a background `ShadowWorker` which reports violations as
+                    warnings. If True, the shared default worker is used.
+                - Type: bool | ShadowWorker
+                - Default: False
+            - `__shadow_min_size__`:
+                - What: The minimum length of an iterable input for its validation to be queued in shadow mode.
+                - Type: int
+                - Default: 1000
+            - `__shadow_snapshot__`:
+                - What: A boolean to queue a shallow copy of each input instead of the input itself,
+                    so changes made to it after the call do not affect the queued validation.
+                - Type: bool
+                - Default: False
+            - `__bind_typevars__`:
+                - What: A boolean to require that all parameters (and the return value) annotated with
+                    the same constrained TypeVar match the same constraint within a call.
+                - Type: bool
+                - Default: False
+            - `__param_policies__`:
+                - What: A dictionary of parameter names (including "return") to a `Policy` that
+                    overrides the validation options for that parameter. These take precedence over
+                    policies attached with `Annotated`.
+                - Type: dict[str, Policy] | None
+                - Default: None
+            - `__max_depth__`:
+                - What: The number of nested levels of each parameter (and the return value) whose
+                    items are validated. Containers below this depth are only checked with
+                    `isinstance` (see `utils.truncate_type_dict`).
+                - Type: int | None
+                - Default: None (every level is validated)
+        """
+        TypeChecker.__init__(
+            self,
+            __strict__=__strict__,
+            __clean_traceback__=__clean_traceback__,
+            __iterable_sample_pct__=__iterable_sample_pct__,
+            __sampler__=__sampler__,
+            __deep_records__=__deep_records__,
+            __max_validation_us__=__max_validation_us__,
+        )
+        if __target_overhead__ is not None:
+            if __target_overhead__ <= 0:
+                raise ValueError(
+                    f"`target_overhead` must be greater than 0. Got `{__target_overhead__}`."
+                )
+            if (
+                not 0
+                <= __sample_pct_bounds__[0]
+                <= __sample_pct_bounds__[1]
+                <= 100
+            ):
+                raise ValueError(
+                    f"`sample_pct_bounds` must be an increasing (min, max) pair between 0 and 100. Got `{__sample_pct_bounds__}`."
+                )
+            self.__iterable_sample_pct__ = min(
+                __sample_pct_bounds__[1],
+                max(__sample_pct_bounds__[0], __iterable_sample_pct__),
+            )
+            self.__stats__.update(
+                {
+                    "measured_calls": 0,
+                    "overhead": None,
+                    "sample_pct": self.__iterable_sample_pct__,
+                }
+            )
+        self.__target_overhead__ = __target_overhead__
+        self.__min_sample_pct__, self.__max_sample_pct__ = __sample_pct_bounds__
+        self.__calls__ = 0
+        if not 0 < __call_sample_rate__ <= 1:
+            raise ValueError(
+                f"`call_sample_rate` must be greater than 0 and at most 1. Got `{__call_sample_rate__}`."
+            )
+        if __backoff_after__ is not None and (
+            not isinstance(__backoff_after__, int) or __backoff_after__ < 1
+        ):
+            raise ValueError(
+                f"`backoff_after` must be a positive integer. Got `{__backoff_after__}`."
+            )
+        self.__shadow__ = get_worker(__shadow__) if __shadow__ else None
+        self.__shadow_min_size__ = __shadow_min_size__
+        self.__shadow_snapshot__ = __shadow_snapshot__
+        self.__bind_typevars__ = __bind_typevars__
+        if __param_policies__ is not None and not all(
+            isinstance(policy, Policy) for policy in __param_policies__.values()
+        ):
+            raise ValueError(
+                f"`param_policies` must be a dict of parameter names to `type_enforced.Policy` objects. Got `{__param_policies__}`."
+            )
+        self.__param_policies__ = __param_policies__ or {}
+        if __max_depth__ is not None and (
+            not isinstance(__max_depth__, int) or __max_depth__ < 0
+        ):
+            raise ValueError(
+                f"`max_depth` must be a non negative integer. Got `{__max_depth__}`."
+            )
+        self.__max_depth__ = __max_depth__
+        if self.__shadow__ is not None:
+            # Inline checks only validate the first item of each iterable
+            self.__shallow_checker__ = self.__get_twin__(
+                __iterable_sample_pct__=0,
+                __sampler__=get_sampler(None),
+                __qualname__=__fn__.__qualname__,
+            )
+            # Queued checks report violations as warnings and validate every item
+            # Note: The worker thread gets its own sampler and caches so it never modifies state
+            # that is used by the calling threads
+            self.__shadow_checker__ = self.__get_twin__(
+                __strict__=False,
+                __violations__=0,
+                __iterable_sample_pct__=100,
+                __sampler__=get_sampler(None),
+                __stats__={},
+                __qualname__=__fn__.__qualname__,
+            )
+            self.__shadow_checker__.__init_caches__()
+            self.__stats__.update({"shadow_queued": 0, "shadow_dropped": 0})
+        self.__max_call_interval__ = round(1 / __call_sample_rate__)
+        self.__backoff_after__ = __backoff_after__
+        self.__streak__ = 0
+        # The first call is always validated
+        self.__countdown__ = 1
+        if self.__max_call_interval__ == 1:
+            self.__call_interval__ = None
+        else:
+            self.__call_interval__ = (
+                1
+                if __backoff_after__ is not None
+                else self.__max_call_interval__
+            )
+            self.__stats__.update(
+                {
+                    "checked_calls": 0,
+                    "skipped_calls": 0,
+                    "call_sample_rate": 1 / self.__call_interval__,
+                }
+            )
+        update_wrapper(self, __fn__)
+        self.__fn__ = __fn__
+        self.__enabled__ = True
+        self.__outer_self__ = None
+        self.__types_parsed__ = False
+        self.__signatures__ = None
+        self.__signature_hits__ = 0
+        self.__signature_misses__ = 0
+        # Validate that the passed function or method is a method or function
+        self.__check_method_function__()
+        # Get input defaults for the function or method
+        self.__get_defaults__()
+
+    def __get_defaults__(self):
+        """
+        Get the default values of the passed function or method and store them in `self.__fn_defaults__`.
+        Also caches the function's variable names for use in `__call__`.
+        """
+        self.__fn_varnames__ = self.__fn__.__code__.co_varnames
+        self.__fn_defaults__ = {}
+        if self.__fn__.__defaults__ is not None:
+            # Get the names of all provided default values for args
+            default_varnames = list(self.__fn_varnames__)[
+                : self.__fn__.__code__.co_argcount
+            ][-len(self.__fn__.__defaults__) :]
+            # Update the output dictionary with the default values
+            self.__fn_defaults__.update(
+                dict(zip(default_varnames, self.__fn__.__defaults__))
+            )
+        if self.__fn__.__kwdefaults__ is not None:
+            # Update the output dictionary with the keyword default values
+            self.__fn_defaults__.update(self.__fn__.__kwdefaults__)
+
+    def __get_checkable_types__(self):
+        """
+        Creates two class attributes:
+
+        - `self.__checkable_types__`:
+            - What: A dictionary of all annotations as checkable types
+            - Type: dict
+
+        - `self.__return_type__`:
+            - What: The return type of the function or method
+            - Type: dict | None
+        """
+        if not self.__types_parsed__:
+            type_hints = get_type_hints(self.__fn__, include_extras=True)
+            policies = self.__get_policies__(type_hints)
+            type_hints = {
+                key: value
+                for key, value in type_hints.items()
+                if not policies.get(key, {}).get("__skip__")
+            }
+            self.__checkable_types__ = {
+                key: self.__get_checkable_type__(value)
+                for key, value in type_hints.items()
+            }
+            # Depth limited parameters only validate their items down to their max depth
+            # Note: The parsed types are truncated once here, so there is no cost per call
+            skipped_depth = {}
+            for key, expected in self.__checkable_types__.items():
+                max_depth = policies.get(key, {}).get(
+                    "__max_depth__", self.__max_depth__
+                )
+                if max_depth is not None:
+                    depth = get_type_dict_depth(expected)
+                    if depth > max_depth:
+                        self.__checkable_types__[key] = truncate_type_dict(
+                            expected, max_depth
+                        )
+                        skipped_depth[key] = depth - max_depth
+            if skipped_depth:
+                self.__stats__["skipped_depth"] = skipped_depth
+            self.__return_type__ = self.__checkable_types__.pop("return", None)
+            # Parameters with a policy are validated by their own checker
+            self.__param_checkers__ = {}
+            self.__return_checker__ = self
+            for key, overrides in policies.items():
+                checker = self.__get_policy_checker__(overrides)
+                if key == "return":
+                    self.__return_checker__ = checker
+                elif checker is not self and key in self.__checkable_types__:
+                    self.__param_checkers__[key] = checker
+            self.__get_typevar_params__(type_hints)
+            # Classify params: simple types can use a single
+            # isinstance call, skipping __check_type__ entirely.
+            self.__simple_types__ = {}
+            self.__complex_types__ = {}
+            for key, expected in self.__checkable_types__.items():
+                simple_types = self.__get_simple_types__(expected)
+                if simple_types is not None:
+                    self.__simple_types__[key] = simple_types
+                else:
+                    self.__complex_types__[key] = expected
+            # Same classification for return type
+            # Note: Return values bound to a TypeVar are always checked by `__check_return__`
+            if (
+                self.__return_type__ is not None
+                and self.__return_typevar__ is None
+            ):
+                self.__simple_return_type__ = self.__get_simple_types__(
+                    self.__return_type__
+                )
+            else:
+                self.__simple_return_type__ = None
+            # Pre-compute param index in co_varnames for
+            # direct arg lookup (skips assigned_vars dict).
+            self.__param_indices__ = {
+                name: i
+                for i, name in enumerate(self.__fn_varnames__)
+                if name in self.__checkable_types__
+            }
+            # Functions with only simple parameter types remember the argument type signatures
+            # that already passed (see `__check_inputs__`)
+            # Note: Only classes whose `isinstance` result depends on the type alone are cached
+            # (e.g. not runtime checkable protocols, which check instance attributes)
+            if (
+                self.__simple_types__
+                and not self.__complex_types__
+                and self.__typevar_params__ is None
+                and all(
+                    type(cls) in (type, ABCMeta)
+                    for types_tuple in self.__simple_types__.values()
+                    for cls in types_tuple
+                )
+            ):
+                self.__signatures__ = set()
+            self.__types_parsed__ = True
+
+    def __get_policies__(self, type_hints):
+        """
+        Returns a dict of parameter names (including "return") to the combined options (see
+        `Policy.__get_overrides__`) of the policies in their top level `Annotated` metadata and in
+        `self.__param_policies__` (which take precedence).
+        """
+        policies = {}
+        for key, value in type_hints.items():
+            if get_origin(value) is Annotated:
+                for item in value.__metadata__:
+                    if isinstance(item, Policy):
+                        policies.setdefault(key, {}).update(
+                            item.__get_overrides__()
+                        )
+        for key, policy in self.__param_policies__.items():
+            policies.setdefault(key, {}).update(policy.__get_overrides__())
+        return policies
+
+    def __get_policy_checker__(self, overrides):
+        """
+        Returns a checker for the options of a policy (see `__get_policies__`), or this enforcer if
+        the policy does not change how types are validated.
+        """
+        twin_overrides = {}
+        if "__iterable_sample_k__" in overrides:
+            twin_overrides["__sampler__"] = RotatingSampler(
+                overrides["__iterable_sample_k__"]
+            )
+            twin_overrides["__iterable_sample_pct__"] = 0
+        else:
+            if "__iterable_sample_pct__" in overrides:
+                twin_overrides["__iterable_sample_pct__"] = overrides[
+                    "__iterable_sample_pct__"
+                ]
+            if "__sampler__" in overrides:
+                twin_overrides["__sampler__"] = get_sampler(
+                    overrides["__sampler__"]
+                )
+            # The rotating sampler of `iterable_sample_k` ignores the sample percentage, so
+            # policies that set a percentage or a sampler fall back to the enforcer defaults
+            if twin_overrides and isinstance(self.__sampler__, RotatingSampler):
+                twin_overrides.setdefault("__sampler__", get_sampler(None))
+                twin_overrides.setdefault("__iterable_sample_pct__", 100)
+        if not twin_overrides:
+            return self
+        # Policy checkers report violations to this enforcer (see `__check_with_policy__`)
+        return self.__get_twin__(**twin_overrides)
+
+    def __check_with_policy__(self, checker, obj, expected, key):
+        """
+        Validates `obj` with the checker of a parameter policy, sharing the validation budget and
+        the violation count of this enforcer.
+
+        - Note: The state is also shared if the checker raises (`strict=True`), so the violation
+            still resets the call interval (see `backoff_after`).
+        """
+        checker.__deadline__ = self.__deadline__
+        checker.__budget_countdown__ = self.__budget_countdown__
+        checker.__violations__ = 0
+        try:
+            checker.__check_type__(obj, expected, key)
+        finally:
+            self.__deadline__ = checker.__deadline__
+            self.__budget_countdown__ = checker.__budget_countdown__
+            self.__violations__ += checker.__violations__
+
+    def __get_typevar_params__(self, type_hints):
+        """
+        Creates two class attributes if `__bind_typevars__` is True (otherwise both are None):
+
+        - `self.__typevar_params__`:
+            - What: A dictionary of each constrained TypeVar that annotates a parameter to a tuple of
+                the names of its parameters and its parsed constraints
+            - Type: dict | None
+
+        - `self.__return_typevar__`:
+            - What: The TypeVar that annotates the return value if it also annotates a parameter
+            - Type: TypeVar | None
+        """
+        self.__typevar_params__ = None
+        self.__return_typevar__ = None
+        if not self.__bind_typevars__:
+            return
+        typevar_params = {}
+        for key, value in type_hints.items():
+            if (
+                key != "return"
+                and isinstance(value, TypeVar)
+                and value.__constraints__
+            ):
+                if value not in typevar_params:
+                    typevar_params[value] = (
+                        [],
+                        tuple(
+                            self.__get_checkable_type__(constraint)
+                            for constraint in value.__constraints__
+                        ),
+                    )
+                typevar_params[value][0].append(key)
+        if typevar_params:
+            self.__typevar_params__ = typevar_params
+            if type_hints.get("return") in typevar_params:
+                self.__return_typevar__ = type_hints["return"]
+
+    def __get_constraint_index__(self, obj, constraints):
+        """
+        Returns the index of the first parsed TypeVar constraint that `obj` matches (or None).
+        """
+        silent_checker = self.__get_silent_checker__()
+        for index, constraint in enumerate(constraints):
+            if silent_checker.__check_type__(obj, constraint, "value"):
+                return index
+        return None
+
+    def __check_typevar__(self, obj, typevar, key, bindings):
+        """
+        Binds `typevar` to the constraint that `obj` matches in `bindings` (a dict of each TypeVar to
+        the index of its bound constraint and the name of the variable that bound it).
+
+        Reports a failure if `typevar` is already bound to a different constraint.
+        """
+        constraints = self.__typevar_params__[typevar][1]
+        index = self.__get_constraint_index__(obj, constraints)
+        if index is None:
+            # Values that match no constraint are reported by the type check itself
+            return
+        if typevar not in bindings:
+            bindings[typevar] = (index, key)
+        elif bindings[typevar][0] != index:
+            bound_index, bound_key = bindings[typevar]
+            self.__exception__(
+                f"TypeVar mismatch for typed variable `{key}`. `{typevar.__name__}` is bound to `{typevar.__constraints__[bound_index]}` by `{bound_key}` but got `{type(obj)}` with value `{obj}` instead."
+            )
+
+    def __get_typevar_bindings__(self, args, kwargs):
+        """
+        Returns the TypeVar bindings of the passed inputs of a call (see `__check_typevar__`).
+        """
+        assigned_vars = {
+            **self.__fn_defaults__,
+            **dict(zip(self.__fn_varnames__[: len(args)], args)),
+            **kwargs,
+        }
+        bindings = {}
+        for typevar, (names, _) in self.__typevar_params__.items():
+            for name in names:
+                if name in assigned_vars:
+                    self.__check_typevar__(
+                        assigned_vars[name], typevar, name, bindings
+                    )
+        return bindings
+
+    def __get__(self, obj, objtype):
+        """
+        Overwrite standard __get__ method to return __call__ instead for wrapped class methods.
+
+        Also stores the calling (__get__) `obj` to be passed as an initial argument for `__call__` such that methods can pass `self` correctly.
+        """
+        self.__outer_self__ = obj
+
+        def __get_fn__(*args, **kwargs):
+            return self.__call__(*args, **kwargs)
+
+        __get_fn__.__name__ = self.__fn__.__name__
+        __get_fn__.__qualname__ = self.__fn__.__qualname__
+        __get_fn__.__doc__ = self.__fn__.__doc__
+        return __get_fn__
+
+    def __check_method_function__(self):
+        """
+        Validate that `self.__fn__` is a method or function
+        """
+        if not isinstance(self.__fn__, (MethodType, FunctionType)):
+            raise Exception(
+                f"A non function/method was passed to Enforcer. See the stack trace above for more information."
+            )
+
+    def __check_inputs__(self, args, kwargs):
+        """
+        Validates the passed inputs (including `self` for methods) of a call.
+        """
+        signatures = self.__signatures__
+        if signatures is not None:
+            # Signature cache: A call whose argument types (and keyword names) match a signature
+            # that already passed is accepted with a single tuple build and set lookup
+            if kwargs:
+                signature = (
+                    *map(type, args),
+                    *kwargs,
+                    *map(type, kwargs.values()),
+                )
+            else:
+                signature = tuple(map(type, args))
+            if signature in signatures:
+                self.__signature_hits__ += 1
+                return
+            self.__signature_misses__ += 1
+            violations = self.__violations__
         # Fast path: simple types use direct index lookup
         for key, types_tuple in self.__simple_types__.items():
             idx = self.__param_indices__[key]
@@ -421,172 +2098,624 @@ class FunctionMethodEnforcer:
             elif key in kwargs:
                 obj = kwargs[key]
             else:
-                obj = self.__fn_defaults__.get(key)
-            if not isinstance(obj, types_tuple):
-                # Fall back to full check for error reporting
-                self.__check_type__(obj, self.__checkable_types__[key], key)
-        # Full validation for complex types (nested, extras, Type[X])
-        if self.__complex_types__:
-            assigned_vars = {
-                **self.__fn_defaults__,
-                **dict(zip(self.__fn_varnames__[: len(args)], args)),
-                **kwargs,
-            }
-            for key, value in self.__complex_types__.items():
-                self.__check_type__(assigned_vars.get(key), value, key)
-        # Execute the function callable
-        return_value = self.__fn__(*args, **kwargs)
-        # If a return type was passed, validate the returned object
-        if self.__return_type__ is not None:
-            if self.__simple_return_type__ is not None:
-                if not isinstance(return_value, self.__simple_return_type__):
-                    self.__check_type__(
-                        return_value, self.__return_type__, "return"
+                obj = self.__fn_defaults__.get(key)
+            if not isinstance(obj, types_tuple):
+                # Fall back to full check for error reporting
+                self.__check_type__(obj, self.__checkable_types__[key], key)
+        if signatures is not None:
+            # Only signatures without violations (e.g. warnings with `strict=False`) are cached
+            if (
+                self.__violations__ == violations
+                and len(signatures) < _signature_cache_size
+            ):
+                signatures.add(signature)
+            return
+        # Full validation for complex types (nested, extras, Type[X])
+        if self.__complex_types__:
+            if self.__max_validation_ns__ is not None:
+                self.__start_validation__()
+            assigned_vars = {
+                **self.__fn_defaults__,
+                **dict(zip(self.__fn_varnames__[: len(args)], args)),
+                **kwargs,
+            }
+            param_checkers = self.__param_checkers__
+            for key, value in self.__complex_types__.items():
+                obj = assigned_vars.get(key)
+                if key in param_checkers:
+                    self.__check_with_policy__(
+                        param_checkers[key], obj, value, key
+                    )
+                elif self.__shadow__ is not None and self.__is_large__(obj):
+                    self.__check_shadowed__(obj, value, key)
+                else:
+                    self.__check_type__(obj, value, key)
+        # Returns the TypeVar bindings of the call (see `__check_return__`)
+        if self.__typevar_params__ is not None:
+            return self.__get_typevar_bindings__(args, kwargs)
+
+    def __is_large__(self, obj):
+        """
+        Returns True if `obj` is an iterable that is large enough to be validated in shadow mode.
+        """
+        return (
+            type(obj) in iterable_types and len(obj) >= self.__shadow_min_size__
+        )
+
+    def __check_shadowed__(self, obj, expected, key):
+        """
+        Checks `obj` inline with the first item of each iterable only and queues its full validation
+        to the shadow worker (dropping it if the worker queue is full).
+        """
+        self.__shallow_checker__.__check_type__(obj, expected, key)
+        if self.__shadow_snapshot__:
+            obj = copy.copy(obj)
+        if self.__shadow__.__submit__(
+            self.__shadow_checker__, obj, expected, key
+        ):
+            self.__stats__["shadow_queued"] += 1
+        else:
+            self.__stats__["shadow_dropped"] += 1
+
+    def __get_stats__(self):
+        stats = TypeChecker.__get_stats__(self)
+        # Skipped calls are only added up when the next call is checked (see `__sampled_call__`),
+        # so the calls skipped since the last checked call are counted from the countdown
+        if self.__call_interval__ is not None and stats["checked_calls"]:
+            stats["skipped_calls"] += (
+                self.__call_interval__ - self.__countdown__
+            )
+        if self.__signatures__ is not None:
+            stats["signature_hits"] = self.__signature_hits__
+            stats["signature_misses"] = self.__signature_misses__
+        if self.__shadow__ is not None:
+            stats["shadow_violations"] = self.__shadow_checker__.__violations__
+        if self.__types_parsed__:
+            # Parameters with their own sampler (e.g. `Sample(k=10)`) report their sampling stats
+            checkers = {
+                **self.__param_checkers__,
+                "return": self.__return_checker__,
+            }
+            for key, checker in checkers.items():
+                if checker.__sampler__ is not self.__sampler__:
+                    sampler_stats = checker.__sampler__.__get_stats__()
+                    if sampler_stats:
+                        stats.setdefault("params", {})[key] = sampler_stats
+        return stats
+
+    def __check_return__(self, return_value, bindings=None):
+        """
+        Validates the returned object of a call.
+
+        Only called if a return type was passed and the returned object is not an instance of
+        the simple return types (if any).
+
+        If the return value is annotated with a TypeVar that is bound by the inputs (`bindings`, as
+        returned by `__check_inputs__`), it must match the same constraint.
+        """
+        if self.__max_validation_ns__ is not None:
+            self.__start_validation__()
+        if self.__return_checker__ is self:
+            self.__check_type__(return_value, self.__return_type__, "return")
+        else:
+            self.__check_with_policy__(
+                self.__return_checker__,
+                return_value,
+                self.__return_type__,
+                "return",
+            )
+        if bindings and self.__return_typevar__ is not None:
+            self.__check_typevar__(
+                return_value, self.__return_typevar__, "return", bindings
+            )
+
+    def __measured_call__(self, args, kwargs):
+        """
+        Calls the wrapped function like `__call__` while timing the validation and the function
+        itself, then adjusts the sample percentage towards `__target_overhead__`.
+        """
+        start = perf_counter_ns()
+        bindings = self.__check_inputs__(args, kwargs)
+        fn_start = perf_counter_ns()
+        return_value = self.__fn__(*args, **kwargs)
+        fn_end = perf_counter_ns()
+        if self.__return_type__ is not None:
+            if self.__simple_return_type__ is None or not isinstance(
+                return_value, self.__simple_return_type__
+            ):
+                self.__check_return__(return_value, bindings)
+        end = perf_counter_ns()
+        overhead = ((fn_start - start) + (end - fn_end)) / max(
+            fn_end - fn_start, 1
+        )
+        factor = (
+            min(2, max(0.5, self.__target_overhead__ / overhead))
+            if overhead
+            else 2
+        )
+        # Note: A sample percentage of 0 grows from 1 percent
+        sample_pct = min(
+            self.__max_sample_pct__,
+            max(
+                self.__min_sample_pct__,
+                (self.__iterable_sample_pct__ or 1) * factor,
+            ),
+        )
+        self.__iterable_sample_pct__ = sample_pct
+        self.__stats__["measured_calls"] += 1
+        self.__stats__["overhead"] = overhead
+        self.__stats__["sample_pct"] = sample_pct
+        return return_value
+
+    def __sampled_call__(self, args, kwargs):
+        """
+        Validates a call that was picked by the call sampling and updates the call interval.
+
+        With `__backoff_after__`, the interval doubles after each streak of passing calls (up to
+        `__max_call_interval__`) and is reset to 1 after any violation.
+
+        With `__target_overhead__`, every `_adaptive_interval`th checked call is measured (see
+        `__measured_call__`).
+        """
+        stats = self.__stats__
+        # The calls since the last checked call were skipped (the first call is always checked)
+        if stats["checked_calls"]:
+            stats["skipped_calls"] += self.__call_interval__ - 1
+        stats["checked_calls"] += 1
+        violations = self.__violations__
+        measured = False
+        if self.__target_overhead__ is not None:
+            self.__calls__ += 1
+            if self.__calls__ >= _adaptive_interval:
+                self.__calls__ = 0
+                measured = True
+        try:
+            if measured:
+                return_value = self.__measured_call__(args, kwargs)
+            else:
+                bindings = self.__check_inputs__(args, kwargs)
+                return_value = self.__fn__(*args, **kwargs)
+                if self.__return_type__ is not None:
+                    if self.__simple_return_type__ is None or not isinstance(
+                        return_value, self.__simple_return_type__
+                    ):
+                        self.__check_return__(return_value, bindings)
+        finally:
+            if self.__backoff_after__ is not None:
+                if self.__violations__ != violations:
+                    self.__call_interval__ = 1
+                    self.__streak__ = 0
+                else:
+                    self.__streak__ += 1
+                    if self.__streak__ >= self.__backoff_after__:
+                        self.__streak__ = 0
+                        self.__call_interval__ = min(
+                            self.__call_interval__ * 2,
+                            self.__max_call_interval__,
+                        )
+                stats["call_sample_rate"] = 1 / self.__call_interval__
+            self.__countdown__ = self.__call_interval__
+        return return_value
+
+    def __call__(self, *args, **kwargs):
+        """
+        This method is used to validate the passed inputs and return the output of the wrapped function or method.
+        """
+        # Special code to pass self as an initial argument
+        # for validation purposes in methods
+        # See: self.__get__
+        if self.__outer_self__ is not None:
+            args = (self.__outer_self__, *args)
+        # Disabled enforcers (see `type_enforced.disable`) and skipped scopes (see `sampling_scope`)
+        # go straight to the wrapped function
+        scope = _scope.get()
+        if scope is False or not self.__enabled__:
+            return self.__fn__(*args, **kwargs)
+        # Call sampling: Skipped calls go straight to the wrapped function
+        # Note: Calls in a validated scope are always validated
+        if self.__call_interval__ is not None and scope is None:
+            self.__countdown__ -= 1
+            if self.__countdown__:
+                return self.__fn__(*args, **kwargs)
+            self.__get_checkable_types__()
+            return self.__sampled_call__(args, kwargs)
+        # Get a dictionary of all annotations as checkable types
+        # Note: This is only done once at first call to avoid redundant calculations
+        self.__get_checkable_types__()
+        # Adaptive enforcers measure the validation overhead of every `_adaptive_interval`th call
+        if self.__target_overhead__ is not None:
+            self.__calls__ += 1
+            if self.__calls__ >= _adaptive_interval:
+                self.__calls__ = 0
+                return self.__measured_call__(args, kwargs)
+        bindings = self.__check_inputs__(args, kwargs)
+        # Execute the function callable
+        return_value = self.__fn__(*args, **kwargs)
+        # If a return type was passed, validate the returned object
+        # Note: Simple return types are checked inline to avoid a method call
+        if self.__return_type__ is not None:
+            if self.__simple_return_type__ is None or not isinstance(
+                return_value, self.__simple_return_type__
+            ):
+                self.__check_return__(return_value, bindings)
+        return return_value
+
+    def __repr__(self):
+        return f"<type_enforced {self.__fn__.__module__}.{self.__fn__.__qualname__} object at {hex(id(self))}>"
+
+
+class DataclassEnforcer(TypeChecker):
+    __slots__ = (
+        "__cls__",
+        "__original_init__",
+        "__original_setattr__",
+        "__original_methods__",
+        "__validate_assignment__",
+        "__field_checks__",
+        "__replacing__",
+        "__enabled__",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        __cls__,
+        __strict__=False,
+        __clean_traceback__=True,
+        __iterable_sample_pct__=100,
+        __sampler__=None,
+        __deep_records__=False,
+        __validate_assignment__=False,
+        __enabled__=True,
+    ):
+        """
+        Initialize a DataclassEnforcer class object that enforces the field types of a dataclass `__cls__`.
+
+        By default, the generated `__init__` is replaced with a fused `__init__` that has the field
+        type checks inlined. The fused `__init__` validates each argument directly and then calls the
+        original dataclass `__init__` (so defaults, `default_factory`, `frozen=True`, `slots=True`
+        and `__post_init__` behave as usual, and `__post_init__` only runs with validated arguments).
+        This avoids the generic `FunctionMethodEnforcer.__call__` and `__get__` overhead on every
+        object construction.
+
+        Instances are only ever created from validated fields, so `replace` (and `copy.replace`)
+        only validates the changed fields.
+
+        Requires:
+
+            - `__cls__`:
+                - What: The dataclass to enforce
+                - Type: class
+
+        Optional:
+
+            - `__strict__`:
+                - What: A boolean to enable or disable exceptions. If True, exceptions will be raised
+                    when type checking fails. If False, exceptions will not be raised but instead a warning
+                    will be printed to the console.
+                - Type: bool
+                - Default: False
+            - `__clean_traceback__`:
+                - What: A boolean to enable or disable cleaning of tracebacks when raising exceptions.
+                - Type: bool
+                - Default: True
+            - `__iterable_sample_pct__`:
+                - What: The percentage of items to sample when validating iterables.
+                - Type: int | float
+                - Default: 100
+            - `__sampler__`:
+                - What: The strategy used to pick the sampled items when `__iterable_sample_pct__` is less than 100.
+                - Type: Sampler | str | None
+                - Default: None (the shared unseeded `RandomSampler`)
+            - `__deep_records__`:
+                - What: A boolean to enable validation of the field types of nested dataclass and
+                    NamedTuple instances.
+                - Type: bool
+                - Default: False
+            - `__validate_assignment__`:
+                - What: A boolean to validate every field assignment (`instance.field = value`) with
+                    a replacement `__setattr__`. Field assignments made by the original `__init__` are
+                    validated the same way, so the fused `__init__` is not used.
+                - Type: bool
+                - Default: False
+                - Note: This is ignored for frozen dataclasses as their fields can not be assigned.
+            - `__enabled__`:
+                - What: A boolean to install the validating methods on the dataclass. If False, the
+                    dataclass is left unchanged until the enforcer is enabled (see `__rebind__`).
+                - Type: bool
+                - Default: True
+        """
+        TypeChecker.__init__(
+            self,
+            __strict__=__strict__,
+            __clean_traceback__=__clean_traceback__,
+            __iterable_sample_pct__=__iterable_sample_pct__,
+            __sampler__=__sampler__,
+            __deep_records__=__deep_records__,
+            __qualname__=f"{__cls__.__qualname__}.__init__",
+        )
+        self.__cls__ = __cls__
+        self.__original_init__ = __cls__.__init__
+        self.__original_setattr__ = __cls__.__setattr__
+        # The methods defined on the dataclass itself (None if inherited) to restore when disabled
+        self.__original_methods__ = {
+            name: __cls__.__dict__.get(name)
+            for name in ("__init__", "__setattr__", "__replace__")
+        }
+        self.__validate_assignment__ = (
+            __validate_assignment__ and not __cls__.__dataclass_params__.frozen
+        )
+        self.__field_checks__ = None
+        self.__replacing__ = {}
+        self.__enabled__ = False
+        __cls__.__type_enforced_dataclass__ = self
+        if __enabled__:
+            self.__rebind__(True)
+
+    def __rebind__(self, enabled):
+        """
+        Installs the validating methods on the dataclass (`enabled=True`) or restores its original
+        methods (`enabled=False`) so that disabled dataclasses cost nothing.
+
+        This is used by `type_enforced.enable` and `type_enforced.disable`.
+        """
+        self.__enabled__ = enabled
+        cls = self.__cls__
+        if enabled:
+            cls.__replace__ = replace
+            if self.__validate_assignment__:
+                cls.__setattr__ = self.__get_setattr__()
+            else:
+                cls.__init__ = self.__get_bootstrap_init__()
+            return
+        for name, method in self.__original_methods__.items():
+            if method is not None:
+                setattr(cls, name, method)
+            elif name in cls.__dict__:
+                delattr(cls, name)
+
+    def __get_field_checks__(self):
+        """
+        Returns a dictionary of `{field_name: (simple_types, item_types, checkable_type)}` for
+        every annotated field that is set during `__init__`.
+
+        - `simple_types`: See `__get_simple_types__`
+        - `item_types`: See `__get_inline_item_types__`
+        - `checkable_type`: The parsed type used by `__check_type__`
+
+        Note: This is only done once at first use to allow for forward references.
+        """
+        if self.__field_checks__ is None:
+            type_hints = get_type_hints(self.__cls__, include_extras=True)
+            field_checks = {}
+            for field in dataclass_fields(self.__cls__):
+                if field.name in type_hints and (
+                    field.init
+                    or field.default is not MISSING
+                    or field.default_factory is not MISSING
+                ):
+                    expected = self.__get_checkable_type__(
+                        type_hints[field.name]
                     )
-            else:
-                self.__check_type__(
-                    return_value, self.__return_type__, "return"
-                )
-        return return_value
+                    field_checks[field.name] = (
+                        self.__get_simple_types__(expected),
+                        self.__get_inline_item_types__(expected),
+                        expected,
+                    )
+            self.__field_checks__ = field_checks
+        return self.__field_checks__
 
-    def __quick_check__(self, subtype, obj):
-        subtype_id = id(subtype)
-        if subtype_id not in self.__flat_subtypes__:
-            # First call for this subtype: compute and cache
-            if all(v is None for v in subtype.values()):
-                self.__flat_subtypes__[subtype_id] = frozenset(subtype.keys())
-            else:
-                self.__flat_subtypes__[subtype_id] = None
-        flat_keys = self.__flat_subtypes__[subtype_id]
-        if flat_keys is not None:
-            values = {type(v) for v in obj}
-            if values.issubset(flat_keys):
+    def __check_field__(self, name, value, checker=None):
+        """
+        Validates a single field `value` with the same checks used by the fused `__init__`.
+
+        Failures are reported by `checker` (default: this enforcer, named `Cls.__init__`).
+        """
+        if checker is None:
+            checker = self
+        simple_types, item_types, expected = self.__get_field_checks__()[name]
+        if simple_types is not None:
+            if isinstance(value, simple_types):
                 return True
-        return False
+        elif item_types is not None:
+            container_type, flat_keys = item_types
+            if type(value) is container_type and flat_keys.issuperset(
+                map(type, value)
+            ):
+                return True
+        return checker.__check_type__(value, expected, name)
 
-    def __check_type__(self, obj, expected, key):
+    def __get_bootstrap_init__(self):
         """
-        Raises an exception the type of a passed `obj` (parameter) is not in the list of supplied `acceptable_types` for the argument.
+        Returns an `__init__` that generates the fused `__init__` on first construction, installs
+        it on the class and then calls it.
         """
-        # Special case for None
-        if obj is None and _NoneType in expected:
-            return
-        if "__extra__" in expected:
-            extra = expected["__extra__"]
-            expected = {k: v for k, v in expected.items() if k != "__extra__"}
-        else:
-            extra = None
 
-        if isinstance(obj, type):
-            # An uninitialized class is passed, we need to check if the type is in the expected types using Type[obj]
-            obj_type = Type[obj]
-            is_present = obj_type in expected
+        def __init__(instance, *args, **kwargs):
+            fused_init = self.__get_fused_init__()
+            self.__cls__.__init__ = fused_init
+            fused_init(instance, *args, **kwargs)
+
+        update_wrapper(__init__, self.__original_init__)
+        return __init__
+
+    def __get_setattr__(self):
+        """
+        Returns a `__setattr__` that validates assignments to annotated fields before setting them.
+
+        Fields listed in `self.__replacing__` for the instance being assigned to were copied from
+        an already validated instance by `replace` and are not validated again.
+        """
+        field_names = frozenset(
+            field.name for field in dataclass_fields(self.__cls__)
+        )
+        original_setattr = self.__original_setattr__
+        # Failed assignments are reported as `Cls.__setattr__`
+        setattr_checker = self.__get_twin__(
+            __qualname__=f"{self.__cls__.__qualname__}.__setattr__"
+        )
+
+        def __setattr__(instance, name, value):
+            # Assignments are not validated in a suppressed (or skipped) scope
+            if name in field_names and _scope.get() is not False:
+                if not (
+                    self.__replacing__
+                    and name in self.__replacing__.get(id(instance), ())
+                ):
+                    field_checks = self.__get_field_checks__()
+                    if name in field_checks:
+                        self.__check_field__(name, value, setattr_checker)
+            original_setattr(instance, name, value)
+
+        update_wrapper(__setattr__, original_setattr)
+        return __setattr__
+
+    def __get_inline_item_types__(self, expected):
+        """
+        Returns a tuple of `(container_type, flat_keys)` if `expected` is a single `list`, `set` or
+        variable length `tuple` of plain types and all items are validated. Otherwise returns None.
+        """
+        if self.__iterable_sample_pct__ < 100 or len(expected) != 1:
+            return None
+        container_type, subtype = next(iter(expected.items()))
+        if container_type in (list, set) and subtype is not None:
+            flat_keys = self.__get_flat_keys__(subtype)
+        elif container_type == tuple and subtype is not None and subtype[1]:
+            flat_keys = self.__get_flat_keys__(subtype[0])
         else:
-            obj_type = type(obj)
-            is_present = obj_type in expected or isinstance(
-                obj, tuple(expected.keys())
-            )
+            return None
+        if flat_keys is None:
+            return None
+        return (container_type, flat_keys)
 
-        if not is_present:
-            # Allow for literals to be used to bypass type checks if present
-            literal = extra.get("__literal__", ()) if extra is not None else ()
-            if literal:
-                if obj not in literal:
-                    self.__exception__(
-                        f"Type mismatch for typed variable `{key}`. Expected one of the following `{list(expected.keys())}` or a literal value in `{literal}` but got type `{obj_type}` with value `{obj}` instead."
-                    )
-            # Raise an exception if the type is not in the expected types
+    def __get_fused_init__(self):
+        """
+        Generates an `__init__` with the signature of the original dataclass `__init__` that
+        validates each argument with an inlined check and then calls the original `__init__` (so
+        `__post_init__` only runs with validated arguments). Arguments are not validated in a
+        suppressed or skipped scope (see `type_enforced.suppressed`).
+
+        - Fields with simple types are checked with a single `isinstance` call.
+        - Fields that are a `list`, `set` or variable length `tuple` of plain types are checked with
+            a single type set lookup when all items are validated (`iterable_sample_pct=100`).
+        - All other fields (or any field that fails an inlined check) are checked with `__check_type__`.
+        - Note: Fields that are not `__init__` arguments and values created by a `default_factory`
+            are not validated.
+        """
+        namespace = {
+            "__original_init__": self.__original_init__,
+            "__check_type__": self.__check_type__,
+            "__scope__": _scope,
+        }
+        field_checks = self.__get_field_checks__()
+        factory_names = {
+            field.name
+            for field in dataclass_fields(self.__cls__)
+            if field.default_factory is not MISSING
+        }
+        params = ["__type_enforced_self__"]
+        call_args = ["__type_enforced_self__"]
+        checks = []
+        parameters = list(
+            get_signature(self.__original_init__).parameters.values()
+        )[1:]
+        for idx, param in enumerate(parameters):
+            name = param.name
+            if param.kind is Parameter.KEYWORD_ONLY:
+                if "*" not in params:
+                    params.append("*")
+                call_args.append(f"{name}={name}")
             else:
-                self.__exception__(
-                    f"Type mismatch for typed variable `{key}`. Expected one of the following `{list(expected.keys())}` but got `{obj_type}` with value `{obj}` instead."
+                call_args.append(name)
+            if param.default is Parameter.empty:
+                params.append(name)
+            else:
+                namespace[f"__default_{idx}__"] = param.default
+                params.append(f"{name}=__default_{idx}__")
+            if name not in field_checks:
+                continue
+            simple_types, item_types, expected = field_checks[name]
+            namespace[f"__expected_{idx}__"] = expected
+            if simple_types is not None:
+                namespace[f"__simple_types_{idx}__"] = simple_types
+                condition = f"not isinstance({name}, __simple_types_{idx}__)"
+            elif item_types is not None:
+                container_type, flat_keys = item_types
+                namespace[f"__container_type_{idx}__"] = container_type
+                namespace[f"__flat_keys_{idx}__"] = flat_keys
+                condition = f"type({name}) is not __container_type_{idx}__ or not __flat_keys_{idx}__.issuperset(map(type, {name}))"
+            else:
+                condition = None
+            if name in factory_names:
+                # The default of a `default_factory` field is a sentinel
+                condition = f"{name} is not __default_{idx}__" + (
+                    f" and ({condition})" if condition else ""
                 )
-        # If the object_type is in the expected types, we can proceed with validation
-        elif obj_type in iterable_types:
-            subtype = expected.get(obj_type, None)
-            if subtype is None:
-                pass
-            # Recursive validation
-            elif obj_type == list:
-                if self.__iterable_sample_pct__ < 100:
-                    for idx in self.__get_sample_indices__(len(obj)):
-                        self.__check_type__(obj[idx], subtype, f"{key}[{idx}]")
-                # If the subtype does not contain iterables with typing, we can validate the items directly.
-                elif not self.__quick_check__(subtype, obj):
-                    for idx, item in enumerate(obj):
-                        self.__check_type__(item, subtype, f"{key}[{idx}]")
-            elif obj_type == dict:
-                key_type, val_type = subtype
-                if self.__iterable_sample_pct__ < 100:
-                    sampled_keys = self.__get_sample_keys__(list(obj.keys()))
-                    if not self.__quick_check__(key_type, sampled_keys):
-                        for dk in sampled_keys:
-                            self.__check_type__(
-                                dk, key_type, f"{key}.key[{repr(dk)}]"
-                            )
-                    if not self.__quick_check__(
-                        val_type, [obj[dk] for dk in sampled_keys]
-                    ):
-                        for dk in sampled_keys:
-                            self.__check_type__(
-                                obj[dk], val_type, f"{key}[{repr(dk)}]"
-                            )
-                else:
-                    if not self.__quick_check__(key_type, obj.keys()):
-                        for key in obj.keys():
-                            self.__check_type__(
-                                key, key_type, f"{key}.key[{repr(key)}]"
-                            )
-                    if not self.__quick_check__(val_type, obj.values()):
-                        for key, value in obj.items():
-                            self.__check_type__(
-                                value, val_type, f"{key}[{repr(key)}]"
-                            )
-            elif obj_type == tuple:
-                expected_args, is_ellipsis = subtype
-                if is_ellipsis:
-                    if self.__iterable_sample_pct__ < 100:
-                        for idx in self.__get_sample_indices__(len(obj)):
-                            self.__check_type__(
-                                obj[idx], expected_args, f"{key}[{idx}]"
-                            )
-                    elif not self.__quick_check__(expected_args, obj):
-                        for idx, item in enumerate(obj):
-                            self.__check_type__(
-                                item, expected_args, f"{key}[{idx}]"
-                            )
-                else:
-                    if len(obj) != len(expected_args):
-                        self.__exception__(
-                            f"Tuple length mismatch for `{key}`. Expected length {len(expected_args)}, got {len(obj)}"
-                        )
-                    for idx, (item, ex) in enumerate(zip(obj, expected_args)):
-                        self.__check_type__(item, ex, f"{key}[{idx}]")
-            elif obj_type == set:
-                if self.__iterable_sample_pct__ < 100:
-                    obj_list = list(obj)
-                    for idx in self.__get_sample_indices__(len(obj_list)):
-                        item = obj_list[idx]
-                        self.__check_type__(
-                            item, subtype, f"{key}[{repr(item)}]"
-                        )
-                elif not self.__quick_check__(subtype, obj):
-                    for item in obj:
-                        self.__check_type__(
-                            item, subtype, f"{key}[{repr(item)}]"
-                        )
+            if condition is not None:
+                checks.append(f"        if {condition}:")
+                checks.append(
+                    f"            __check_type__({name}, __expected_{idx}__, {name!r})"
+                )
+            else:
+                checks.append(
+                    f"        __check_type__({name}, __expected_{idx}__, {name!r})"
+                )
+        lines = [f"def __init__({', '.join(params)}):"]
+        if checks:
+            lines.append("    if __scope__.get() is not False:")
+            lines.extend(checks)
+        lines.append(f"    __original_init__({', '.join(call_args)})")
+        exec(
+            compile(
+                "\n".join(lines),
+                f"<type_enforced {self.__qualname__}>",
+                "exec",
+            ),
+            namespace,
+        )
+        fused_init = namespace["__init__"]
+        update_wrapper(fused_init, self.__original_init__)
+        return fused_init
 
-        # Validate constraints if any are present
-        if extra is not None:
-            constraints = extra.get("__constraints__", ())
-            for constraint in constraints:
-                constraint_validation_output = constraint.__validate__(key, obj)
-                if constraint_validation_output is not True:
-                    self.__exception__(
-                        f"Constraint validation error for variable `{key}` with value `{obj}`. {constraint_validation_output}"
+    def __replace__(self, obj, changes):
+        """
+        Creates a copy of `obj` with `changes` applied, only validating the changed fields.
+
+        Unchanged fields were validated when `obj` was created, so the copy is created with the
+        original dataclass `__init__` (which still runs `__post_init__`).
+        """
+        if _scope.get() is not False:
+            for name, value in changes.items():
+                if name in self.__get_field_checks__():
+                    self.__check_field__(name, value)
+        init_kwargs = {}
+        unchanged_names = set()
+        for field in dataclass_fields(obj):
+            if not field.init:
+                if field.name in changes:
+                    raise ValueError(
+                        f"field {field.name} is declared with init=False, it cannot be specified with replace()"
                     )
+                continue
+            if field.name in changes:
+                init_kwargs[field.name] = changes[field.name]
+            else:
+                init_kwargs[field.name] = getattr(obj, field.name)
+                unchanged_names.add(field.name)
+        # InitVars are not fields and can only be passed as changes
+        for name, value in changes.items():
+            if name not in init_kwargs:
+                init_kwargs[name] = value
+        new_obj = self.__cls__.__new__(self.__cls__)
+        self.__replacing__[id(new_obj)] = unchanged_names
+        try:
+            self.__original_init__(new_obj, **init_kwargs)
+        finally:
+            del self.__replacing__[id(new_obj)]
+        return new_obj
 
     def __repr__(self):
-        return f"<type_enforced {self.__fn__.__module__}.{self.__fn__.__qualname__} object at {hex(id(self))}>"
+        return f"<type_enforced {self.__cls__.__module__}.{self.__cls__.__qualname__} dataclass object at {hex(id(self))}>"
 
 
 @Partial
@@ -596,6 +2725,21 @@ def Enforcer(
     strict=True,
     clean_traceback=True,
     iterable_sample_pct=100,
+    sampler="random",
+    iterable_sample_k=None,
+    deep_records=False,
+    validate_assignment=False,
+    max_validation_us=None,
+    target_overhead=None,
+    sample_pct_bounds=(1, 100),
+    call_sample_rate=1,
+    backoff_after=None,
+    shadow=False,
+    shadow_min_size=1000,
+    shadow_snapshot=False,
+    bind_typevars=False,
+    param_policies=None,
+    max_depth=None,
 ):
     """
     A wrapper to enforce types within a function or method given argument annotations.
@@ -607,6 +2751,9 @@ def Enforcer(
     - Methods with `__call__`
     - Methods wrapped with `staticmethod` (if python >= 3.10)
     - Methods wrapped with `classmethod` (if python >= 3.10)
+    - Properties (the getter return type and the setter value type are enforced)
+
+    If wrapping a dataclass, the generated `__init__` is replaced by a fused `__init__` (see `DataclassEnforcer`) that validates each field argument before the original `__init__` (and `__post_init__`) runs. Use `type_enforced.replace` (or `copy.replace` in python >= 3.13) to create modified copies that only validate the changed fields.
 
     Requires:
 
@@ -620,6 +2767,8 @@ def Enforcer(
         - What: A boolean to enable or disable the enforcer
         - Type: bool
         - Default: True
+        - Note: Enforcers can also be toggled at runtime with `type_enforced.disable` and `type_enforced.enable`.
+        - Note: When python runs with `-O`, the original object is returned and its enforcers start disabled.
     - `strict`:
         - What: A boolean to enable or disable exceptions. If True, exceptions will be raised when type checking fails. If False, exceptions will not be raised but instead a warning will be printed to the console.
         - Type: bool
@@ -634,9 +2783,135 @@ def Enforcer(
         - What: The percentage (0-100) of items to validate when checking typed iterables (list,
             dict, set, variable-length tuple). At 100 (default) every item is checked. Below 100,
             the first and last items are always checked; if the collection has more than 3 items,
-            additional items are randomly sampled so that the total checked is at least 3.
+            additional items are sampled (see `sampler`) so that the total checked is at least 3.
+            For dicts and sets, the first item is always checked.
         - Type: int | float
         - Default: 100
+    - `sampler`:
+        - What: The strategy used to pick which items are checked when `iterable_sample_pct` is less than 100.
+            - `"random"`: Uniformly random items (dict keys and set items are copied to a list first)
+            - `"stride"`: Evenly spaced items with no random number generator
+            - `"edge"`: Items at the start and end only. Dict and set sampling cost does not depend on their size.
+            - A `type_enforced.sampling.Sampler` instance (e.g. `RandomSampler(seed=0)` for reproducible samples)
+        - Type: str | Sampler
+        - Default: "random"
+    - `iterable_sample_k`:
+        - What: If set, a constant number of items is checked per typed iterable regardless of its size
+            (overriding `iterable_sample_pct` and `sampler`). A cursor is kept per annotation and
+            rotated by `k` items on every check so that repeated calls sweep every position.
+        - Type: int | None
+        - Default: None
+        - Note: Each wrapped function or method gets its own `RotatingSampler`. The achieved
+            coverage is reported by `type_enforced.get_stats`.
+    - `deep_records`:
+        - What: A boolean to enable validation of the field types of dataclass and NamedTuple instances.
+            If False (default), only `isinstance` is checked for these instances. If True, each
+            field is validated against its annotation, including for instances nested inside
+            containers (e.g. `list[Point]`).
+        - Type: bool
+        - Default: False
+        - Note: The parsed fields are cached on each record class so they are only parsed once.
+    - `validate_assignment`:
+        - What: A boolean to enable validation of field assignments (`instance.field = value`) on
+            enforced (non frozen) dataclasses.
+        - Type: bool
+        - Default: False
+        - Note: This only applies when wrapping a dataclass.
+        - Note: Failed assignments (including those made by `__init__`) are reported as
+            `Cls.__setattr__`.
+    - `max_validation_us`:
+        - What: A time budget (in microseconds) for validating the inputs (and separately the return
+            value) of each call. The clock is checked every few hundred items of large iterables and
+            once the budget is spent, the remaining items are not validated. Top level type checks
+            always run.
+        - Type: int | float | None
+        - Default: None (no budget)
+        - Note: The number of validations and how many of them were truncated by the budget are
+            reported by `type_enforced.get_stats`.
+        - Note: This only applies to functions and methods (not dataclass fields).
+    - `target_overhead`:
+        - What: If set, the validation overhead is kept near this fraction of the wrapped function's own
+            runtime (e.g. 0.05 for 5%) by adjusting `iterable_sample_pct`. One in every 16 calls is
+            timed and the sample percentage is scaled (by at most a factor of 2) towards the target.
+        - Type: int | float | None
+        - Default: None
+        - Note: `iterable_sample_pct` is used as the starting sample percentage. The current sample
+            percentage and the last measured overhead are reported by `type_enforced.get_stats`.
+        - Note: Top level type checks always run, so the overhead can not drop below their cost.
+        - Note: This only applies to functions and methods and is ignored if `iterable_sample_k` is set.
+        - Note: With `call_sample_rate` or `backoff_after`, one in every 16 validated calls is timed
+            (skipped calls are not counted).
+    - `sample_pct_bounds`:
+        - What: The lowest and highest sample percentages that `target_overhead` can use.
+        - Type: tuple[int | float, int | float]
+        - Default: (1, 100)
+    - `call_sample_rate`:
+        - What: The fraction of calls that are validated (e.g. 0.01 validates one in every 100 calls).
+            Skipped calls only decrement a counter and call the wrapped function directly.
+        - Type: int | float
+        - Default: 1 (every call is validated)
+        - Note: The first call is always validated. The number of checked and skipped calls and the
+            current call sample rate are reported by `type_enforced.get_stats`.
+        - Note: This only applies to functions and methods.
+    - `backoff_after`:
+        - What: If set, every call is validated at first and the interval between validated calls
+            doubles after each streak of this many passing validated calls, down to `call_sample_rate`.
+            Any violation snaps back to validating every call.
+        - Type: int | None
+        - Default: None (the call sample rate is constant)
+    - `shadow`:
+        - What: Enables shadow mode. Inputs that are iterables with at least `shadow_min_size` items are
+            only checked inline with the first item of each (nested) iterable. Their full validation is
+            queued to a background thread (`type_enforced.shadow.ShadowWorker`) which reports
+            violations as warnings. If True, a shared default worker (with a queue of 1024 jobs) is used.
+        - Note: The background validation checks every item (ignoring `iterable_sample_pct` and
+            `iterable_sample_k`).
+        - Type: bool | ShadowWorker
+        - Default: False
+        - Note: If the worker queue is full, the validation is dropped instead of blocking the call.
+            The number of queued and dropped validations and the violations found by the worker are
+            reported by `type_enforced.get_stats`.
+        - Note: This only applies to function and method inputs.
+    - `shadow_min_size`:
+        - What: The minimum length of an iterable input for its validation to be queued in shadow mode.
+        - Type: int
+        - Default: 1000
+    - `shadow_snapshot`:
+        - What: A boolean to queue a shallow copy of each shadowed input so that changes made to it
+            after the call do not affect the queued validation.
+        - Type: bool
+        - Default: False
+    - `bind_typevars`:
+        - What: A boolean to require that all parameters (and the return value) annotated with the same
+            constrained TypeVar (e.g. `typing.AnyStr`) match the same constraint within a call.
+        - Type: bool
+        - Default: False
+        - Note: Each TypeVar is always validated against its constraints or bound. Binding only applies
+            to parameters and return values annotated with the TypeVar itself (e.g. `a: T`, not `a: list[T]`).
+        - Note: This only applies to functions and methods.
+    - `param_policies`:
+        - What: A dictionary of parameter names (including `"return"`) to a `type_enforced.Policy`
+            (e.g. `type_enforced.Sample(1)` or `type_enforced.Skip`) that overrides the validation
+            options above for that parameter only.
+        - Type: dict[str, Policy] | None
+        - Default: None
+        - Note: Policies can also be attached to an annotation with `typing.Annotated` (e.g.
+            `rows: Annotated[list[Row], type_enforced.Sample(1)]`). Policies passed here take precedence.
+        - Note: Names that are not parameters of a wrapped function or method are ignored, so one
+            dict can be used for a whole class.
+        - Note: This only applies to functions and methods.
+    - `max_depth`:
+        - What: If set, the items of containers are only validated down to this many levels of
+            nesting. Containers (and TypedDict values or record fields) below this depth are only
+            checked with `isinstance`. E.g. a depth of 1 for `dict[str, list[int]]` validates that
+            the keys are `str` and the values are `list`, but not the items of each list. A depth of
+            0 only checks the top level type of each parameter.
+        - Type: int | None
+        - Default: None (every level is validated)
+        - Note: Use `type_enforced.Policy(max_depth=...)` to override the depth of a single parameter.
+        - Note: The number of levels that are not validated for each parameter is reported by
+            `type_enforced.get_stats` as `skipped_depth` (`inf` for recursive types).
+        - Note: This only applies to functions and methods.
 
 
     Example Use:
@@ -660,6 +2935,45 @@ def Enforcer(
     Exception: (my_fn): Type mismatch for typed variable `a`. Expected one of the following `[<class 'int'>]` but got `<class 'str'>` instead.
     ```
     """
+    options = {
+        "enabled": enabled,
+        "strict": strict,
+        "clean_traceback": clean_traceback,
+        "iterable_sample_pct": iterable_sample_pct,
+        "sampler": sampler,
+        "iterable_sample_k": iterable_sample_k,
+        "deep_records": deep_records,
+        "validate_assignment": validate_assignment,
+        "max_validation_us": max_validation_us,
+        "target_overhead": target_overhead,
+        "sample_pct_bounds": sample_pct_bounds,
+        "call_sample_rate": call_sample_rate,
+        "backoff_after": backoff_after,
+        "shadow": shadow,
+        "shadow_min_size": shadow_min_size,
+        "shadow_snapshot": shadow_snapshot,
+        "bind_typevars": bind_typevars,
+        "param_policies": param_policies,
+        "max_depth": max_depth,
+    }
+    if iterable_sample_k is not None:
+        # Every enforcer gets its own rotating cursors, so the sampler is created here
+        # Note: Any sample percentage below 100 enables sampling as the rotating sampler ignores it
+        sampler = RotatingSampler(iterable_sample_k)
+        iterable_sample_pct = 0
+        target_overhead = None
+    if isinstance(clsFnMethod, property):
+        # Properties are immutable, so wrap the getter, setter and deleter in a new property
+        if not enabled:
+            return clsFnMethod
+        accessors = []
+        for accessor in (clsFnMethod.fget, clsFnMethod.fset, clsFnMethod.fdel):
+            if accessor is not None and not isinstance(
+                accessor, FunctionMethodEnforcer
+            ):
+                accessor = Enforcer(accessor, **options)
+            accessors.append(accessor)
+        return type(clsFnMethod)(*accessors, clsFnMethod.__doc__)
     if not hasattr(clsFnMethod, "__type_enforced_enabled__"):
         # Special try except clause to handle cases when the object is immutable
         try:
@@ -678,55 +2992,287 @@ def Enforcer(
                 return clsFnMethod
         except:
             pass
-        if isinstance(clsFnMethod, staticmethod):
-            return staticmethod(
-                FunctionMethodEnforcer(
-                    __fn__=clsFnMethod.__func__,
-                    __strict__=strict,
-                    __clean_traceback__=clean_traceback,
-                    __iterable_sample_pct__=iterable_sample_pct,
-                )
-            )
-        elif isinstance(clsFnMethod, classmethod):
-            return classmethod(
-                FunctionMethodEnforcer(
-                    __fn__=clsFnMethod.__func__,
+        enforcer_kwargs = {
+            "__strict__": strict,
+            "__clean_traceback__": clean_traceback,
+            "__iterable_sample_pct__": iterable_sample_pct,
+            "__sampler__": sampler,
+            "__deep_records__": deep_records,
+            "__max_validation_us__": max_validation_us,
+            "__target_overhead__": target_overhead,
+            "__sample_pct_bounds__": sample_pct_bounds,
+            "__call_sample_rate__": call_sample_rate,
+            "__backoff_after__": backoff_after,
+            "__shadow__": shadow,
+            "__shadow_min_size__": shadow_min_size,
+            "__shadow_snapshot__": shadow_snapshot,
+            "__bind_typevars__": bind_typevars,
+            "__param_policies__": param_policies,
+            "__max_depth__": max_depth,
+        }
+        if isinstance(clsFnMethod, (staticmethod, classmethod)):
+            fn = clsFnMethod.__func__
+        else:
+            fn = clsFnMethod
+        enforcer = FunctionMethodEnforcer(__fn__=fn, **enforcer_kwargs)
+        # Register the enforcer so it can be toggled at runtime (see `type_enforced.disable`)
+        # Note: The wrapped function keeps the enforcer alive while it is rebound to the function
+        _enforcers.add(enforcer)
+        try:
+            fn.__type_enforced_enforcer__ = enforcer
+        except AttributeError:
+            pass
+        # Optimized runs (`python -O`) return the original object so enforcement costs nothing
+        # Note: The enforcer stays registered and can still be enabled with `type_enforced.enable`
+        if not __debug__:
+            enforcer.__enabled__ = False
+            return clsFnMethod
+        if isinstance(clsFnMethod, (staticmethod, classmethod)):
+            return type(clsFnMethod)(enforcer)
+        return enforcer
+    elif hasattr(clsFnMethod, "__dict__"):
+        # Dataclasses with a generated `__init__` get a fused `__init__` with inlined field checks
+        # Note: Generated dataclass methods are compiled from source and have no real file name
+        fused_dataclass_init = (
+            is_dataclass(clsFnMethod)
+            and "__type_enforced_dataclass__" not in clsFnMethod.__dict__
+            and isinstance(clsFnMethod.__dict__.get("__init__"), FunctionType)
+            and clsFnMethod.__init__.__code__.co_filename == "<string>"
+        )
+        if fused_dataclass_init:
+            # Registered like function enforcers (see `type_enforced.disable`)
+            # Note: Optimized runs (`python -O`) leave the dataclass unchanged until it is enabled
+            _enforcers.add(
+                DataclassEnforcer(
+                    __cls__=clsFnMethod,
                     __strict__=strict,
                     __clean_traceback__=clean_traceback,
                     __iterable_sample_pct__=iterable_sample_pct,
+                    __sampler__=sampler,
+                    __deep_records__=deep_records,
+                    __validate_assignment__=validate_assignment,
+                    __enabled__=__debug__,
                 )
             )
-        else:
-            return FunctionMethodEnforcer(
-                __fn__=clsFnMethod,
-                __strict__=strict,
-                __clean_traceback__=clean_traceback,
-                __iterable_sample_pct__=iterable_sample_pct,
-            )
-    elif hasattr(clsFnMethod, "__dict__"):
-        for key, value in clsFnMethod.__dict__.items():
+        for key, value in list(clsFnMethod.__dict__.items()):
             # Skip the __annotate__ method if present in __dict__ as it deletes itself upon invocation
             # Skip any previously wrapped methods if they are already a FunctionMethodEnforcer
-            if key == "__annotate__" or isinstance(
-                value, FunctionMethodEnforcer
+            # Skip dataclass methods handled by the DataclassEnforcer as they already validate the fields
+            if (
+                key == "__annotate__"
+                or isinstance(value, FunctionMethodEnforcer)
+                or (
+                    fused_dataclass_init
+                    and key in ("__init__", "__setattr__", "__replace__")
+                )
             ):
                 continue
             if hasattr(value, "__call__") or isinstance(
-                value, (classmethod, staticmethod)
+                value, (classmethod, staticmethod, property)
             ):
                 setattr(
                     clsFnMethod,
                     key,
-                    Enforcer(
-                        value,
-                        enabled=enabled,
-                        strict=strict,
-                        clean_traceback=clean_traceback,
-                        iterable_sample_pct=iterable_sample_pct,
-                    ),
+                    Enforcer(value, **options),
                 )
         return clsFnMethod
     else:
         raise Exception(
             "Enforcer can only be used on classes, methods, or functions."
         )
+
+
+# `check` failures are often caught, so tracebacks are not cleaned (see `__exception__`)
+_checker = TypeChecker(
+    __strict__=True, __clean_traceback__=False, __qualname__="check"
+)
+_silent_checker = TypeChecker(__silent__=True, __qualname__="is_valid")
+_checkable_type_cache = {}
+
+
+def _get_cached_checkable_type(annotation):
+    """
+    Parses an annotation with the shared checker and caches the result globally.
+
+    Returns None if the annotation is not hashable and can not be cached.
+
+    - Note: Once `_checkable_type_cache_size` annotations are cached (e.g. many `Literal` values
+        built at runtime), the cache and the caches of the shared checkers are reset. The checker
+        caches are keyed by the id of parsed types, so they must not outlive the parsed types.
+    """
+    try:
+        return _checkable_type_cache[annotation]
+    except KeyError:
+        if len(_checkable_type_cache) >= _checkable_type_cache_size:
+            _checkable_type_cache.clear()
+            for checker in (_checker, _silent_checker):
+                checker.__init_caches__()
+                checker.__silent_checker__ = None
+        expected = _checker.__get_checkable_type__(annotation)
+        _checkable_type_cache[annotation] = expected
+        return expected
+    except TypeError:
+        return None
+
+
+def check(value, annotation, key="value"):
+    """
+    Validate a value against a type annotation without wrapping a function.
+
+    The parsed annotation is cached globally so repeated checks against the same annotation
+    only pay for the validation itself.
+
+    Requires:
+
+    - `value`:
+        - What: The object to validate
+        - Type: Any
+    - `annotation`:
+        - What: The type annotation to validate the value against
+        - Type: Any supported type hint (e.g. `int`, `list[int]`, `dict[str, int | float]`)
+
+    Optional:
+
+    - `key`:
+        - What: The name used to reference the value in error messages
+        - Type: str
+        - Default: "value"
+
+    Raises a `TypeError` if the value does not match the annotation.
+
+    Example Use:
+    ```
+    >>> import type_enforced
+    >>> type_enforced.check([1, 2, 3], list[int])
+    >>> type_enforced.check([1, "2"], list[int])
+    Traceback (most recent call last):
+      ...
+    TypeError: TypeEnforced Exception (check): Type mismatch for typed variable `value[1]`. Expected one of the following `[<class 'int'>]` but got `<class 'str'>` with value `2` instead.
+    ```
+    """
+    expected = _get_cached_checkable_type(annotation)
+    if expected is None:
+        checker = TypeChecker(
+            __strict__=True, __clean_traceback__=False, __qualname__="check"
+        )
+        checker.__check_type__(
+            value, checker.__get_checkable_type__(annotation), key
+        )
+    else:
+        _checker.__check_type__(value, expected, key)
+
+
+def is_valid(value, annotation) -> bool:
+    """
+    Return whether a value matches a type annotation without raising an exception.
+
+    This uses the same parsed (and globally cached) annotations as `check`, but stops at the
+    first failure without building an error message, making it suitable for high throughput
+    filtering.
+
+    Requires:
+
+    - `value`:
+        - What: The object to validate
+        - Type: Any
+    - `annotation`:
+        - What: The type annotation to validate the value against
+        - Type: Any supported type hint (e.g. `int`, `list[int]`, `dict[str, int | float]`)
+
+    Example Use:
+    ```
+    >>> import type_enforced
+    >>> type_enforced.is_valid([1, 2, 3], list[int])
+    True
+    >>> type_enforced.is_valid([1, "2"], list[int])
+    False
+    ```
+    """
+    expected = _get_cached_checkable_type(annotation)
+    if expected is None:
+        checker = TypeChecker(__silent__=True, __qualname__="is_valid")
+        return checker.__check_type__(
+            value, checker.__get_checkable_type__(annotation), "value"
+        )
+    return _silent_checker.__check_type__(value, expected, "value")
+
+
+def replace(obj, /, **changes):
+    """
+    Create a new dataclass instance from `obj` with the fields in `changes` replaced.
+
+    This works like `dataclasses.replace`, but for dataclasses wrapped with `Enforcer` only the
+    changed fields are validated, since every other field was already validated when `obj` was
+    created. The new instance is still created with the original dataclass `__init__` (so
+    `__post_init__` runs as usual). For any other dataclass, `dataclasses.replace` is used.
+
+    - Note: Enforced dataclasses also use this for `copy.replace` (python >= 3.13).
+
+    Requires:
+
+    - `obj`:
+        - What: The dataclass instance to copy
+        - Type: dataclass instance
+
+    Optional:
+
+    - `**changes`:
+        - What: The field values to replace
+
+    Example Use:
+    ```
+    >>> import type_enforced
+    >>> from dataclasses import dataclass
+    >>> @type_enforced.Enforcer
+    ... @dataclass(frozen=True)
+    ... class Job:
+    ...     rows: list[int]
+    ...     status: str
+    ...
+    >>> job = Job(rows=list(range(1000000)), status="pending")
+    >>> done = type_enforced.replace(job, status="done") # Only `status` is validated
+    ```
+    """
+    dataclass_enforcer = type(obj).__dict__.get("__type_enforced_dataclass__")
+    if dataclass_enforcer is None or not dataclass_enforcer.__enabled__:
+        return dataclass_replace(obj, **changes)
+    return dataclass_enforcer.__replace__(obj, changes)
+
+
+def get_stats(enforced):
+    """
+    Return the runtime statistics of an enforced function, method or dataclass.
+
+    This is useful to monitor how much validation sampled enforcers actually perform (e.g. the
+    coverage achieved with `iterable_sample_k`).
+
+    Requires:
+
+    - `enforced`:
+        - What: The enforced function, method or dataclass
+        - Type: FunctionMethodEnforcer | staticmethod | classmethod | class
+        - Note: For methods, pass the wrapped method from the class `__dict__` (e.g. `MyClass.__dict__["my_method"]`).
+
+    Example Use:
+    ```
+    >>> import type_enforced
+    >>> @type_enforced.Enforcer(iterable_sample_k=10)
+    ... def total(values: list[int]) -> int:
+    ...     return sum(values)
+    ...
+    >>> for _ in range(5):
+    ...     total(list(range(100)))
+    ...
+    >>> type_enforced.get_stats(total)
+    {'samples': 5, 'items_checked': 50, 'full_sweeps': 0, 'coverage': 0.5}
+    ```
+    """
+    if isinstance(enforced, (staticmethod, classmethod)):
+        enforced = enforced.__func__
+    if isinstance(enforced, type):
+        enforced = enforced.__dict__.get("__type_enforced_dataclass__")
+    if not isinstance(enforced, TypeChecker):
+        raise TypeError(
+            "get_stats can only be used on enforced functions, methods or dataclasses."
+        )
+    return enforced.__get_stats__()
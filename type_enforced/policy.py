@@ -0,0 +1,140 @@
+class Policy:
+    """
+    A per-parameter validation policy that overrides the options of an enforcer for a single
+    parameter (or the return value).
+
+    Policies can be attached to an annotation with `typing.Annotated` (e.g.
+    `rows: Annotated[list[Row], Sample(1)]`) or passed to `Enforcer(param_policies={...})` as a
+    dict of parameter names (including `"return"`) to policies. Policies passed to the enforcer
+    take precedence over annotated policies.
+
+    - Note: Only policies in the top level `Annotated` of a parameter annotation are used.
+    - Note: Parameters with a policy that sets a sample percentage keep it, even if the enforcer
+        adjusts its own sample percentage (`target_overhead`). They are not queued in shadow mode.
+    """
+
+    __slots__ = (
+        "__skip__",
+        "__iterable_sample_pct__",
+        "__sampler__",
+        "__iterable_sample_k__",
+        "__max_depth__",
+    )
+
+    def __init__(
+        self,
+        iterable_sample_pct=None,
+        sampler=None,
+        iterable_sample_k=None,
+        max_depth=None,
+        skip=False,
+    ):
+        """
+        Initialize a Policy.
+
+        Optional:
+
+        - `iterable_sample_pct`:
+            - What: The percentage (0-100) of items to validate when checking typed iterables of
+                this parameter.
+            - Type: int | float | None
+            - Default: None (the enforcer's `iterable_sample_pct`)
+        - `sampler`:
+            - What: The strategy used to pick the sampled items of this parameter (see `Enforcer`).
+            - Type: str | Sampler | None
+            - Default: None (the enforcer's sampler)
+        - `iterable_sample_k`:
+            - What: If set, a constant number of items is checked per typed iterable of this
+                parameter (overriding `iterable_sample_pct` and `sampler`).
+            - Type: int | None
+            - Default: None
+        - `max_depth`:
+            - What: The number of nested levels of this parameter whose items are validated (see
+                `Enforcer`). Containers below this depth are only checked with `isinstance`.
+            - Type: int | None
+            - Default: None (the enforcer's `max_depth`)
+        - `skip`:
+            - What: A boolean to skip the validation of this parameter entirely.
+            - Type: bool
+            - Default: False
+        """
+        if iterable_sample_pct is not None and not (
+            0 <= iterable_sample_pct <= 100
+        ):
+            raise ValueError(
+                f"`iterable_sample_pct` must be between 0 and 100. Got `{iterable_sample_pct}`."
+            )
+        if iterable_sample_k is not None and (
+            not isinstance(iterable_sample_k, int) or iterable_sample_k < 1
+        ):
+            raise ValueError(
+                f"`iterable_sample_k` must be a positive integer. Got `{iterable_sample_k}`."
+            )
+        if max_depth is not None and (
+            not isinstance(max_depth, int) or max_depth < 0
+        ):
+            raise ValueError(
+                f"`max_depth` must be a non negative integer. Got `{max_depth}`."
+            )
+        self.__skip__ = skip
+        self.__iterable_sample_pct__ = iterable_sample_pct
+        self.__sampler__ = sampler
+        self.__iterable_sample_k__ = iterable_sample_k
+        self.__max_depth__ = max_depth
+
+    def __get_overrides__(self):
+        """
+        Returns a dict of the options set by this policy (by slot name).
+        """
+        overrides = {}
+        for slot in self.__slots__:
+            value = getattr(self, slot)
+            if value is not None and value is not False:
+                overrides[slot] = value
+        return overrides
+
+    def __repr__(self):
+        options = ", ".join(
+            f"{slot.strip('_')}={value!r}"
+            for slot, value in self.__get_overrides__().items()
+        )
+        return f"Policy({options})"
+
+
+def Sample(iterable_sample_pct=None, sampler=None, k=None):
+    """
+    Returns a `Policy` that samples the typed iterables of a parameter.
+
+    Optional:
+
+    - `iterable_sample_pct`:
+        - What: The percentage (0-100) of items to validate.
+        - Type: int | float | None
+        - Default: None (the enforcer's `iterable_sample_pct`)
+    - `sampler`:
+        - What: The strategy used to pick the sampled items (see `Enforcer`).
+        - Type: str | Sampler | None
+        - Default: None (the enforcer's sampler)
+    - `k`:
+        - What: If set, a constant number of items is checked per typed iterable.
+        - Type: int | None
+        - Default: None
+
+    Example Use:
+    ```
+    >>> from typing import Annotated
+    >>> import type_enforced
+    >>> @type_enforced.Enforcer
+    ... def load(config: dict[str, int], rows: Annotated[list[int], type_enforced.Sample(1)]) -> None:
+    ...     pass
+    ```
+    """
+    return Policy(
+        iterable_sample_pct=iterable_sample_pct,
+        sampler=sampler,
+        iterable_sample_k=k,
+    )
+
+
+# A policy that skips the validation of a parameter (e.g. `-> Annotated[list[Row], Skip]`)
+Skip = Policy(skip=True)
@@ -0,0 +1,119 @@
+import sys
+from fnmatch import fnmatchcase
+from weakref import WeakSet
+
+# Every FunctionMethodEnforcer and DataclassEnforcer created by `Enforcer`
+# Note: Each enforcer is kept alive by its wrapped function (`__type_enforced_enforcer__`) or
+# dataclass (`__type_enforced_dataclass__`), so enforcers that are rebound to their original
+# function are not garbage collected
+_enforcers = WeakSet()
+
+
+def _get_name(enforcer):
+    wrapped = getattr(enforcer, "__cls__", None) or enforcer.__fn__
+    return f"{wrapped.__module__}.{wrapped.__qualname__}"
+
+
+def _rebind(enforcer, enabled):
+    """
+    Swaps the enforcer and its wrapped function where the function was defined (a module global
+    or a class attribute) so that disabled enforcers cost nothing.
+
+    This is best effort: functions defined in local scopes are not rebound and references to the
+    enforcer held elsewhere (e.g. `from module import my_fn`) are not updated. Those still bypass
+    all checks since the enforcer itself is disabled.
+
+    Dataclass enforcers swap the methods of their dataclass instead (see
+    `DataclassEnforcer.__rebind__`).
+    """
+    if hasattr(enforcer, "__cls__"):
+        enforcer.__rebind__(enabled)
+        return
+    fn = enforcer.__fn__
+    container = sys.modules.get(fn.__module__)
+    *path, name = fn.__qualname__.split(".")
+    if container is None or "<locals>" in path:
+        return
+    for part in path:
+        container = getattr(container, part, None)
+        if container is None:
+            return
+    old, new = (fn, enforcer) if enabled else (enforcer, fn)
+    current = getattr(container, "__dict__", {}).get(name)
+    if current is old:
+        setattr(container, name, new)
+    elif (
+        isinstance(current, (staticmethod, classmethod))
+        and current.__func__ is old
+    ):
+        setattr(container, name, type(current)(new))
+
+
+def _set_enabled(pattern, enabled):
+    count = 0
+    for enforcer in list(_enforcers):
+        if fnmatchcase(_get_name(enforcer), pattern):
+            if enforcer.__enabled__ != enabled:
+                enforcer.__enabled__ = enabled
+                _rebind(enforcer, enabled)
+            count += 1
+    return count
+
+
+def enable(pattern="*"):
+    """
+    Enables every registered enforcer whose `module.qualname` matches `pattern` at runtime.
+
+    Enabled enforcers are rebound where their functions were defined (see `disable`).
+
+    Optional:
+
+    - `pattern`:
+        - What: A `fnmatch` style pattern matched against `module.qualname` of each wrapped function
+            (e.g. `"my_package.*"` or `"*.MyClass.*"`).
+        - Type: str
+        - Default: "*" (every enforcer)
+
+    Returns the number of matching enforcers.
+    """
+    return _set_enabled(pattern, True)
+
+
+def disable(pattern="*"):
+    """
+    Disables every registered enforcer whose `module.qualname` matches `pattern` at runtime.
+
+    Disabled enforcers call their wrapped function directly. If the function was defined as a
+    module global or a class attribute, the original function is also rebound in its place so
+    that calls through that name have no overhead at all.
+
+    Optional:
+
+    - `pattern`:
+        - What: A `fnmatch` style pattern matched against `module.qualname` of each wrapped function
+            (e.g. `"my_package.*"` or `"*.MyClass.*"`).
+        - Type: str
+        - Default: "*" (every enforcer)
+
+    Returns the number of matching enforcers.
+    """
+    return _set_enabled(pattern, False)
+
+
+def get_enforcers(pattern="*"):
+    """
+    Returns a dict of `module.qualname` to enabled state for every registered enforcer that
+    matches `pattern`.
+
+    Optional:
+
+    - `pattern`:
+        - What: A `fnmatch` style pattern matched against `module.qualname` of each wrapped function
+        - Type: str
+        - Default: "*" (every enforcer)
+    """
+    return {
+        _get_name(enforcer): enforcer.__enabled__
+        for enforcer in list(_enforcers)
+        if fnmatchcase(_get_name(enforcer), pattern)
+    }
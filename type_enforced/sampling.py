@@ -0,0 +1,299 @@
+import random
+from itertools import islice
+
+
+class Sampler:
+    """
+    A base class for the strategies used to pick which items of an iterable are validated
+    when `iterable_sample_pct` is less than 100.
+
+    The number of sampled items is the same for every strategy:
+
+    - If `iterable_sample_pct` is 0, only the first item is sampled.
+    - Sequences (`list`, variable-length `tuple`) always sample the first and last items and at
+        least 3 items in total.
+    - Dicts and sets always sample the first item and at least 1 item in total.
+
+    Subclasses only decide which items are picked by overriding `__sample_indices__` and
+    `__sample_keys__`. By default, items are picked uniformly at random with `__random__`.
+
+    The `node` passed to `__get_indices__` and `__get_keys__` is the parsed item type of the
+    iterable being sampled. It identifies the annotation being validated across calls, but is
+    not used by the percentage based strategies.
+    """
+
+    __slots__ = ()
+    # The random number generator used by the default strategy
+    __random__ = random
+
+    def __get_indices__(self, length, pct, node=None):
+        """
+        Get a sorted iterable of indices to sample from a sequence with `length` items.
+        """
+        if length == 0:
+            return []
+        if pct == 0:
+            return [0]
+        if length <= 3:
+            return range(length)
+        n = max(3, int(length * pct / 100))
+        if n >= length:
+            return range(length)
+        return self.__sample_indices__(length, n)
+
+    def __get_keys__(self, obj, pct, node=None):
+        """
+        Get an iterable of keys (for a dict) or items (for a set) to sample from `obj`.
+        """
+        length = len(obj)
+        if length == 0:
+            return []
+        if pct == 0 or length == 1:
+            return [next(iter(obj))]
+        n = max(1, int(length * pct / 100))
+        if n >= length:
+            return obj
+        return self.__sample_keys__(obj, n)
+
+    def __sample_indices__(self, length, n):
+        """
+        Returns a sorted list of `n` indices (including the first and last index) to sample from a
+        sequence with `length` items (`3 <= n < length`).
+        """
+        middle_sample = self.__random__.sample(range(1, length - 1), n - 2)
+        return sorted([0] + middle_sample + [length - 1])
+
+    def __sample_keys__(self, obj, n):
+        """
+        Returns a list of `n` keys (including the first key) to sample from a dict or set `obj`
+        (`1 <= n < len(obj)`).
+        """
+        keys = list(obj)
+        middle_sample = self.__random__.sample(range(1, len(keys)), n - 1)
+        return [keys[0]] + [keys[idx] for idx in middle_sample]
+
+    def __get_stats__(self):
+        """
+        Returns a dict of sampling statistics (empty for strategies that do not keep any).
+        """
+        return {}
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+
+class RandomSampler(Sampler):
+    """
+    Samples items uniformly at random (the default strategy).
+
+    Pass a `seed` to make the sampled items reproducible (e.g. when debugging a failure that only
+    occurs for some samples).
+
+    Note: Dicts and sets do not support random access, so their keys are copied into a list
+    before sampling. Use `StrideSampler` or `EdgeSampler` to avoid this copy.
+    """
+
+    __slots__ = ("__seed__", "__random__")
+
+    def __init__(self, seed=None):
+        """
+        Initialize a RandomSampler.
+
+        Optional:
+
+        - `seed`:
+            - What: A seed for a private random number generator. If None, the shared `random`
+                module is used.
+            - Type: int | None
+            - Default: None
+        """
+        self.__seed__ = seed
+        self.__random__ = random if seed is None else random.Random(seed)
+
+    def __repr__(self):
+        return f"RandomSampler(seed={self.__seed__!r})"
+
+
+class StrideSampler(Sampler):
+    """
+    Samples evenly spaced items without a random number generator, so the same items are
+    always checked for the same input.
+
+    Dicts and sets are walked with `itertools.islice`, so their keys are never copied.
+    """
+
+    __slots__ = ()
+
+    def __sample_indices__(self, length, n):
+        return [idx * (length - 1) // (n - 1) for idx in range(n)]
+
+    def __sample_keys__(self, obj, n):
+        step = len(obj) // n
+        return list(islice(obj, 0, step * n, step))
+
+
+class EdgeSampler(Sampler):
+    """
+    Samples the items at the start and the end of an iterable.
+
+    This is the cheapest strategy for large dicts and sets as only the sampled keys are visited
+    (dicts are walked from both ends with `reversed`; sets only from the start). The cost only
+    depends on the number of sampled items and not on the size of the iterable.
+
+    Note: Items in the middle of an iterable are never checked, so this is best suited to
+    catching homogeneous errors (e.g. a dict of the wrong value type).
+    """
+
+    __slots__ = ()
+
+    def __sample_indices__(self, length, n):
+        tail = n // 2
+        return [*range(n - tail), *range(length - tail, length)]
+
+    def __sample_keys__(self, obj, n):
+        if isinstance(obj, dict):
+            tail = n // 2
+            return [*islice(obj, n - tail), *islice(reversed(obj), tail)]
+        return list(islice(obj, n))
+
+
+class RotatingSampler(Sampler):
+    """
+    Samples a constant `k` items per iterable regardless of its size (`iterable_sample_pct` is
+    ignored).
+
+    A cursor is kept for each annotation that is sampled. Each time an iterable is validated
+    against that annotation, the `k` items starting at the cursor are checked and the cursor
+    advances by `k`. Repeated calls with iterables of the same size therefore sweep every
+    position once every `ceil(length / k)` calls.
+
+    Sequences are sampled by index, so the cost of a sample only depends on `k`. Dicts and sets
+    have no random access, so their keys are walked with `itertools.islice` up to the cursor
+    position (dicts are walked from the nearer end with `reversed`). Their cost grows with the
+    distance of the cursor from the start (or end) of the iterable, up to half (dicts) or all
+    (sets) of its items.
+
+    The achieved coverage is reported by `__get_stats__` (and `type_enforced.get_stats`):
+
+    - `samples`: The number of iterables sampled
+    - `items_checked`: The total number of items checked
+    - `full_sweeps`: The number of times a cursor has passed over every position of an iterable
+    - `coverage`: The lowest fraction of positions checked so far across all sampled annotations
+        (1.0 once every annotation has completed at least one full sweep of its current length)
+    """
+
+    __slots__ = ("__k__", "__cursors__", "__samples__", "__items_checked__")
+
+    def __init__(self, k=8):
+        """
+        Initialize a RotatingSampler.
+
+        Optional:
+
+        - `k`:
+            - What: The number of items to check per iterable
+            - Type: int
+            - Default: 8
+        """
+        if not isinstance(k, int) or k < 1:
+            raise ValueError(f"`k` must be a positive integer. Got `{k}`.")
+        self.__k__ = k
+        # node id -> [cursor, length, positions checked (capped at length), full sweeps]
+        self.__cursors__ = {}
+        self.__samples__ = 0
+        self.__items_checked__ = 0
+
+    def __advance__(self, length, node):
+        """
+        Returns the start position for the next sample of an iterable with `length` items and
+        advances the cursor for `node`.
+        """
+        state = self.__cursors__.get(id(node))
+        if state is None:
+            state = self.__cursors__[id(node)] = [0, length, 0, 0]
+        elif state[1] != length:
+            # The coverage of a new length starts from scratch
+            state[1], state[2] = length, 0
+        start = state[0] % length
+        n = min(self.__k__, length)
+        state[0] = start + n
+        state[2] = min(length, state[2] + n)
+        if state[0] >= length:
+            state[0] -= length
+            state[3] += 1
+        self.__samples__ += 1
+        self.__items_checked__ += n
+        return start, n
+
+    def __get_indices__(self, length, pct, node=None):
+        if length == 0:
+            return []
+        start, n = self.__advance__(length, node)
+        end = start + n
+        if end <= length:
+            return range(start, end)
+        return [*range(end - length), *range(start, length)]
+
+    def __get_keys__(self, obj, pct, node=None):
+        length = len(obj)
+        if length == 0:
+            return []
+        start, n = self.__advance__(length, node)
+        end = start + n
+        if isinstance(obj, dict) and start > length // 2:
+            # Walk the second half of a dict from the end
+            if end <= length:
+                keys = list(islice(reversed(obj), length - end, length - start))
+                return keys[::-1]
+            tail = list(islice(reversed(obj), length - start))
+            return [*islice(obj, end - length), *tail[::-1]]
+        if end <= length:
+            return list(islice(obj, start, end))
+        return [*islice(obj, end - length), *islice(obj, start, None)]
+
+    def __get_stats__(self):
+        states = self.__cursors__.values()
+        return {
+            "samples": self.__samples__,
+            "items_checked": self.__items_checked__,
+            "full_sweeps": sum(state[3] for state in states),
+            "coverage": min(
+                (state[2] / state[1] for state in states), default=0.0
+            ),
+        }
+
+    def __repr__(self):
+        return f"RotatingSampler(k={self.__k__})"
+
+
+_default_sampler = RandomSampler()
+_samplers = {
+    "random": RandomSampler,
+    "stride": StrideSampler,
+    "edge": EdgeSampler,
+    "rotating": RotatingSampler,
+}
+
+
+def get_sampler(sampler):
+    """
+    Returns a `Sampler` instance given a `Sampler` instance, a strategy name or None.
+
+    Requires:
+
+    - `sampler`:
+        - What: The sampling strategy to use
+        - Type: Sampler | str | None
+        - Note: Valid strategy names are `"random"`, `"stride"`, `"edge"` and `"rotating"`.
+        - Note: None returns the shared (unseeded) `RandomSampler`.
+    """
+    if sampler is None or sampler == "random":
+        return _default_sampler
+    if isinstance(sampler, Sampler):
+        return sampler
+    try:
+        return _samplers[sampler]()
+    except (KeyError, TypeError):
+        raise ValueError(
+            f"Invalid sampler `{sampler}`. Expected a Sampler instance or one of {list(_samplers)}."
+        ) from None
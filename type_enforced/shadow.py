@@ -0,0 +1,97 @@
+from queue import Queue, Full
+from threading import Thread, Lock
+
+
+class ShadowWorker:
+    """
+    A background thread that validates large arguments of enforcers in shadow mode
+    (`Enforcer(shadow=True)`) off the hot path.
+
+    Jobs are put on a bounded queue. If the queue is full, the job is dropped (and counted by the
+    submitting enforcer) instead of blocking the caller. Violations found by the worker are
+    reported as `TypeEnforced Warning` messages (like `strict=False`) since the call that passed
+    the argument has usually already returned.
+
+    - Note: The thread is a daemon thread that is only started when the first job is submitted.
+    """
+
+    __slots__ = ("__queue__", "__thread__", "__lock__")
+
+    def __init__(self, maxsize=1024):
+        """
+        Initialize a ShadowWorker.
+
+        Optional:
+
+        - `maxsize`:
+            - What: The maximum number of queued jobs. Jobs submitted while the queue is full are dropped.
+            - Type: int
+            - Default: 1024
+        """
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError(
+                f"`maxsize` must be a positive integer. Got `{maxsize}`."
+            )
+        self.__queue__ = Queue(maxsize)
+        self.__thread__ = None
+        self.__lock__ = Lock()
+
+    def __start__(self):
+        """
+        Starts the worker thread if it is not already running.
+        """
+        with self.__lock__:
+            if self.__thread__ is None:
+                self.__thread__ = Thread(
+                    target=self.__run__,
+                    name="type_enforced_shadow_worker",
+                    daemon=True,
+                )
+                self.__thread__.start()
+
+    def __run__(self):
+        queue = self.__queue__
+        while True:
+            checker, obj, expected, key = queue.get()
+            try:
+                checker.__check_type__(obj, expected, key)
+            except Exception:
+                # The worker must keep running for other jobs
+                pass
+            finally:
+                queue.task_done()
+
+    def __submit__(self, checker, obj, expected, key):
+        """
+        Queues a validation of `obj` against `expected` with `checker`.
+
+        Returns False if the queue is full and the job was dropped.
+        """
+        if self.__thread__ is None:
+            self.__start__()
+        try:
+            self.__queue__.put_nowait((checker, obj, expected, key))
+            return True
+        except Full:
+            return False
+
+    def wait(self):
+        """
+        Blocks until every queued job has been validated (e.g. in tests or before shutdown).
+        """
+        self.__queue__.join()
+
+
+_default_worker = None
+
+
+def get_worker(shadow):
+    """
+    Returns a `ShadowWorker` given a `ShadowWorker` instance or True (the shared default worker).
+    """
+    global _default_worker
+    if isinstance(shadow, ShadowWorker):
+        return shadow
+    if _default_worker is None:
+        _default_worker = ShadowWorker()
+    return _default_worker
@@ -0,0 +1,150 @@
+from types import MemberDescriptorType
+from type_enforced.enforcer import TypeChecker
+
+
+class Typed:
+    """
+    A descriptor that validates every assignment to a class attribute against a type annotation.
+
+    Values are stored in a slot named `_<attribute_name>` if the owner class (or a base class)
+    declares one in `__slots__`. Otherwise they are stored in the instance `__dict__`.
+
+    - Note: Owner classes whose instances have neither the slot nor a `__dict__` raise a
+        `TypeError` when the class is created.
+
+    Example Use:
+    ```
+    >>> from type_enforced import Typed
+    >>> class Counter:
+    ...     __slots__ = ("_count",)
+    ...     count = Typed[int]
+    ...
+    ...     def __init__(self, count):
+    ...         self.count = count
+    ...
+    >>> counter = Counter(1)
+    >>> counter.count += 1
+    >>> counter.count = "2"
+    Traceback (most recent call last):
+      ...
+    TypeError: TypeEnforced Exception (Counter.count): Type mismatch for typed variable `count`. Expected one of the following `[<class 'int'>]` but got `<class 'str'>` with value `2` instead.
+    ```
+    """
+
+    __slots__ = (
+        "__annotation__",
+        "__strict__",
+        "__name__",
+        "__slot__",
+        "__checker__",
+        "__expected__",
+        "__simple_types__",
+    )
+
+    def __init__(self, annotation, strict=True):
+        """
+        Initialize a Typed descriptor.
+
+        Requires:
+
+        - `annotation`:
+            - What: The type annotation that assigned values must match
+            - Type: Any supported type hint (e.g. `int`, `list[int]`, `dict[str, int | float]`)
+
+        Optional:
+
+        - `strict`:
+            - What: A boolean to enable or disable exceptions. If True, exceptions will be raised
+                when type checking fails. If False, exceptions will not be raised but instead a warning
+                will be printed to the console.
+            - Type: bool
+            - Default: True
+        """
+        self.__annotation__ = annotation
+        self.__strict__ = strict
+        self.__name__ = None
+        self.__slot__ = None
+        self.__checker__ = None
+        self.__expected__ = None
+        self.__simple_types__ = None
+
+    def __class_getitem__(cls, annotation):
+        """
+        Allows `Typed[int]` as a shorthand for `Typed(int)`.
+        """
+        return cls(annotation)
+
+    def __set_name__(self, owner, name):
+        """
+        Stores the attribute name and finds the `_<name>` slot on the owner class if one exists.
+
+        Raises a `TypeError` if the instances of the owner class have neither the slot nor a
+        `__dict__` to store the value in.
+        """
+        self.__name__ = name
+        slot = getattr(owner, f"_{name}", None)
+        if isinstance(slot, MemberDescriptorType):
+            self.__slot__ = slot
+        elif not owner.__dictoffset__:
+            raise TypeError(
+                f"`{owner.__qualname__}.{name}` can not store its value since `{owner.__qualname__}` defines `__slots__` without a `_{name}` slot (or `__dict__`). Add `_{name}` to `__slots__`."
+            )
+        self.__checker__ = TypeChecker(
+            __strict__=self.__strict__,
+            __qualname__=f"{owner.__qualname__}.{name}",
+        )
+
+    def __parse__(self):
+        """
+        Parses the annotation into a checkable type and a tuple of simple types (if possible).
+
+        Note: This is only done once at first assignment to allow for forward references.
+        """
+        if self.__checker__ is None:
+            raise TypeError(
+                "Typed descriptors must be assigned as a class attribute."
+            )
+        self.__expected__ = self.__checker__.__get_checkable_type__(
+            self.__annotation__
+        )
+        self.__simple_types__ = self.__checker__.__get_simple_types__(
+            self.__expected__
+        )
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        if self.__slot__ is not None:
+            return self.__slot__.__get__(instance, owner)
+        try:
+            return instance.__dict__[self.__name__]
+        except KeyError:
+            raise AttributeError(
+                f"'{type(instance).__name__}' object has no attribute '{self.__name__}'"
+            ) from None
+
+    def __set__(self, instance, value):
+        if self.__expected__ is None:
+            self.__parse__()
+        if self.__simple_types__ is None or not isinstance(
+            value, self.__simple_types__
+        ):
+            self.__checker__.__check_type__(
+                value, self.__expected__, self.__name__
+            )
+        if self.__slot__ is not None:
+            self.__slot__.__set__(instance, value)
+        else:
+            instance.__dict__[self.__name__] = value
+
+    def __delete__(self, instance):
+        if self.__slot__ is not None:
+            self.__slot__.__delete__(instance)
+        else:
+            try:
+                del instance.__dict__[self.__name__]
+            except KeyError:
+                raise AttributeError(self.__name__) from None
+
+    def __repr__(self):
+        return f"<type_enforced Typed[{self.__annotation__}] object at {hex(id(self))}>"
@@ -289,21 +289,211 @@ def DeepMerge(original: dict, update: dict):
     return original
 
 
+def has_generic_dict(parsed):
+    """Return True if a parsed type accepts dicts other than its TypedDicts.
+
+    TypedDicts parse to `{dict: None}` with their plans under `"__typeddict__"`. A parsed type with
+    TypedDicts only accepts other dicts if it was merged with a `dict` (or `dict[K, V]`) annotation,
+    in which case `parsed[dict]` holds the `(K, V)` types (or is None for a bare `dict`, which
+    removes the TypedDicts since any dict is valid).
+    """
+    if dict not in parsed:
+        return False
+    return parsed[dict] is not None or "__typeddict__" not in parsed.get(
+        "__extra__", ()
+    )
+
+
 def merge_type_dicts(target, source):
     """Merge source type dict into target in-place.
 
     Like DeepMerge but without copy.deepcopy
-    Safe because both dicts are freshly created during type parsing.
+    Nested dicts and lists are copied before they are merged (instead of being modified in place)
+    since parsed types can be shared (e.g. the parsed types of recursive type aliases).
+
+    TypedDicts merged with a generic `dict` are kept as alternatives (see `has_generic_dict`).
     """
+    generic_dict = None
+    if has_generic_dict(source):
+        generic_dict = (source[dict],)
+    elif has_generic_dict(target):
+        generic_dict = (target[dict],)
     for key, value in source.items():
         if key not in target:
             target[key] = value
         elif isinstance(target[key], dict) and isinstance(value, dict):
-            merge_type_dicts(target[key], value)
+            target[key] = merged = dict(target[key])
+            merge_type_dicts(merged, value)
         elif isinstance(target[key], list) and isinstance(value, list):
-            target[key].extend(value)
+            target[key] = target[key] + value
+        elif key in (tuple, type) and (target[key] is None or value is None):
+            # A bare `tuple` (or `type`) accepts any tuple shape (or class)
+            target[key] = None
+        elif key is tuple:
+            target[key] = merge_tuple_shapes(target[key], value)
         else:
             target[key] = value
+    if generic_dict is not None:
+        target[dict] = generic_dict[0]
+        if target[dict] is None and "__typeddict__" in target.get(
+            "__extra__", ()
+        ):
+            # A bare `dict` accepts any dict (including the TypedDicts)
+            target["__extra__"] = extra = dict(target["__extra__"])
+            del extra["__typeddict__"]
+            if not extra:
+                del target["__extra__"]
+
+
+def merge_tuple_shapes(target, source):
+    """Merge two parsed tuple types into a tuple shape table.
+
+    A parsed tuple type is either a single shape `(args, is_ellipsis)` or a shape table
+    `(shapes, None)` where `shapes` maps each tuple length (or `...` for variable length tuples) to
+    a list of single shape type dicts (`{tuple: (args, is_ellipsis)}`) with that length.
+
+    This allows unions of tuples (e.g. `tuple[int, str] | tuple[str, int]`) to dispatch on the
+    length of a passed tuple and only try the shapes with a matching length.
+
+    A new shape table is always returned so shared parsed types are never modified.
+    """
+    shapes = {}
+    for parsed in (target, source):
+        args, is_ellipsis = parsed
+        if is_ellipsis is None:
+            items = args.items()
+        else:
+            length = ... if is_ellipsis else len(args)
+            items = [(length, [{tuple: parsed}])]
+        for length, alternatives in items:
+            length_shapes = shapes.setdefault(length, [])
+            for alternative in alternatives:
+                if alternative not in length_shapes:
+                    length_shapes.append(alternative)
+    return (shapes, None)
+
+
+def truncate_type_dict(parsed, depth):
+    """Return a copy of a parsed type that only validates the items of containers down to `depth`
+    levels of nesting.
+
+    Containers (and dataclass or NamedTuple fields and TypedDict values) at `depth` are only checked
+    with `isinstance`, e.g. a depth of 1 for `dict[str, list[int]]` validates the keys and values of
+    the dict as `str` and `list` but not the items of each list. A depth of 0 only checks the
+    top level type.
+
+    The parsed type is copied down to `depth` so shared parsed types (e.g. type aliases) are never
+    modified. Recursive types are unrolled down to `depth`.
+    """
+    truncated = {}
+    for key, value in parsed.items():
+        if value is None or key is type:
+            # The classes of `Type[X]` are not nested values
+            truncated[key] = value
+        elif key == "__extra__":
+            if "__typeddict__" in value:
+                value = dict(value)
+                if depth == 0:
+                    del value["__typeddict__"]
+                else:
+                    value["__typeddict__"] = [
+                        (
+                            required_keys,
+                            allowed_keys,
+                            {
+                                field: truncate_type_dict(field_type, depth - 1)
+                                for field, field_type in field_types.items()
+                            },
+                        )
+                        for required_keys, allowed_keys, field_types in value[
+                            "__typeddict__"
+                        ]
+                    ]
+            if value:
+                truncated[key] = value
+        elif depth == 0:
+            truncated[key] = None
+        elif key is tuple:
+            args, is_ellipsis = value
+            if is_ellipsis is None:
+                # A tuple shape table holds one tuple type per shape at the same depth
+                truncated[key] = (
+                    {
+                        length: [
+                            truncate_type_dict(alternative, depth)
+                            for alternative in alternatives
+                        ]
+                        for length, alternatives in args.items()
+                    },
+                    None,
+                )
+            elif is_ellipsis:
+                truncated[key] = (truncate_type_dict(args, depth - 1), True)
+            else:
+                truncated[key] = (
+                    tuple(truncate_type_dict(arg, depth - 1) for arg in args),
+                    False,
+                )
+        elif key is dict:
+            truncated[key] = tuple(
+                truncate_type_dict(arg, depth - 1) for arg in value
+            )
+        elif key in (list, set):
+            truncated[key] = truncate_type_dict(value, depth - 1)
+        else:
+            # The parsed fields of a dataclass or NamedTuple (deep records mode)
+            truncated[key] = {
+                field: truncate_type_dict(field_type, depth - 1)
+                for field, field_type in value.items()
+            }
+    return truncated
+
+
+def get_type_dict_depth(parsed, _active=None):
+    """Return the number of nested levels of a parsed type whose items are validated (see
+    `truncate_type_dict`), e.g. 0 for `int`, 1 for `list[int]` and 2 for `dict[str, list[int]]`.
+
+    Returns `float("inf")` for recursive types (e.g. a recursive type alias).
+    """
+    if _active is None:
+        _active = set()
+    if id(parsed) in _active:
+        return float("inf")
+    _active.add(id(parsed))
+    depth = 0
+    nested = []
+    for key, value in parsed.items():
+        if value is None or key is type:
+            continue
+        if key == "__extra__":
+            for _, _, field_types in value.get("__typeddict__", ()):
+                nested.extend(field_types.values())
+        elif key is tuple:
+            args, is_ellipsis = value
+            if is_ellipsis is None:
+                # Shapes are at the same depth as the tuple itself
+                for alternatives in args.values():
+                    for alternative in alternatives:
+                        depth = max(
+                            depth, get_type_dict_depth(alternative, _active)
+                        )
+            elif is_ellipsis:
+                nested.append(args)
+            else:
+                nested.extend(args)
+        elif key is dict:
+            nested.extend(value)
+        elif key in (list, set):
+            nested.append(value)
+        else:
+            nested.extend(value.values())
+    if nested:
+        depth = max(
+            depth,
+            1 + max(get_type_dict_depth(item, _active) for item in nested),
+        )
+    _active.discard(id(parsed))
+    return depth
 
 
 def WithSubclasses(cls):
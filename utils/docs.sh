@@ -5,7 +5,21 @@ cd /app/
 cp README.md type_enforced/__init__.py
 sed -i '1s/^/\"\"\"\n/' type_enforced/__init__.py
 echo "\"\"\"" >> type_enforced/__init__.py
-echo "from .enforcer import Enforcer, FunctionMethodEnforcer" >> type_enforced/__init__.py
+cat >> type_enforced/__init__.py << EOF
+from .enforcer import (
+    Enforcer,
+    FunctionMethodEnforcer,
+    DataclassEnforcer,
+    check,
+    is_valid,
+    replace,
+    get_stats,
+)
+from .typed import Typed
+from .context import sampling_scope, suppressed
+from .registry import enable, disable, get_enforcers
+from .policy import Policy, Sample, Skip
+EOF
 
 
 # Specify versions for documentation purposes